@@ -0,0 +1,15 @@
+from fastapi import HTTPException, Request
+
+from app.service.scheduler import SupremeCourtScheduler
+
+
+def get_scheduler(request: Request) -> SupremeCourtScheduler:
+    """
+    FastAPI dependency:
+        lifespan 에서 생성한 스케줄러 인스턴스를 가져옵니다.
+    """
+
+    scheduler = getattr(request.app.state, "scheduler", None)
+    if scheduler is None:
+        raise HTTPException(status_code=503, detail="스케줄러가 시작되지 않았습니다.")
+    return scheduler
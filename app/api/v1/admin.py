@@ -0,0 +1,20 @@
+from fastapi import APIRouter, Depends, Query
+
+from app.api.deps import get_scheduler
+from app.service.scheduler import SupremeCourtScheduler
+
+router = APIRouter(prefix="/admin", tags=["Admin"])
+
+
+@router.post("/profile-next-run")
+async def profile_next_run(
+    sample_rate: float = Query(1.0, gt=0, le=1),
+    scheduler: SupremeCourtScheduler = Depends(get_scheduler),
+) -> dict:
+    """
+    다음 스케줄러 실행 1회를 프로파일링합니다.
+    결과 파일 경로와 상위 함수 목록은 /api/v1/runs 의 profile 항목에서 확인할 수 있습니다.
+    """
+
+    scheduler.request_profile(sample_rate=sample_rate)
+    return {"message": "profiling scheduled", "sampleRate": sample_rate}
@@ -0,0 +1,79 @@
+from typing import List
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.deps import get_scheduler
+from app.core.config import settings
+from app.core.session import get_session
+from app.schema.dormancy_schema import DormantCaseResponse
+from app.schema.refresh_schema import (
+    CaseRefreshResponse,
+    SupremCourtHistoryParsedResult,
+    SupremCourtTrialInfoParsedResult,
+)
+from app.service.dormancy import DormancyService
+from app.service.scheduler import SupremeCourtScheduler
+
+router = APIRouter(prefix="/cases", tags=["Cases"])
+
+
+@router.get("/dormant", response_model=List[DormantCaseResponse])
+async def list_dormant_cases(
+    session: AsyncSession = Depends(get_session),
+) -> List[DormantCaseResponse]:
+    """
+    휴면 사건 목록을 조회합니다.
+
+    법원 이력상 판결확정/종국 등으로 끝났고 DORMANCY_IDLE_DAYS 동안 새 이력이 없는 사건입니다.
+    정기 실행에서는 DORMANCY_POLL_DAYS 일에 한 번만 조회하므로 ERP 에서 종결 처리를 검토할 대상입니다.
+    """
+
+    dormant = await DormancyService(session).get_dormant_cases(
+        idle_days=settings.DORMANCY_IDLE_DAYS
+    )
+    return sorted(dormant.values(), key=lambda case: case.last_history_at)
+
+
+@router.post("/{case_id}/refresh", response_model=CaseRefreshResponse)
+async def refresh_case(
+    case_id: int,
+    force: bool = Query(False, description="캐시된 결과를 무시하고 새로 조회"),
+    scheduler: SupremeCourtScheduler = Depends(get_scheduler),
+) -> CaseRefreshResponse:
+    """
+    사건 1건의 나의 사건 정보를 즉시 조회합니다.
+
+    같은 사건을 이미 조회 중이면 그 결과를 같이 받고,
+    몇 분 안에 조회한 결과가 있으면 캡차 서버를 다시 호출하지 않고 캐시된 결과를 돌려줍니다.
+    """
+
+    result, source = await scheduler.refresh_case(case_id, force=force)
+    if result is None:
+        raise HTTPException(
+            status_code=404,
+            detail="사건이 없거나 나의 사건 정보 조회 대상이 아닙니다.",
+        )
+
+    return CaseRefreshResponse(
+        case_id=result.case_id,
+        outcome=result.outcome,
+        message=result.message,
+        source=source,
+        refreshed_at=result.finished_at,
+        history=[
+            SupremCourtHistoryParsedResult(**row._asdict()) for row in result.history
+        ],
+        trial_info=[
+            SupremCourtTrialInfoParsedResult(**row._asdict())
+            for row in result.trial_info
+        ],
+        updated_history=[
+            SupremCourtHistoryParsedResult(**row._asdict())
+            for row in result.updated_history
+        ],
+        updated_trial_info=[
+            SupremCourtTrialInfoParsedResult(**row._asdict())
+            for row in result.updated_trial_info
+        ],
+    )
@@ -0,0 +1,36 @@
+from fastapi import APIRouter, Depends, HTTPException
+
+from app.api.deps import get_scheduler
+from app.schema.refresh_job_schema import RefreshJobCreate, RefreshJobResponse
+from app.service.scheduler import SupremeCourtScheduler
+
+router = APIRouter(prefix="/refresh-jobs", tags=["Cases"])
+
+
+@router.post("", response_model=RefreshJobResponse, status_code=202)
+async def create_refresh_job(
+    request: RefreshJobCreate,
+    scheduler: SupremeCourtScheduler = Depends(get_scheduler),
+) -> RefreshJobResponse:
+    """
+    조건(조직, 사건 ID, 관할법원)에 맞는 사건을 백그라운드에서 일괄 조회합니다.
+    바로 작업 ID 를 돌려주고, 진행 상황은 GET /refresh-jobs/{job_id} 로 확인합니다.
+    """
+
+    job = scheduler.refresh_jobs.create(request)
+    return job.to_response()
+
+
+@router.get("/{job_id}", response_model=RefreshJobResponse)
+async def get_refresh_job(
+    job_id: str,
+    scheduler: SupremeCourtScheduler = Depends(get_scheduler),
+) -> RefreshJobResponse:
+    """
+    일괄 조회 작업 진행 상황을 조회합니다.
+    """
+
+    job = scheduler.refresh_jobs.get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다.")
+    return job.to_response()
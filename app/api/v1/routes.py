@@ -1,5 +1,7 @@
 from fastapi import APIRouter
 
+from app.api.v1 import admin, cases, refresh_jobs, runs
+
 router = APIRouter()
 
 
@@ -11,3 +13,7 @@ async def ping() -> dict:
 # Top-level API router to aggregate sub-routers as the project grows
 api_router = APIRouter()
 api_router.include_router(router)
+api_router.include_router(cases.router)
+api_router.include_router(refresh_jobs.router)
+api_router.include_router(runs.router)
+api_router.include_router(admin.router)
@@ -0,0 +1,65 @@
+import json
+from typing import List
+
+from fastapi import APIRouter, Depends, Query, Request
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.deps import get_scheduler
+from app.core.events import run_events
+from app.core.session import get_session
+from app.schema.run_schema import SchedulerRunResponse
+from app.service.run_history import SchedulerRunService
+from app.service.scheduler import SupremeCourtScheduler
+
+router = APIRouter(prefix="/runs", tags=["Runs"])
+
+
+@router.get("", response_model=List[SchedulerRunResponse])
+async def list_runs(
+    limit: int = Query(20, ge=1, le=200),
+    session: AsyncSession = Depends(get_session),
+) -> List[SchedulerRunResponse]:
+    """
+    최근 스케줄러 실행 목록과 실행별 통계를 조회합니다.
+    """
+
+    return await SchedulerRunService(session).get_recent_runs(limit=limit)
+
+
+@router.get("/current/stream")
+async def stream_current_run(
+    request: Request,
+    scheduler: SupremeCourtScheduler = Depends(get_scheduler),
+) -> StreamingResponse:
+    """
+    실행 중인 스케줄러 작업의 진행 상황을 SSE 로 보냅니다.
+
+    연결 직후 현재 상태(snapshot)를 한 번 보내고, 이후 run_started / case_done / run_finished 이벤트를 보냅니다.
+    이벤트가 없는 동안에는 연결 유지를 위해 15초마다 주석(: keepalive)을 보냅니다.
+    """
+
+    async def event_stream():
+        stats = scheduler.current_stats
+        snapshot = {"running": stats is not None}
+        if stats is not None:
+            snapshot.update(stats.progress())
+        yield _sse("snapshot", snapshot)
+
+        async for message in run_events.subscribe(keepalive=15):
+            if await request.is_disconnected():
+                break
+            if message is None:
+                yield ": keepalive\n\n"
+                continue
+            yield _sse(message["event"], message["data"])
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+def _sse(event: str, data: dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
@@ -0,0 +1,365 @@
+"""
+보관해둔 사건 페이지(html) 일괄 가져오기
+
+새 조직을 등록할 때처럼 사건이 많고 이력이 긴 경우, 미리 받아둔 대법원 나의 사건 정보 html 을
+여러 프로세스로 파싱해서 erp_case_histories / erp_case_trial_info 에 COPY 로 한 번에 넣습니다.
+
+    $ python -m app.backfill pages/                  # 디렉터리(하위 디렉터리 포함 *.html, *.htm)
+    $ python -m app.backfill pages.zip -j 8          # zip / tar(.gz) 파일, 파싱 프로세스 8개
+    $ python -m app.backfill pages.tar.gz --dry-run  # 저장하지 않고(롤백) 건수만 확인
+
+- 파일 이름은 사건 ID 로 시작해야 합니다.(예: 1234.html, 1234_2024가단5678.html) erp_cases 에 없는 사건은 건너뜁니다.
+- 중복 판단은 스케줄러와 같습니다.(ParseCaseService.plan_history_update / plan_trial_info_update)
+  보관한 페이지는 지금 데이터보다 오래된 것이므로 없는 행만 넣습니다. 결과가 다른 기존 행은 수정하지 않고(건수만 보고),
+  사건별 마지막 반영 상태는 사건에 없거나 페이지가 그 뒤로 행을 이어 붙인 경우에만 저장합니다.
+  같은 보관 파일로 다시 실행하면 아무것도 넣지 않습니다.
+- --batch 건의 사건마다 한 트랜잭션으로 COPY 하고 커밋합니다.
+- 알림톡/시스템 알림은 보내지 않고, 파싱 이력(erp_supremecourt_parse_history)도 남기지 않습니다.
+- 같은 사건을 스케줄러가 동시에 조회하면 같은 행이 두 번 들어갈 수 있으므로 정기 실행 시간을 피해서 실행합니다.
+"""
+
+import argparse
+import asyncio
+import logging
+import multiprocessing
+import os
+import re
+import sys
+import tarfile
+import time
+import zipfile
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import AsyncIterator, Iterator, List, NamedTuple, Optional, Tuple
+
+logger = logging.getLogger("app.backfill")
+
+HTML_SUFFIXES = (".html", ".htm")
+# 파싱 프로세스에 한 번에 넘기는 페이지 수
+PARSE_CHUNK_SIZE = 16
+
+_CASE_ID_RE = re.compile(r"\d+")
+
+
+class Page(NamedTuple):
+    name: str
+    case_id: int
+    html: str
+
+
+class ParsedPage(NamedTuple):
+    """
+    사건 페이지 1건의 파싱 결과
+
+    history / trial_info: HistoryRow / TrialInfoRow 목록
+    error: 파싱에 실패하면 오류 메시지
+    """
+
+    name: str
+    case_id: int
+    history: list
+    trial_info: list
+    agency_name: str
+    error: Optional[str] = None
+
+
+class BackfillStats:
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.pages = 0
+        self.bad_names = 0
+        self.parse_failed = 0
+        self.unknown_cases = 0
+        self.invalid_cases = 0
+        self.cases = 0
+        self.history = 0
+        self.trial_info = 0
+        self.stale = 0
+
+    @property
+    def rows(self) -> int:
+        return self.history + self.trial_info
+
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+
+    def report(self) -> str:
+        elapsed = max(self.elapsed(), 1e-9)
+        return (
+            f"페이지 {self.pages}건(파일 이름 오류 {self.bad_names}, 파싱 실패 {self.parse_failed}, "
+            f"사건 없음 {self.unknown_cases}, 날짜 형식 오류 {self.invalid_cases})\n"
+            f"사건 {self.cases}건: 이력 {self.history}건, 기일 {self.trial_info}건 추가, 결과가 다른 기존 행 {self.stale}건(반영 안 함)\n"
+            f"소요 {elapsed:.1f}초, {self.rows / elapsed:.0f} rows/s, {self.pages / elapsed:.1f} pages/s"
+        )
+
+
+def iter_html_files(path: Path) -> Iterator[Tuple[str, bytes]]:
+    """디렉터리/zip/tar 에서 (파일 이름, 내용)을 읽습니다."""
+
+    if path.is_dir():
+        for file in sorted(path.rglob("*")):
+            if file.is_file() and file.suffix.lower() in HTML_SUFFIXES:
+                yield str(file.relative_to(path)), file.read_bytes()
+    elif zipfile.is_zipfile(path):
+        with zipfile.ZipFile(path) as archive:
+            for info in archive.infolist():
+                if not info.is_dir() and info.filename.lower().endswith(HTML_SUFFIXES):
+                    yield info.filename, archive.read(info)
+    elif tarfile.is_tarfile(path):
+        with tarfile.open(path) as archive:
+            for member in archive:
+                if member.isfile() and member.name.lower().endswith(HTML_SUFFIXES):
+                    yield member.name, archive.extractfile(member).read()
+    else:
+        raise ValueError(f"디렉터리나 zip/tar 파일이 아닙니다: {path}")
+
+
+def iter_pages(path: Path, stats: BackfillStats) -> Iterator[Page]:
+    for name, data in iter_html_files(path):
+        stats.pages += 1
+        match = _CASE_ID_RE.match(Path(name).name)
+        if not match:
+            stats.bad_names += 1
+            logger.warning("파일 이름이 사건 ID 로 시작하지 않아 건너뜁니다: %s", name)
+            continue
+        yield Page(name, int(match.group()), data.decode("utf-8", errors="replace"))
+
+
+def _init_parse_worker():
+    # 대법원 사건(기일 표 없음) 등 페이지마다 남는 파서 로그는 ParsedPage.error 로 모아서 보고합니다.
+    logging.disable(logging.ERROR)
+
+
+def _parse_chunk(pages: List[Page]) -> List[ParsedPage]:
+    """파싱 프로세스에서 실행합니다."""
+
+    return asyncio.run(_parse_pages(pages))
+
+
+async def _parse_pages(pages: List[Page]) -> List[ParsedPage]:
+    from app.service.parser import ParseCaseService
+
+    parser = ParseCaseService()
+    parsed = []
+    for page in pages:
+        try:
+            history = await parser.parse_history_from_html(page.html)
+            trial_info = await parser.parse_trial_info_from_html(page.html)
+            agency_name = await parser.parse_agency_name(page.html)
+        except Exception as e:
+            parsed.append(ParsedPage(page.name, page.case_id, [], [], "", str(e)))
+            continue
+        parsed.append(
+            ParsedPage(page.name, page.case_id, history, trial_info, agency_name)
+        )
+    return parsed
+
+
+async def parse_in_parallel(
+    pool: ProcessPoolExecutor, pages: Iterator[Page], jobs: int
+) -> AsyncIterator[ParsedPage]:
+    """
+    페이지를 파싱 프로세스에 나눠 넘기고 읽은 순서대로 결과를 돌려줍니다.
+    프로세스마다 2묶음까지만 미리 넘겨서 파일을 모두 메모리에 올리지 않습니다.
+    """
+
+    loop = asyncio.get_running_loop()
+    pending = deque()
+    chunk: List[Page] = []
+    for page in pages:
+        chunk.append(page)
+        if len(chunk) < PARSE_CHUNK_SIZE:
+            continue
+        pending.append(loop.run_in_executor(pool, _parse_chunk, chunk))
+        chunk = []
+        if len(pending) >= jobs * 2:
+            for parsed in await pending.popleft():
+                yield parsed
+    if chunk:
+        pending.append(loop.run_in_executor(pool, _parse_chunk, chunk))
+    while pending:
+        for parsed in await pending.popleft():
+            yield parsed
+
+
+class BackfillLoader:
+    """
+    파싱 결과를 사건 묶음 단위로 반영합니다.
+    새 행은 모아서 COPY 로 넣고, 마지막 반영 상태 저장은 같은 트랜잭션에서 실행합니다.
+    """
+
+    def __init__(self, session, stats: BackfillStats, dry_run: bool = False):
+        from app.service.mycase import MyCaseService
+        from app.service.parser import ParseCaseService
+        from app.service.snapshot import CaseSnapshotService
+
+        self.session = session
+        self.stats = stats
+        self.dry_run = dry_run
+        self.parser = ParseCaseService(session, autocommit=False)
+        self.repo = MyCaseService(session)
+        self.snapshots = CaseSnapshotService(session)
+        self._history: List[Tuple] = []
+        self._trial_info: List[Tuple] = []
+
+    async def load(self, batch: List[ParsedPage]):
+        jurisdictions = await self.repo.get_case_jurisdictions(
+            {page.case_id for page in batch}
+        )
+        seen = set()
+        for page in batch:
+            if page.case_id not in jurisdictions:
+                self.stats.unknown_cases += 1
+                logger.warning("erp_cases 에 없는 사건이라 건너뜁니다: %s", page.name)
+                continue
+            if page.case_id in seen:
+                # 같은 사건 페이지가 또 있으면 앞 페이지의 새 행을 먼저 넣어야 중복으로 보지 않습니다.
+                await self._copy()
+            seen.add(page.case_id)
+            await self._plan_case(page, jurisdictions[page.case_id])
+
+        await self._copy()
+        if self.dry_run:
+            await self.session.rollback()
+        else:
+            await self.session.commit()
+
+    async def _plan_case(self, page: ParsedPage, jurisdiction: Optional[str]):
+        from app.core.court import normalize_court_name
+
+        case_id = page.case_id
+        snapshot = await self.snapshots.get_snapshot(case_id)
+        history_plan = await self.parser.plan_history_update(
+            case_id, page.history, snapshot
+        )
+        trial_plan = await self.parser.plan_trial_info_update(
+            case_id, page.trial_info, snapshot
+        )
+
+        # 스케줄러와 같이 사건의 관할법원(법원 목록의 이름)을 기일 기관명으로 쓰고, 없으면 페이지에서 읽은 기관명을 씁니다.
+        agency_name = normalize_court_name(jurisdiction) or jurisdiction or page.agency_name
+        try:
+            history = [
+                (case_id, self.parser.history_created_at(row, idx), row.content, row.result)
+                for idx, row in enumerate(history_plan.inserts)
+            ]
+            trial_info = [
+                (
+                    case_id,
+                    self.parser.trial_datetime(row),
+                    agency_name,
+                    row.location,
+                    row.result,
+                    row.type,
+                )
+                for row in trial_plan.inserts
+            ]
+        except ValueError as e:
+            self.stats.invalid_cases += 1
+            logger.warning("날짜 형식이 맞지 않아 건너뜁니다: %s, 오류: %s", page.name, str(e))
+            return
+
+        # 결과가 다른 기존 행은 법원에서 나중에 채운 값일 수 있으므로 보관한 페이지 값으로 되돌리지 않습니다.
+        # 마지막 반영 상태는 사건에 없을 때와 페이지가 그 뒤로 행을 이어 붙였을 때만 저장합니다.
+        # (앞부분이 다른 오래된 페이지로 덮으면 다음 정기 조회가 매번 기존 테이블 전체와 비교합니다.)
+        if history_plan.save_snapshot and (
+            snapshot.history_count is None or history_plan.snapshot_matched
+        ):
+            await self.snapshots.save_history(case_id, page.history)
+        if trial_plan.save_snapshot and (
+            snapshot.trial_count is None or trial_plan.snapshot_matched
+        ):
+            await self.snapshots.save_trial_info(case_id, page.trial_info)
+
+        self._history.extend(history)
+        self._trial_info.extend(trial_info)
+        self.stats.cases += 1
+        self.stats.stale += len(history_plan.updates) + len(trial_plan.updates)
+
+    async def _copy(self):
+        history, self._history = self._history, []
+        trial_info, self._trial_info = self._trial_info, []
+        self.stats.history += await self.repo.copy_case_histories_from_supremCourt_history(
+            history
+        )
+        self.stats.trial_info += await self.repo.copy_trial_info_from_supremCourt_history(
+            trial_info
+        )
+
+
+async def backfill(
+    path: Path, jobs: int, batch_size: int, dry_run: bool = False
+) -> BackfillStats:
+    from app.core.session import AsyncSessionLocal, engine
+
+    stats = BackfillStats()
+    pool = ProcessPoolExecutor(
+        max_workers=jobs,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_parse_worker,
+    )
+    try:
+        async with AsyncSessionLocal() as session:
+            loader = BackfillLoader(session, stats, dry_run=dry_run)
+            batch: List[ParsedPage] = []
+            async for parsed in parse_in_parallel(pool, iter_pages(path, stats), jobs):
+                if parsed.error:
+                    stats.parse_failed += 1
+                    logger.warning("파싱하지 못했습니다: %s, 오류: %s", parsed.name, parsed.error)
+                    continue
+                batch.append(parsed)
+                if len(batch) >= batch_size:
+                    await loader.load(batch)
+                    batch = []
+                    logger.info(
+                        "사건 %d건 반영, %d rows (%.0f rows/s)",
+                        stats.cases,
+                        stats.rows,
+                        stats.rows / max(stats.elapsed(), 1e-9),
+                    )
+            if batch:
+                await loader.load(batch)
+    finally:
+        pool.shutdown(cancel_futures=True)
+        await engine.dispose()
+    return stats
+
+
+def main(argv: List[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(
+        prog="python -m app.backfill",
+        description="보관해둔 대법원 사건 페이지(html) 일괄 가져오기",
+    )
+    ap.add_argument("path", type=Path, help="html 디렉터리 또는 zip/tar 파일")
+    ap.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="파싱 프로세스 수(기본 CPU 수)",
+    )
+    ap.add_argument(
+        "--batch", type=int, default=200, help="한 트랜잭션으로 반영할 사건 수(기본 200)"
+    )
+    ap.add_argument(
+        "--dry-run", action="store_true", help="반영하지 않고(롤백) 건수만 확인"
+    )
+    args = ap.parse_args(argv)
+
+    from app.core.logging_config import setup_logging, stop_logging
+
+    setup_logging()
+    try:
+        stats = asyncio.run(
+            backfill(args.path, max(args.jobs, 1), max(args.batch, 1), args.dry_run)
+        )
+    finally:
+        stop_logging()
+
+    print(("[dry-run] " if args.dry_run else "") + stats.report())
+    return 1 if stats.parse_failed or stats.unknown_cases or stats.invalid_cases else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -12,11 +12,78 @@ class Settings(BaseSettings):
     DB_HOST: str = "localhost"
     DATABASE: str = "scourt"
 
+    # DB 커넥션 풀(사건 동시 조회 수 + 일괄 조회/알림 생성보다 넉넉하게)
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT_SECONDS: float = 30
+    DB_POOL_RECYCLE_SECONDS: int = 1800  # -1 이면 재생성하지 않음
+    DB_POOL_PRE_PING: bool = True  # 풀에서 꺼낼 때마다 연결 확인(SELECT 1)
+    # 커넥션별 prepared statement 캐시 크기. pgbouncer(transaction 모드)를 거치면 0 으로 설정합니다.
+    DB_STATEMENT_CACHE_SIZE: int = 100
+
     KAKAO_NOTI_API_URL: str
     KAKAO_NOTI_SECRET_KEY: str
     KAKAO_NOTI_APP_KEY: str
     KAKAO_NOTI_SENDER_KEY: str
 
+    # 로깅
+    LOG_LEVEL: str = "INFO"
+    LOG_FORMAT: str = "text"  # text | json
+    LOG_FILE: str = "scheduler.log"
+
+    # 프로파일링(평소에는 끄고, 필요할 때 켜거나 관리자 API 로 다음 실행만 켭니다)
+    PROFILE_RUNS: bool = False
+    PROFILE_CASE_SAMPLE_RATE: float = 1.0  # 1 이면 실행 전체, 1 미만이면 사건 샘플링
+    PROFILE_DIR: str = "profiles"
+    PROFILE_TOP_N: int = 20
+
+    # 사건 즉시 조회(API) 결과 캐시 시간(초)
+    REFRESH_CACHE_TTL_SECONDS: int = 300
+    # 일괄 조회 작업 기본 동시 조회 수
+    REFRESH_JOB_CONCURRENCY: int = 4
+
+    # 사건 생성/변경 알림(LISTEN/NOTIFY)으로 바로 조회
+    CASE_LISTENER_ENABLED: bool = True
+    CASE_LISTENER_DEBOUNCE_SECONDS: float = 5.0
+    CASE_LISTENER_RATE_PER_MINUTE: int = 30
+    CASE_LISTENER_CONCURRENCY: int = 2
+
+    # 영구 실패(사건 없음, 당사자명 불일치 등) 사건 재조회 간격(일). 실패할 때마다 2배씩 늘어납니다.
+    PARSE_FAILURE_BACKOFF_DAYS: int = 1
+    PARSE_FAILURE_BACKOFF_MAX_DAYS: int = 30
+
+    # 휴면 사건(판결확정/종국 등 이후 법원 이력 변화 없음)은 DORMANCY_POLL_DAYS 일에 한 번만 조회합니다.
+    DORMANCY_IDLE_DAYS: int = 60
+    DORMANCY_POLL_DAYS: int = 7
+
+    # 실행 시간대("HH:MM-HH:MM" 쉼표 구분). 비어 있으면 매일 10시에 한 번에 실행합니다.
+    # 지정하면 시간대마다 한 번씩, 기일이 가까운 사건부터 종료 시각까지 고르게 나눠서 조회합니다.
+    RUN_WINDOWS: str = ""
+
+    # 관할법원 별칭("별칭:법원명" 쉼표 구분). 법원 목록(app.core.court)에서 찾지 못하는 관할법원명을 바로잡을 때
+    COURT_ALIASES: str = ""
+
+    # 조직(firm_id)별 공정 조회. "firm_id:값" 쉼표 구분(조직 없음은 none)
+    FAIR_FIRM_WEIGHTS: str = ""  # 가중치(기본 1). 클수록 같은 시간에 더 많이 조회
+    FAIR_FIRM_TIERS: str = ""  # 우선순위 단계(기본 1). 작을수록 먼저 조회
+    FAIR_FIRM_QUOTAS: str = ""  # 실행당 최대 조회 사건 수
+    FAIR_DEFAULT_QUOTA: int = 0  # 조직별 기본 최대 조회 사건 수(0 이면 제한 없음)
+
+    # 파싱 이력(erp_supremecourt_parse_history)은 모아서 기록합니다.
+    # BATCH_SIZE 건이 쌓이거나 FLUSH_SECONDS 가 지나면 기록하고, 종료 시 남은 이력을 모두 기록합니다.
+    PARSE_HISTORY_BATCH_SIZE: int = 200
+    PARSE_HISTORY_FLUSH_SECONDS: float = 5.0
+    # 기록에 계속 실패할 때 버퍼에 남겨둘 최대 건수(넘으면 오래된 이력부터 버림)
+    PARSE_HISTORY_MAX_BUFFER: int = 10000
+
+    # 정기 실행을 나눠서 조회할 프로세스 수. 2 이상이면 사건 ID 기준으로 나눠서 하위 프로세스에서 조회합니다.
+    WORKER_PROCESSES: int = 1
+
+    # 종료 시 진행 중인 사건/알림을 기다리는 최대 시간(초). systemd TimeoutStopSec 보다 짧아야 합니다.
+    SHUTDOWN_GRACE_SECONDS: float = 60
+    # 중단된 실행을 다음 시작 시 이어서 조회하는 기한(시간)
+    CHECKPOINT_MAX_AGE_HOURS: int = 12
+
     @property
     def DATABASE_URL(self):
         return (
@@ -0,0 +1,180 @@
+"""
+관할법원명 정규화
+
+ERP 의 관할법원(erp_cases.jurisdiction)은 직접 입력한 값이라 띄어쓰기/약칭/오타가 섞여 있습니다.
+("서울중앙지법", "서울중앙지방법원 ", "수원지법 성남지원" 등)
+캡차 서버에 그대로 넘기면 캡차를 푼 뒤에야 실패하므로, 조회 전에 법원 목록(COURTS)의 이름으로 바꾸고
+목록에서 찾지 못한 사건은 조회하지 않습니다.
+
+- 비교 키: 공백/구두점을 지우고 약칭(지법, 고법, 가정법, 행법)을 풀어 쓴 값
+- 지원 이름만 입력한 경우(예: "고양지원")는 한 법원에만 있는 지원일 때만 찾습니다.
+- COURT_ALIASES("별칭:법원명" 쉼표 구분)로 별칭을 추가합니다. 법원명이 목록에 없으면 새 법원으로 추가합니다.
+"""
+
+import re
+import unicodedata
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from app.core.config import settings
+
+# (본원, 지원 목록)
+_COURT_TREE: List[Tuple[str, Tuple[str, ...]]] = [
+    ("대법원", ()),
+    ("서울고등법원", ()),
+    ("대전고등법원", ()),
+    ("대구고등법원", ()),
+    ("부산고등법원", ()),
+    ("광주고등법원", ()),
+    ("수원고등법원", ()),
+    ("특허법원", ()),
+    ("서울중앙지방법원", ()),
+    ("서울동부지방법원", ()),
+    ("서울남부지방법원", ()),
+    ("서울북부지방법원", ()),
+    ("서울서부지방법원", ()),
+    ("서울가정법원", ()),
+    ("서울행정법원", ()),
+    ("서울회생법원", ()),
+    ("의정부지방법원", ("고양지원", "남양주지원")),
+    ("인천지방법원", ("부천지원",)),
+    ("인천가정법원", ("부천지원",)),
+    ("수원지방법원", ("성남지원", "여주지원", "평택지원", "안산지원", "안양지원")),
+    ("수원가정법원", ("성남지원", "여주지원", "평택지원", "안산지원", "안양지원")),
+    ("수원회생법원", ()),
+    ("춘천지방법원", ("강릉지원", "원주지원", "속초지원", "영월지원")),
+    ("대전지방법원", ("홍성지원", "논산지원", "천안지원", "공주지원", "서산지원")),
+    ("대전가정법원", ("홍성지원", "논산지원", "천안지원", "공주지원", "서산지원")),
+    ("청주지방법원", ("충주지원", "제천지원", "영동지원")),
+    (
+        "대구지방법원",
+        (
+            "서부지원",
+            "안동지원",
+            "경주지원",
+            "김천지원",
+            "상주지원",
+            "의성지원",
+            "영덕지원",
+            "포항지원",
+        ),
+    ),
+    (
+        "대구가정법원",
+        ("안동지원", "경주지원", "김천지원", "상주지원", "의성지원", "영덕지원", "포항지원"),
+    ),
+    ("부산지방법원", ("동부지원", "서부지원")),
+    ("부산가정법원", ()),
+    ("부산회생법원", ()),
+    ("울산지방법원", ()),
+    ("울산가정법원", ()),
+    ("창원지방법원", ("마산지원", "진주지원", "통영지원", "밀양지원", "거창지원")),
+    ("광주지방법원", ("목포지원", "장흥지원", "순천지원", "해남지원")),
+    ("광주가정법원", ("목포지원", "장흥지원", "순천지원", "해남지원")),
+    ("전주지방법원", ("군산지원", "정읍지원", "남원지원")),
+    ("제주지방법원", ()),
+]
+
+# 캡차 서버에 넘기는 법원명(본원, "본원 지원")
+COURTS: List[str] = [
+    name
+    for court, branches in _COURT_TREE
+    for name in (court, *(f"{court} {branch}" for branch in branches))
+]
+
+# 목록의 법원명으로 바뀌는 옛 이름 등
+ALIASES: Dict[str, str] = {
+    "서울지방법원": "서울중앙지방법원",
+    "중앙지방법원": "서울중앙지방법원",
+}
+
+# 약칭 -> 풀어 쓴 이름(비교 키에 적용)
+_ABBREVIATIONS = (
+    ("지법원", "지방법원"),
+    ("지법", "지방법원"),
+    ("고법원", "고등법원"),
+    ("고법", "고등법원"),
+    ("가정법", "가정법원"),
+    ("가법", "가정법원"),
+    ("행법", "행정법원"),
+)
+_IGNORED = re.compile(r"[\s.,·()\[\]\-_/]+")
+
+
+def court_key(name: str) -> str:
+    """법원명 비교 키. 공백/구두점을 지우고 약칭을 풀어 씁니다."""
+
+    key = _IGNORED.sub("", unicodedata.normalize("NFKC", name))
+    for short, full in _ABBREVIATIONS:
+        if short in key and full not in key:
+            key = key.replace(short, full)
+    if key.endswith("본원"):
+        key = key[: -len("본원")]
+    return key
+
+
+def parse_court_aliases(value: str) -> Dict[str, str]:
+    """COURT_ALIASES("별칭:법원명,...") 설정값을 dict 로 바꿉니다."""
+
+    aliases: Dict[str, str] = {}
+    for part in value.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        try:
+            alias, court = part.split(":")
+        except ValueError:
+            raise ValueError(f"COURT_ALIASES 형식이 잘못되었습니다.(별칭:법원명): {part}")
+        if not alias.strip() or not court.strip():
+            raise ValueError(f"COURT_ALIASES 형식이 잘못되었습니다.(별칭:법원명): {part}")
+        aliases[alias.strip()] = court.strip()
+    return aliases
+
+
+class CourtIndex:
+    """법원명 비교 키 -> 법원 목록의 이름"""
+
+    def __init__(
+        self,
+        courts: Iterable[str] = COURTS,
+        aliases: Optional[Dict[str, str]] = None,
+    ):
+        self.courts = list(courts)
+        self._index: Dict[str, str] = {court_key(name): name for name in self.courts}
+
+        # 지원 이름만 입력한 경우. 두 법원 이상에 있는 지원(예: 성남지원)은 찾지 않습니다.
+        branches: Dict[str, List[str]] = {}
+        for name in self.courts:
+            if " " in name:
+                branches.setdefault(court_key(name.split(" ", 1)[1]), []).append(name)
+        for key, names in branches.items():
+            if len(names) == 1:
+                self._index.setdefault(key, names[0])
+
+        for alias, court in {**ALIASES, **(aliases or {})}.items():
+            canonical = self._index.get(court_key(court))
+            if canonical is None:
+                # 목록에 없는 법원명이면 새 법원으로 추가(설정으로 법원명을 바로잡을 때)
+                canonical = court
+                self.courts.append(court)
+                self._index[court_key(court)] = court
+            self._index[court_key(alias)] = canonical
+
+    def lookup(self, name: Optional[str]) -> Optional[str]:
+        """법원 목록의 이름을 돌려줍니다. 찾지 못하면 None"""
+
+        if not name:
+            return None
+        return self._index.get(court_key(name))
+
+
+@lru_cache
+def get_court_index() -> CourtIndex:
+    return CourtIndex(aliases=parse_court_aliases(settings.COURT_ALIASES))
+
+
+@lru_cache(maxsize=4096)
+def normalize_court_name(name: Optional[str]) -> Optional[str]:
+    """ERP 관할법원명을 법원 목록의 이름으로 바꿉니다. 찾지 못하면 None"""
+
+    return get_court_index().lookup(name)
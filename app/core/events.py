@@ -0,0 +1,56 @@
+"""
+프로세스 내부 pub/sub
+
+스케줄러 실행 진행 상황을 SSE(/api/v1/runs/current/stream)로 내보내기 위해 사용합니다.
+publish() 는 구독자 큐에 넣기만 하고 기다리지 않으므로 구독자가 늘어나거나 느려도 _runner 가 느려지지 않습니다.
+구독자 큐가 가득 차면 가장 오래된 이벤트를 버립니다.
+"""
+
+import asyncio
+from typing import Any, AsyncIterator, Dict, Optional, Set
+
+
+class EventBroker:
+    def __init__(self, max_queue_size: int = 100):
+        self.max_queue_size = max_queue_size
+        self._subscribers: Set[asyncio.Queue] = set()
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    def publish(self, event: str, data: Dict[str, Any]) -> None:
+        if not self._subscribers:
+            return
+
+        message = {"event": event, "data": data}
+        for queue in self._subscribers:
+            if queue.full():
+                try:
+                    queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    pass
+            queue.put_nowait(message)
+
+    async def subscribe(
+        self, keepalive: Optional[float] = None
+    ) -> AsyncIterator[Optional[Dict[str, Any]]]:
+        """
+        이벤트를 하나씩 돌려줍니다.
+        keepalive 초 동안 이벤트가 없으면 None 을 돌려주므로 연결 유지용 주석을 보낼 때 사용합니다.
+        """
+
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.max_queue_size)
+        self._subscribers.add(queue)
+        try:
+            while True:
+                try:
+                    yield await asyncio.wait_for(queue.get(), timeout=keepalive)
+                except asyncio.TimeoutError:
+                    yield None
+        finally:
+            self._subscribers.discard(queue)
+
+
+# 스케줄러 실행 진행 상황 이벤트
+run_events = EventBroker()
@@ -0,0 +1,143 @@
+"""
+로깅 설정
+
+사건 처리 루프에서 남기는 로그가 이벤트 루프 스레드에서 파일 I/O(자정 로테이션 포함)를 하지 않도록
+root logger 에는 QueueHandler 만 붙이고, 실제 파일/콘솔 출력은 QueueListener 스레드에서 처리합니다.
+
+- 레코드 포맷팅(메시지 인자 치환 포함)도 리스너 스레드에서 합니다.
+- LOG_FORMAT=json 이면 case_id/run_id 를 포함한 한 줄 json 으로 남깁니다.
+- 종료 시 stop_logging() 으로 큐에 남은 로그를 모두 내보내야 합니다.
+"""
+
+import json
+import logging
+import queue
+from contextvars import ContextVar
+from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener, TimedRotatingFileHandler
+from typing import List, Optional
+
+from app.core.config import settings
+
+# 로그에 같이 남길 작업 컨텍스트. 스케줄러에서 실행/사건 단위로 설정합니다.
+run_id_var: ContextVar[Optional[int]] = ContextVar("run_id", default=None)
+case_id_var: ContextVar[Optional[int]] = ContextVar("case_id", default=None)
+
+TEXT_FORMAT = "%(asctime)s %(levelname)s [%(name)s] %(message)s"
+DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+_listener: Optional[QueueListener] = None
+_handlers: List[logging.Handler] = []
+
+
+class ContextFilter(logging.Filter):
+    """
+    로그를 남기는 쪽(이벤트 루프 스레드)에서 컨텍스트 값을 레코드에 옮겨 담습니다.
+    리스너 스레드에서는 contextvar 값을 읽을 수 없으므로 QueueHandler 에 붙여야 합니다.
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.run_id = run_id_var.get()
+        record.case_id = case_id_var.get()
+        return True
+
+
+class LazyQueueHandler(QueueHandler):
+    """
+    기본 QueueHandler.prepare() 는 큐에 넣기 전에 메시지를 포맷팅합니다.
+    같은 프로세스 안의 스레드로 넘기는 것이므로 레코드를 그대로 넘기고
+    포맷팅은 리스너 스레드의 핸들러에 맡깁니다.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+class JsonFormatter(logging.Formatter):
+    """한 줄 json 포맷"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "ts": datetime.fromtimestamp(record.created).isoformat(
+                timespec="milliseconds"
+            ),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        run_id = getattr(record, "run_id", None)
+        if run_id is not None:
+            payload["run_id"] = run_id
+        case_id = getattr(record, "case_id", None)
+        if case_id is not None:
+            payload["case_id"] = case_id
+        if record.exc_info:
+            payload["exc_info"] = self.formatException(record.exc_info)
+
+        return json.dumps(payload, ensure_ascii=False)
+
+
+def setup_logging() -> None:
+    """
+    root logger 를 큐 기반으로 설정하고 리스너 스레드를 시작합니다.
+    여러 번 호출해도 한 번만 설정됩니다.
+    """
+
+    global _listener, _handlers
+
+    if _listener is not None:
+        return
+
+    if settings.LOG_FORMAT == "json":
+        formatter: logging.Formatter = JsonFormatter()
+    else:
+        formatter = logging.Formatter(TEXT_FORMAT, datefmt=DATE_FORMAT)
+
+    file_handler = TimedRotatingFileHandler(
+        settings.LOG_FILE,
+        when="midnight",
+        interval=1,
+        backupCount=7,
+        encoding="utf-8",
+    )
+    stream_handler = logging.StreamHandler()
+    _handlers = [file_handler, stream_handler]
+    for handler in _handlers:
+        handler.setFormatter(formatter)
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    queue_handler = LazyQueueHandler(log_queue)
+    queue_handler.addFilter(ContextFilter())
+
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+    root.addHandler(queue_handler)
+    root.setLevel(settings.LOG_LEVEL)
+
+    _listener = QueueListener(log_queue, *_handlers, respect_handler_level=True)
+    _listener.start()
+
+
+def stop_logging() -> None:
+    """
+    큐에 남은 로그를 모두 내보내고 리스너 스레드를 종료합니다.
+    종료 이후에 남는 로그(uvicorn 종료 로그 등)가 사라지지 않도록 핸들러를 root 에 직접 붙입니다.
+    """
+
+    global _listener
+
+    if _listener is None:
+        return
+
+    _listener.stop()
+    _listener = None
+
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        if isinstance(handler, QueueHandler):
+            root.removeHandler(handler)
+    for handler in _handlers:
+        handler.flush()
+        handler.addFilter(ContextFilter())
+        root.addHandler(handler)
@@ -0,0 +1,375 @@
+"""
+스케줄러 동작을 prometheus 형식으로 노출하기 위한 지표 정의
+
+지표는 모듈 전역으로 한 번만 생성하고, 각 서비스에서 import 해서 사용합니다.
+/metrics 라우트(app/main.py)에서 generate_latest() 로 내보냅니다.
+"""
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterator, List, Optional
+
+from prometheus_client import Counter, Gauge, Histogram
+from sqlalchemy.pool import Pool
+
+# 캡차 서버 응답은 수 초 ~ 수십 초까지 걸리므로 버킷을 넓게 잡습니다.
+_STAGE_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    20.0,
+    30.0,
+    60.0,
+)
+
+# 단계(stage) 이름. 라벨 값이 늘어나지 않도록 여기 정의된 것만 사용합니다.
+STAGE_CAPTCHA_FETCH = "captcha_fetch"
+STAGE_PARSE_HISTORY = "parse_history"
+STAGE_PARSE_TRIAL = "parse_trial"
+STAGE_DB_DIFF = "db_diff"
+STAGE_DB_INSERT = "db_insert"
+STAGE_DB_COMMIT = "db_commit"
+STAGE_PARSE_LOG = "parse_log"
+STAGE_ALIMTALK = "alimtalk"
+STAGE_SYSTEM_NOTIFICATION = "system_notification"
+
+RUN_SECONDS = Histogram(
+    "scourt_run_seconds",
+    "스케줄러 1회 실행(_runner) 소요 시간",
+    buckets=(10, 30, 60, 120, 300, 600, 1200, 1800, 3600, 7200, 14400),
+)
+RUN_IN_PROGRESS = Gauge("scourt_run_in_progress", "실행 중인 스케줄러 작업 수")
+RUN_LAST_FINISHED = Gauge(
+    "scourt_run_last_finished_timestamp_seconds", "마지막 스케줄러 실행 종료 시각"
+)
+
+STAGE_SECONDS = Histogram(
+    "scourt_stage_seconds",
+    "사건 처리 단계별 소요 시간",
+    ["stage"],
+    buckets=_STAGE_BUCKETS,
+)
+STAGE_FAILURES = Counter(
+    "scourt_stage_failures_total", "사건 처리 단계별 실패 수", ["stage"]
+)
+
+CASES_PROCESSED = Counter(
+    "scourt_cases_processed_total",
+    "처리한 사건 수(success/skipped/failed)",
+    ["outcome"],
+)
+CASES_FAILED = Counter(
+    "scourt_cases_failed_total", "실패한 사건 수(실패한 단계 기준)", ["reason"]
+)
+NEW_ROWS = Counter(
+    "scourt_new_rows_total", "새로 추가된 법원 사건 정보 행 수", ["kind"]
+)
+UPDATED_ROWS = Counter(
+    "scourt_updated_rows_total",
+    "결과(변론기일은 장소 포함)가 바뀌어 기존 행을 수정한 법원 사건 정보 행 수",
+    ["kind"],
+)
+SNAPSHOT_LOOKUPS = Counter(
+    "scourt_snapshot_lookups_total",
+    "사건별 마지막 반영 상태로 새 행을 고른 결과(hit: 요약으로 비교, miss/mismatch: 기존 테이블과 전체 비교)",
+    ["kind", "result"],
+)
+PARSE_HISTORY_ROWS = Counter(
+    "scourt_parse_history_rows_total",
+    "버퍼에 모아서 기록한 파싱 이력 행 수(written: 기록, retried: 기록 실패 후 다시 버퍼에, dropped: 버퍼 초과로 버림)",
+    ["result"],
+)
+PARSE_HISTORY_BUFFERED = Gauge(
+    "scourt_parse_history_buffered", "기록을 기다리는 파싱 이력 행 수"
+)
+UNKNOWN_COURT_CASES = Counter(
+    "scourt_unknown_court_cases_total",
+    "관할법원명을 법원 목록에서 찾지 못해 조회하지 않은 사건 수",
+)
+RUN_DEADLINE_MISSED = Counter(
+    "scourt_run_deadline_missed_total", "실행 시간대 종료 시각까지 끝내지 못한 실행 수"
+)
+CASES_AFTER_DEADLINE = Counter(
+    "scourt_cases_after_deadline_total", "실행 시간대 종료 시각이 지난 뒤 조회한 사건 수"
+)
+RUN_DEADLINE_SLACK_SECONDS = Gauge(
+    "scourt_run_deadline_slack_seconds",
+    "마지막 실행의 종료 시각 여유(음수면 초과한 시간)",
+)
+FIRM_CASES = Counter(
+    "scourt_firm_cases_total",
+    "조직별 정기 실행 처리 사건 수(success/skipped/failed)",
+    ["firm_id", "outcome"],
+)
+FIRM_CASE_WAIT_SECONDS = Histogram(
+    "scourt_firm_case_wait_seconds",
+    "실행 시작부터 사건 조회를 시작하기까지 걸린 시간(조직별)",
+    ["firm_id"],
+    buckets=(10, 60, 300, 600, 1200, 1800, 3600, 7200, 14400),
+)
+DORMANT_CASES = Gauge(
+    "scourt_dormant_cases", "휴면으로 분류되어 조회 주기를 늘린 사건 수(마지막 실행 기준)"
+)
+
+ALIMTALK_SECONDS = Histogram(
+    "scourt_alimtalk_request_seconds",
+    "알림톡 발송 API 호출 소요 시간",
+    ["template_code"],
+    buckets=_STAGE_BUCKETS,
+)
+ALIMTALK_MESSAGES = Counter(
+    "scourt_alimtalk_messages_total",
+    "알림톡 발송 결과(sent/rejected/invalid/error)",
+    ["template_code", "result"],
+)
+
+DB_POOL_CHECKOUT_SECONDS = Histogram(
+    "scourt_db_pool_checkout_seconds",
+    "DB 커넥션 풀에서 커넥션을 얻기까지 대기한 시간",
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0),
+)
+DB_POOL_CHECKED_OUT = Gauge(
+    "scourt_db_pool_checked_out", "사용 중인 DB 커넥션 수"
+)
+DB_POOL_SIZE = Gauge("scourt_db_pool_size", "DB 커넥션 풀 크기")
+DB_POOL_OVERFLOW = Gauge("scourt_db_pool_overflow", "풀 크기를 넘어 생성된 커넥션 수")
+
+
+class RunStats:
+    """
+    스케줄러 1회 실행 동안의 통계를 모읍니다.
+    prometheus 지표는 프로세스 전체 누적값이라 실행 단위 통계는 여기에 따로 모아서
+    erp_scheduler_runs 테이블에 기록합니다.
+    """
+
+    def __init__(self, trigger: str = "cron"):
+        self.trigger = trigger
+        self.started_at = datetime.now(timezone.utc)
+        self.finished_at: Optional[datetime] = None
+        self.outcomes: Dict[str, int] = {"success": 0, "failed": 0, "skipped": 0}
+        self.failures: Dict[str, int] = {}
+        self.stage_seconds: Dict[str, float] = {}
+        self.cases_changed = 0
+        self.new_history = 0
+        self.new_trial = 0
+        # 프로파일링 모드로 실행한 경우 상위 함수/이벤트 루프 지연 요약
+        self.profile: Optional[Dict[str, Any]] = None
+        # 실행 시작 시점의 대상 사건 수(진행률 표시용)
+        self.cases_planned: Optional[int] = None
+        # 실행 시간대 종료 시각(시간대 모드로 실행한 경우)
+        self.deadline: Optional[datetime] = None
+        # 조직별 처리 건수와 최대 대기 시간. 키는 firm_id 문자열(조직 없음은 "none")
+        self.firms: Dict[str, Dict[str, float]] = {}
+        # 조회할 사건 ID 목록과 다음에 조회할 위치(중단 시 checkpoint 용)
+        self.pending_case_ids: List[int] = []
+        self.pending_index = 0
+
+    @property
+    def cases_total(self) -> int:
+        return sum(self.outcomes.values())
+
+    @property
+    def duration_seconds(self) -> float:
+        end = self.finished_at or datetime.now(timezone.utc)
+        return (end - self.started_at).total_seconds()
+
+    @property
+    def throughput_per_min(self) -> float:
+        attempted = self.outcomes["success"] + self.outcomes["failed"]
+        duration = self.duration_seconds
+        return attempted / duration * 60 if duration > 0 else 0.0
+
+    def finish(self) -> None:
+        self.finished_at = datetime.now(timezone.utc)
+
+    def merge(self, other: "RunStats") -> None:
+        """
+        다른 프로세스에서 나눠 실행한 통계를 합칩니다.(멀티 프로세스 실행)
+        건수는 더하고, 조직별 최대 대기 시간은 큰 값을 사용합니다.
+        남은 사건(pending_case_ids)은 합치지 않습니다.(상위 프로세스가 나눠준 사건 목록에서 관리)
+        """
+
+        for outcome, count in other.outcomes.items():
+            self.outcomes[outcome] = self.outcomes.get(outcome, 0) + count
+        for reason, count in other.failures.items():
+            self.failures[reason] = self.failures.get(reason, 0) + count
+        for stage, seconds in other.stage_seconds.items():
+            self.stage_seconds[stage] = self.stage_seconds.get(stage, 0.0) + seconds
+        self.cases_changed += other.cases_changed
+        self.new_history += other.new_history
+        self.new_trial += other.new_trial
+
+        for key, other_firm in other.firms.items():
+            firm = self.firms.setdefault(
+                key, {"success": 0, "failed": 0, "skipped": 0, "max_wait_seconds": 0.0}
+            )
+            for name, value in other_firm.items():
+                if name == "max_wait_seconds":
+                    firm[name] = max(firm.get(name, 0.0), value)
+                else:
+                    firm[name] = firm.get(name, 0) + value
+
+    def remaining_case_ids(self) -> List[int]:
+        """아직 조회를 끝내지 않은 사건 ID(조회 중이던 사건 포함)"""
+
+        return self.pending_case_ids[self.pending_index :]
+
+    def record_firm(
+        self,
+        firm_id: Optional[int],
+        outcome: str,
+        wait_seconds: Optional[float] = None,
+    ) -> None:
+        """
+        조직별 처리 결과를 기록합니다.
+        wait_seconds: 실행 시작부터 이 사건 조회를 시작하기까지 걸린 시간(조회하지 않고 건너뛴 경우 None)
+        """
+
+        key = str(firm_id) if firm_id is not None else "none"
+        FIRM_CASES.labels(firm_id=key, outcome=outcome).inc()
+
+        firm = self.firms.setdefault(
+            key, {"success": 0, "failed": 0, "skipped": 0, "max_wait_seconds": 0.0}
+        )
+        firm[outcome] = firm.get(outcome, 0) + 1
+        if wait_seconds is not None:
+            FIRM_CASE_WAIT_SECONDS.labels(firm_id=key).observe(wait_seconds)
+            firm["max_wait_seconds"] = max(
+                firm["max_wait_seconds"], round(wait_seconds, 1)
+            )
+
+    def record_joined(
+        self,
+        outcome: str,
+        reason: Optional[str] = None,
+        history: int = 0,
+        trial: int = 0,
+        updated_history: int = 0,
+        updated_trial: int = 0,
+    ) -> None:
+        """
+        다른 작업(API 요청 등)이 처리한 사건 결과를 이 실행 통계에 기록합니다.
+        진행 중인 조회에 합류한 경우 record_case/record_new_rows 는 그 작업의 컨텍스트에서 실행되어
+        이 실행 통계에 남지 않습니다.(prometheus 지표는 그 작업에서 기록했으므로 여기서는 기록하지 않음)
+        """
+
+        self.outcomes[outcome] = self.outcomes.get(outcome, 0) + 1
+        if reason:
+            self.failures[reason] = self.failures.get(reason, 0) + 1
+        self.new_history += history
+        self.new_trial += trial
+        if history or trial or updated_history or updated_trial:
+            self.cases_changed += 1
+
+    def progress(self) -> Dict[str, Any]:
+        """진행 상황 이벤트(SSE)로 보낼 요약"""
+
+        return {
+            "trigger": self.trigger,
+            "startedAt": self.started_at.isoformat(),
+            "done": self.cases_total,
+            "total": self.cases_planned,
+            "success": self.outcomes.get("success", 0),
+            "failed": self.outcomes.get("failed", 0),
+            "skipped": self.outcomes.get("skipped", 0),
+            "failures": dict(self.failures),
+            "casesChanged": self.cases_changed,
+            "newHistory": self.new_history,
+            "newTrial": self.new_trial,
+            "throughputPerMin": round(self.throughput_per_min, 2),
+            "deadline": self.deadline.isoformat() if self.deadline else None,
+        }
+
+
+# 현재 실행 중인 스케줄러 작업의 통계. asyncio task 로 분기해도 컨텍스트가 복사되므로 같이 집계됩니다.
+current_run: ContextVar[Optional[RunStats]] = ContextVar("current_run", default=None)
+
+
+def record_case(outcome: str, reason: Optional[str] = None) -> None:
+    """사건 처리 결과를 prometheus 지표와 현재 실행 통계에 함께 기록합니다."""
+
+    CASES_PROCESSED.labels(outcome=outcome).inc()
+    if reason:
+        CASES_FAILED.labels(reason=reason).inc()
+
+    stats = current_run.get()
+    if stats is None:
+        return
+    stats.outcomes[outcome] = stats.outcomes.get(outcome, 0) + 1
+    if reason:
+        stats.failures[reason] = stats.failures.get(reason, 0) + 1
+
+
+def record_new_rows(
+    history: int, trial: int, updated_history: int = 0, updated_trial: int = 0
+) -> None:
+    """사건 1건에서 새로 추가된(updated_*: 기존 행을 수정한) 이력/기일 건수를 기록합니다."""
+
+    NEW_ROWS.labels(kind="history").inc(history)
+    NEW_ROWS.labels(kind="trial").inc(trial)
+    UPDATED_ROWS.labels(kind="history").inc(updated_history)
+    UPDATED_ROWS.labels(kind="trial").inc(updated_trial)
+
+    stats = current_run.get()
+    if stats is None:
+        return
+    stats.new_history += history
+    stats.new_trial += trial
+    if history or trial or updated_history or updated_trial:
+        stats.cases_changed += 1
+
+
+@contextmanager
+def track_stage(stage: str) -> Iterator[None]:
+    """
+    with 블록의 소요 시간을 stage 라벨로 기록합니다.
+    예외가 발생하면 실패 수를 올리고, 예외에 실패한 단계를 남긴 뒤 그대로 다시 발생시킵니다.
+    (스케줄러에서 실패 원인을 단계 기준으로 집계할 때 사용)
+    """
+
+    started = time.perf_counter()
+    try:
+        yield
+    except Exception as e:
+        STAGE_FAILURES.labels(stage=stage).inc()
+        if not hasattr(e, "failed_stage"):
+            e.failed_stage = stage  # type: ignore[attr-defined]
+        raise
+    finally:
+        elapsed = time.perf_counter() - started
+        STAGE_SECONDS.labels(stage=stage).observe(elapsed)
+        stats = current_run.get()
+        if stats is not None:
+            stats.stage_seconds[stage] = stats.stage_seconds.get(stage, 0.0) + elapsed
+
+
+def failure_reason(e: BaseException) -> str:
+    """track_stage 에서 남긴 실패 단계를 돌려줍니다. 단계 밖에서 발생했으면 unknown"""
+
+    return getattr(e, "failed_stage", "unknown")
+
+
+def update_pool_gauges(pool: Pool) -> None:
+    """
+    /metrics 요청 시점의 커넥션 풀 상태를 gauge 에 반영합니다.
+    QueuePool 이 아닌 경우(NullPool 등)에는 해당 메소드가 없으므로 건너뜁니다.
+    """
+
+    for gauge, attr in (
+        (DB_POOL_CHECKED_OUT, "checkedout"),
+        (DB_POOL_SIZE, "size"),
+        (DB_POOL_OVERFLOW, "overflow"),
+    ):
+        fn = getattr(pool, attr, None)
+        if callable(fn):
+            gauge.set(fn())
@@ -0,0 +1,174 @@
+"""
+스케줄러 실행 프로파일링
+
+운영 서버에서 실행이 느려졌을 때 이벤트 루프 안에서 CPU 가 어디에 쓰이는지 확인하기 위한 용도입니다.
+Settings.PROFILE_RUNS 또는 관리자 API(/api/v1/admin/profile-next-run)로 켜면
+_runner 1회 실행(또는 샘플링된 일부 사건)을 cProfile 로 감싸고 이벤트 루프 지연을 같이 측정합니다.
+
+결과는 PROFILE_DIR 아래에 시각이 붙은 파일로 남습니다.
+    - run-YYYYmmdd-HHMMSS.prof : pstats 원본(snakeviz 등으로 확인)
+    - run-YYYYmmdd-HHMMSS.txt  : 상위 N개 함수와 이벤트 루프 지연 요약
+상위 N개 함수는 실행 통계(erp_scheduler_runs.profile)에도 기록됩니다.
+"""
+
+import asyncio
+import cProfile
+import io
+import logging
+import os
+import pstats
+import random
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class LoopLagMonitor:
+    """
+    interval 마다 깨어나서 예정보다 얼마나 늦게 깨어났는지 측정합니다.
+    지연이 크다는 것은 그 사이에 이벤트 루프를 오래 붙잡은 동기 코드가 있었다는 뜻입니다.
+    """
+
+    def __init__(self, interval: float = 0.1):
+        self.interval = interval
+        self.samples: List[float] = []
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        if not self._task:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            expected = time.perf_counter() + self.interval
+            await asyncio.sleep(self.interval)
+            self.samples.append(max(time.perf_counter() - expected, 0.0))
+
+    def summary(self) -> Dict[str, float]:
+        if not self.samples:
+            return {"samples": 0}
+
+        ordered = sorted(self.samples)
+        return {
+            "samples": len(ordered),
+            "mean_ms": round(sum(ordered) / len(ordered) * 1000, 3),
+            "p99_ms": round(ordered[int(len(ordered) * 0.99) - 1] * 1000, 3),
+            "max_ms": round(ordered[-1] * 1000, 3),
+        }
+
+
+class RunProfiler:
+    """
+    스케줄러 1회 실행을 프로파일링합니다.
+
+    sample_rate 가 1 이면 실행 전체를, 1 보다 작으면 case() 로 감싼 사건 중
+    해당 비율만큼만 프로파일러를 켭니다.
+    """
+
+    def __init__(
+        self,
+        output_dir: str,
+        sample_rate: float = 1.0,
+        top_n: int = 20,
+    ):
+        self.output_dir = output_dir
+        self.sample_rate = sample_rate
+        self.top_n = top_n
+        self.profile = cProfile.Profile()
+        self.lag = LoopLagMonitor()
+        self.sampled_cases = 0
+        self.started_at = datetime.now()
+
+    @property
+    def whole_run(self) -> bool:
+        return self.sample_rate >= 1.0
+
+    def start(self) -> None:
+        self.lag.start()
+        if self.whole_run:
+            self.profile.enable()
+
+    @contextmanager
+    def case(self, case_id: int) -> Iterator[None]:
+        """사건 1건 처리 구간. 샘플링 모드일 때만 여기서 프로파일러를 켭니다."""
+
+        if self.whole_run or random.random() >= self.sample_rate:
+            yield
+            return
+
+        self.sampled_cases += 1
+        self.profile.enable()
+        try:
+            yield
+        finally:
+            self.profile.disable()
+
+    async def stop(self) -> Dict[str, Any]:
+        """
+        프로파일러를 멈추고 결과를 파일로 저장한 뒤 실행 통계에 남길 요약을 돌려줍니다.
+        """
+
+        if self.whole_run:
+            self.profile.disable()
+        await self.lag.stop()
+
+        summary: Dict[str, Any] = {
+            "mode": "run" if self.whole_run else "sampled",
+            "sample_rate": self.sample_rate,
+            "sampled_cases": self.sampled_cases,
+            "loop_lag": self.lag.summary(),
+            "hotspots": [],
+        }
+
+        stats_text = io.StringIO()
+        try:
+            stats = pstats.Stats(self.profile, stream=stats_text)
+        except TypeError:
+            # 샘플링 모드에서 한 건도 선택되지 않으면 수집된 데이터가 없음
+            logger.info("프로파일링 대상 구간이 없어 결과를 저장하지 않습니다.")
+            return summary
+
+        stats.sort_stats(pstats.SortKey.TIME)
+        summary["hotspots"] = self._hotspots(stats)
+
+        os.makedirs(self.output_dir, exist_ok=True)
+        base = os.path.join(
+            self.output_dir, f"run-{self.started_at.strftime('%Y%m%d-%H%M%S')}"
+        )
+        stats.dump_stats(f"{base}.prof")
+
+        stats.print_stats(self.top_n)
+        with open(f"{base}.txt", "w", encoding="utf-8") as f:
+            f.write(f"loop lag: {summary['loop_lag']}\n")
+            f.write(stats_text.getvalue())
+
+        summary["file"] = f"{base}.prof"
+        logger.info(f"프로파일링 결과 저장: {base}.prof")
+        return summary
+
+    def _hotspots(self, stats: pstats.Stats) -> List[Dict[str, Any]]:
+        hotspots = []
+        for func in stats.fcn_list[: self.top_n]:  # type: ignore[attr-defined]
+            cc, ncalls, tottime, cumtime, _ = stats.stats[func]  # type: ignore[attr-defined]
+            filename, line, name = func
+            hotspots.append(
+                {
+                    "function": f"{filename}:{line}({name})",
+                    "ncalls": ncalls,
+                    "tottime": round(tottime, 4),
+                    "cumtime": round(cumtime, 4),
+                }
+            )
+        return hotspots
@@ -1,5 +1,7 @@
+import time
 from typing import AsyncIterator
 
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
@@ -8,6 +10,7 @@ from sqlalchemy.ext.asyncio import (
 )
 
 from app.core.config import settings
+from app.core.metrics import DB_POOL_CHECKOUT_SECONDS
 
 
 def _to_async_url(url: str) -> str:
@@ -25,15 +28,25 @@ def _to_async_url(url: str) -> str:
 ASYNC_DATABASE_URL: str = _to_async_url(settings.DATABASE_URL)
 
 # Create async engine
+# SQLAlchemy asyncpg 드라이버는 SQL 문자열마다 prepared statement 를 만들어 커넥션별로 캐시합니다.
+# (prepared_statement_cache_size: SQLAlchemy 쪽 캐시, statement_cache_size: asyncpg 쪽 캐시)
+# 사건마다 반복하는 쿼리는 모듈 상수 text() 로 두어 같은 문자열로 재사용되게 합니다.
 engine: AsyncEngine = create_async_engine(
-    ASYNC_DATABASE_URL,
+    make_url(ASYNC_DATABASE_URL).update_query_dict(
+        {"prepared_statement_cache_size": str(settings.DB_STATEMENT_CACHE_SIZE)}
+    ),
     # echo=settings.DEBUG,
-    pool_pre_ping=True,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT_SECONDS,
+    pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+    pool_pre_ping=settings.DB_POOL_PRE_PING,
     future=True,
     connect_args={
+        "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
         "server_settings": {
             "application_name": "scourt-scheduler",
-        }
+        },
     },
 )
 
@@ -54,3 +67,14 @@ async def get_session() -> AsyncIterator[AsyncSession]:
     """
     async with AsyncSessionLocal() as session:
         yield session
+
+
+async def acquire_connection(session: AsyncSession) -> None:
+    """
+    세션에 커넥션을 미리 할당하고 풀에서 커넥션을 얻기까지 걸린 시간을 기록합니다.
+    세션은 commit/rollback 후 커넥션을 반납하므로, 트랜잭션 시작 전에 호출하면 됩니다.
+    """
+
+    started = time.perf_counter()
+    await session.connection()
+    DB_POOL_CHECKOUT_SECONDS.observe(time.perf_counter() - started)
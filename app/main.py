@@ -1,28 +1,19 @@
 from contextlib import asynccontextmanager
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
 
 from app.api.v1.routes import api_router
+from app.core.config import settings
+from app.core.metrics import update_pool_gauges
+from app.core.session import engine
 from app.service.scheduler import SupremeCourtScheduler
 
 
 import logging
-from logging.handlers import TimedRotatingFileHandler
-
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s %(levelname)s [%(name)s] %(message)s",
-    datefmt="%Y-%m-%d %H:%M:%S",
-    handlers=[
-        TimedRotatingFileHandler(
-            "scheduler.log",
-            when="midnight",
-            interval=1,
-            backupCount=7,
-            encoding="utf-8",
-        ),
-        logging.StreamHandler(),
-    ],
-)
+
+from app.core.logging_config import setup_logging, stop_logging
+
+setup_logging()
 logger = logging.getLogger(__name__)
 
 
@@ -32,12 +23,14 @@ async def lifespan(app: FastAPI):
     나의사건정보 스케줄러를 시작하고 종료하는 생명주기 관리
     """
 
-    scheduler = SupremeCourtScheduler()
+    scheduler = SupremeCourtScheduler(processes=settings.WORKER_PROCESSES)
     await scheduler.start()
+    app.state.scheduler = scheduler
     try:
         yield
     finally:
         await scheduler.shutdown()
+        stop_logging()
 
 
 app = FastAPI(lifespan=lifespan)
@@ -48,4 +41,14 @@ async def health() -> dict:
     return {"status": "ok", "app": "scourt-scheduler"}
 
 
+@app.get("/metrics", tags=["Health"])
+async def metrics() -> Response:
+    """
+    prometheus 수집용 지표
+    """
+
+    update_pool_gauges(engine.pool)
+    return Response(content=generate_latest(), media_type=CONTENT_TYPE_LATEST)
+
+
 app.include_router(api_router, prefix="/api/v1")
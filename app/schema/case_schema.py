@@ -2,7 +2,6 @@ from app.schema.base import SchemaBase
 from pydantic import Field
 from typing import Optional
 from datetime import datetime
-from typing import Dict, Any
 from app.schema.base import SchemaBase
 from enum import Enum
 
@@ -76,42 +75,6 @@ class ClientLitigantRole(str, Enum):
     DEFENDANT3 = "피고보조참가인"
 
 
-class CaseHistoryBase(SchemaBase):
-    """사건 이력 기본 스키마"""
-
-    # id: Optional[int] = Field(None, description="사건 이력 ID")
-    # created_at: Optional[datetime] = Field(None, description="생성 일자")
-
-    case_id: int = Field(..., description="사건 ID")
-    event_type: CaseHistoryEventType = Field(..., description="이벤트 타입")
-    event_type2: CaseHistoryEventType2 = Field(..., description="이벤트 타입")
-    prev_value: Optional[Dict[str, Any]] = Field(None, description="이전 값")
-    curr_value: Optional[Dict[str, Any]] = Field(None, description="현재 값")
-
-    details: Optional[str] = Field(None, description="이벤트 상세")
-    result: Optional[str] = Field(None, description="결과")
-
-
-class CaseHistoryResponse(CaseHistoryBase):
-    """사건 이력 응답 스키마"""
-
-    # 사건 이력 정보
-    id: int = Field(..., description="사건 이력 ID")
-    created_at: datetime = Field(..., description="사건 이력 생성 일자")
-
-
-class TrialInfoResponse(SchemaBase):
-    """사건 변론기일 정보 응답 스키마"""
-
-    id: int = Field(..., description="변론기일 ID")
-    trial_date: datetime = Field(..., description="변론기일 날짜")
-    trial_type: Optional[str] = Field(None, description="변론기일 종류")
-    trial_agency_address_detail: Optional[str] = Field(
-        None, description="변론기일 상세 주소"
-    )
-    trial_result: Optional[str] = Field(None, description="변론기일 결과")
-
-
 class CaseResponseForParser(SchemaBase):
     """나의 사건 정보 업데이트를 위한 사건 목록 응답 스키마"""
 
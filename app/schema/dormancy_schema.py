@@ -0,0 +1,17 @@
+from datetime import datetime
+from typing import Optional
+
+from pydantic import Field
+
+from app.schema.base import SchemaBase
+
+
+class DormantCaseResponse(SchemaBase):
+    """휴면 사건 응답 스키마"""
+
+    case_id: int = Field(..., description="사건 ID")
+    title: str = Field(..., description="사건 제목")
+    case_number: str = Field(..., description="사건 번호")
+    jurisdiction: str = Field(..., description="법원")
+    last_history_at: datetime = Field(..., description="마지막 법원 이력 날짜")
+    final_history: Optional[str] = Field(None, description="사건 종료로 판단한 법원 이력 내용")
@@ -0,0 +1,71 @@
+from datetime import datetime
+from enum import Enum
+from typing import List, Optional
+
+from pydantic import Field, field_validator, model_validator
+
+from app.core.court import normalize_court_name
+from app.schema.base import SchemaBase
+
+
+class RefreshJobStatus(str, Enum):
+    """일괄 조회 작업 상태"""
+
+    PENDING = "pending"
+    RUNNING = "running"
+    FINISHED = "finished"
+    FAILED = "failed"
+    INTERRUPTED = "interrupted"  # 종료 요청으로 중단(남은 사건은 조회하지 않음)
+
+
+class RefreshJobCreate(SchemaBase):
+    """일괄 조회 작업 생성 요청 스키마. 필터는 하나 이상 지정해야 합니다."""
+
+    firm_id: Optional[int] = Field(None, description="조직 ID")
+    case_ids: Optional[List[int]] = Field(None, description="사건 ID 목록")
+    jurisdiction: Optional[str] = Field(
+        None, description="관할법원(약칭/띄어쓰기가 달라도 법원 목록의 이름으로 바꿔서 찾습니다)"
+    )
+    concurrency: Optional[int] = Field(
+        None, ge=1, le=16, description="동시 조회 수(미지정 시 REFRESH_JOB_CONCURRENCY)"
+    )
+
+    @field_validator("jurisdiction")
+    @classmethod
+    def check_jurisdiction(cls, value: Optional[str]) -> Optional[str]:
+        if not value:
+            return None
+        court_name = normalize_court_name(value)
+        if court_name is None:
+            raise ValueError(f"법원 목록에서 찾을 수 없는 관할법원입니다: {value}")
+        return court_name
+
+    @model_validator(mode="after")
+    def check_filter(self):
+        if not self.firm_id and not self.case_ids and not self.jurisdiction:
+            raise ValueError("firmId, caseIds, jurisdiction 중 하나 이상 지정해야 합니다.")
+        return self
+
+
+class RefreshJobResponse(SchemaBase):
+    """일괄 조회 작업 진행 상황 응답 스키마"""
+
+    job_id: str = Field(..., description="작업 ID")
+    status: RefreshJobStatus = Field(..., description="작업 상태")
+    firm_id: Optional[int] = Field(None, description="조직 ID")
+    case_ids: Optional[List[int]] = Field(None, description="사건 ID 목록")
+    jurisdiction: Optional[str] = Field(None, description="관할법원")
+    concurrency: int = Field(..., description="동시 조회 수")
+
+    total: int = Field(0, description="대상 사건 수")
+    done: int = Field(0, description="처리 완료 사건 수")
+    success: int = Field(0, description="성공 사건 수")
+    failed: int = Field(0, description="실패 사건 수")
+    skipped: int = Field(0, description="스킵 사건 수")
+    cached: int = Field(0, description="캐시 결과를 사용한 사건 수")
+    changed: int = Field(0, description="새 이력/기일이 추가된 사건 수")
+
+    created_at: datetime = Field(..., description="생성 시각")
+    started_at: Optional[datetime] = Field(None, description="시작 시각")
+    finished_at: Optional[datetime] = Field(None, description="종료 시각")
+    error: Optional[str] = Field(None, description="작업 자체가 실패한 경우 오류")
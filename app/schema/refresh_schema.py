@@ -0,0 +1,48 @@
+from datetime import datetime
+from typing import List, Optional
+
+from pydantic import Field
+
+from app.schema.base import SchemaBase
+
+
+class SupremCourtHistoryParsedResult(SchemaBase):
+    """대법원 사건 이력 파싱 결과 스키마"""
+
+    date: str = Field(..., description="일자")
+    content: str = Field(..., description="내용")
+    result: Optional[str] = Field(None, description="결과")
+
+
+class SupremCourtTrialInfoParsedResult(SchemaBase):
+    """대법원 사건 변론기일 파싱 결과 스키마"""
+
+    date: str = Field(..., description="일자")
+    time: str = Field(..., description="시간")
+    type: str = Field(..., description="종류")
+    location: str = Field(..., description="장소")
+    result: Optional[str] = Field(None, description="결과")
+
+
+class CaseRefreshResponse(SchemaBase):
+    """사건 즉시 조회 응답 스키마"""
+
+    case_id: int = Field(..., description="사건 ID")
+    outcome: str = Field(..., description="처리 결과(success/failed/skipped)")
+    message: Optional[str] = Field(None, description="실패 또는 스킵 사유")
+    source: str = Field(
+        ..., description="결과 출처(fresh: 새로 조회, joined: 진행 중인 조회에 합류, cache: 캐시)"
+    )
+    refreshed_at: datetime = Field(..., description="조회 완료 시각")
+    history: List[SupremCourtHistoryParsedResult] = Field(
+        default_factory=list, description="새로 추가된 사건 이력"
+    )
+    trial_info: List[SupremCourtTrialInfoParsedResult] = Field(
+        default_factory=list, description="새로 추가된 기일"
+    )
+    updated_history: List[SupremCourtHistoryParsedResult] = Field(
+        default_factory=list, description="결과가 바뀐 사건 이력"
+    )
+    updated_trial_info: List[SupremCourtTrialInfoParsedResult] = Field(
+        default_factory=list, description="장소/결과가 바뀐 기일"
+    )
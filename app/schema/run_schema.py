@@ -0,0 +1,51 @@
+from datetime import datetime
+from enum import Enum
+from typing import Any, Dict, Optional
+
+from pydantic import Field
+
+from app.schema.base import SchemaBase
+
+
+class SchedulerRunStatus(str, Enum):
+    """스케줄러 실행 상태"""
+
+    RUNNING = "running"
+    FINISHED = "finished"
+    FAILED = "failed"
+    INTERRUPTED = "interrupted"  # 종료 요청으로 중단(checkpoint 에 남은 사건 기록)
+
+
+class SchedulerRunResponse(SchemaBase):
+    """스케줄러 실행 통계 응답 스키마"""
+
+    id: int = Field(..., description="실행 ID")
+    trigger: str = Field(..., description="실행 방식(cron 등)")
+    status: SchedulerRunStatus = Field(..., description="실행 상태")
+    started_at: datetime = Field(..., description="시작 시각")
+    finished_at: Optional[datetime] = Field(None, description="종료 시각")
+    duration_seconds: Optional[float] = Field(None, description="소요 시간(초)")
+
+    cases_total: int = Field(0, description="대상 사건 수")
+    cases_success: int = Field(0, description="성공 사건 수")
+    cases_failed: int = Field(0, description="실패 사건 수")
+    cases_skipped: int = Field(0, description="스킵 사건 수")
+    cases_changed: int = Field(0, description="새 이력/기일이 추가된 사건 수")
+    new_history: int = Field(0, description="새로 추가된 이력 수")
+    new_trial: int = Field(0, description="새로 추가된 기일 수")
+    throughput_per_min: Optional[float] = Field(None, description="분당 처리 사건 수")
+
+    stage_seconds: Optional[Dict[str, float]] = Field(
+        None, description="단계별 누적 소요 시간(초)"
+    )
+    failures: Optional[Dict[str, int]] = Field(None, description="실패 단계별 건수")
+    error: Optional[str] = Field(None, description="실행 자체가 실패한 경우 오류")
+    profile: Optional[Dict[str, Any]] = Field(
+        None, description="프로파일링 요약(상위 함수, 이벤트 루프 지연)"
+    )
+    checkpoint: Optional[Dict[str, Any]] = Field(
+        None, description="중단된 실행에서 아직 조회하지 않은 사건(remaining_case_ids)"
+    )
+    firms: Optional[Dict[str, Dict[str, float]]] = Field(
+        None, description="조직별 처리 건수(success/failed/skipped)와 최대 대기 시간(초)"
+    )
@@ -1,5 +1,8 @@
 import httpx
 import logging
+import time
+
+from app.core.metrics import ALIMTALK_MESSAGES, ALIMTALK_SECONDS
 
 logger = logging.getLogger(__name__)
 
@@ -49,6 +52,7 @@ class AlimTalkService:
         # 템플릿 코드가 존재하는가?
         if template_code not in NOTIFICATION_TEMPLATE_MAP:
             logger.error(f"템플릿 코드 {template_code}가 존재하지 않습니다.")
+            ALIMTALK_MESSAGES.labels(template_code="unknown", result="invalid").inc()
             return None
 
         # 템플릿 코드에 필요한 필수 파라미터가 존재하는가?
@@ -60,6 +64,9 @@ class AlimTalkService:
                 logger.error(
                     f"템플릿 코드 {template_code}에 필수 파라미터 {param}가 없습니다."
                 )
+                ALIMTALK_MESSAGES.labels(
+                    template_code=template_code, result="invalid"
+                ).inc()
                 return None
 
         headers = {
@@ -78,17 +85,34 @@ class AlimTalkService:
             ],
         }
 
+        started = time.perf_counter()
         async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.api_url}/appkeys/{self.app_key}/messages",
-                headers=headers,
-                json=data,
-            )
+            try:
+                response = await client.post(
+                    f"{self.api_url}/appkeys/{self.app_key}/messages",
+                    headers=headers,
+                    json=data,
+                )
+            except Exception:
+                ALIMTALK_MESSAGES.labels(
+                    template_code=template_code, result="error"
+                ).inc()
+                raise
+            finally:
+                ALIMTALK_SECONDS.labels(template_code=template_code).observe(
+                    time.perf_counter() - started
+                )
 
             if response.status_code == 200:
                 logger.info(f"알림톡 메시지 전송 성공: {response.json()}")
+                ALIMTALK_MESSAGES.labels(
+                    template_code=template_code, result="sent"
+                ).inc()
                 return response.json()
             else:
                 logger.error(f"알림톡 메시지 전송 실패: {response.json()}")
+                ALIMTALK_MESSAGES.labels(
+                    template_code=template_code, result="rejected"
+                ).inc()
                 return None
                 # response.raise_for_status()
@@ -0,0 +1,172 @@
+import asyncio
+import logging
+import time
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from app.core.session import AsyncSessionLocal
+from app.schema.case_schema import CaseResponseForParser
+from app.service.mycase import MyCaseService
+from app.service.refresh import CaseProcessResult
+
+logger = logging.getLogger(__name__)
+
+# migrations/003_erp_cases_notify_trigger.sql 의 채널명과 같아야 합니다.
+CASE_CHANGED_CHANNEL = "scourt_case_changed"
+
+ProcessCase = Callable[
+    [CaseResponseForParser], Awaitable[Tuple[Optional[CaseProcessResult], str]]
+]
+
+
+class CaseChangeListener:
+    """
+    erp_cases 생성/사건번호·관할법원 변경 알림(LISTEN/NOTIFY)을 받아 해당 사건을 바로 조회합니다.
+
+    - 디바운스: 같은 사건에 대한 알림이 debounce_seconds 동안 더 오지 않을 때 조회합니다.
+      (ERP 에서 사건 생성 직후 사건번호를 수정하는 경우 한 번만 조회)
+    - 속도 제한: 분당 rate_per_minute 건까지만 조회하고 나머지는 다음 차례로 미룹니다.
+      동시에 조회하는 사건은 max_concurrency 건으로 제한합니다.
+    - 연결이 끊기면 reconnect_seconds 후 다시 연결합니다.
+    """
+
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        process_case: ProcessCase,
+        debounce_seconds: float = 5.0,
+        rate_per_minute: int = 30,
+        max_concurrency: int = 2,
+        reconnect_seconds: float = 10.0,
+    ):
+        self.engine = engine
+        self.process_case = process_case
+        self.debounce_seconds = debounce_seconds
+        self.rate_per_minute = rate_per_minute
+        self.reconnect_seconds = reconnect_seconds
+
+        # case_id -> 마지막 알림 시각(monotonic)
+        self._pending: Dict[int, float] = {}
+        self._tokens = float(rate_per_minute)
+        self._tokens_at = time.monotonic()
+        self._listen_task: Optional[asyncio.Task] = None
+        self._flush_task: Optional[asyncio.Task] = None
+        self._workers: set[asyncio.Task] = set()
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def start(self) -> None:
+        self._listen_task = asyncio.create_task(self._listen_forever())
+        self._flush_task = asyncio.create_task(self._flush_forever())
+
+    async def stop(self) -> None:
+        for task in (self._listen_task, self._flush_task):
+            if task:
+                task.cancel()
+        for task in (self._listen_task, self._flush_task):
+            if task:
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        if self._workers:
+            await asyncio.gather(*self._workers, return_exceptions=True)
+
+    def _on_notify(self, connection, pid, channel: str, payload: str) -> None:
+        try:
+            case_id = int(payload)
+        except ValueError:
+            logger.error(f"알 수 없는 사건 변경 알림 payload: {payload}")
+            return
+        self._pending[case_id] = time.monotonic()
+
+    async def _listen_forever(self) -> None:
+        while True:
+            conn: Optional[AsyncConnection] = None
+            try:
+                conn = await self.engine.connect()
+                raw = await conn.get_raw_connection()
+                driver = raw.driver_connection  # asyncpg.Connection
+
+                closed = asyncio.Event()
+                driver.add_termination_listener(lambda _: closed.set())
+                await driver.add_listener(CASE_CHANGED_CHANNEL, self._on_notify)
+                logger.info(f"사건 변경 알림 구독 시작 (channel={CASE_CHANGED_CHANNEL})")
+
+                await closed.wait()
+                logger.error("사건 변경 알림 연결이 끊어졌습니다.")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"사건 변경 알림 구독 중 오류: {str(e)}")
+            finally:
+                if conn is not None:
+                    try:
+                        await conn.invalidate()
+                        await conn.close()
+                    except Exception:
+                        pass
+
+            await asyncio.sleep(self.reconnect_seconds)
+
+    def _take_token(self) -> bool:
+        now = time.monotonic()
+        self._tokens = min(
+            float(self.rate_per_minute),
+            self._tokens + (now - self._tokens_at) * self.rate_per_minute / 60,
+        )
+        self._tokens_at = now
+        if self._tokens < 1:
+            return False
+        self._tokens -= 1
+        return True
+
+    async def _flush_forever(self) -> None:
+        while True:
+            await asyncio.sleep(1)
+            try:
+                await self._flush()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"사건 변경 알림 처리 중 오류: {str(e)}")
+
+    async def _flush(self) -> None:
+        now = time.monotonic()
+        ready = sorted(
+            case_id
+            for case_id, seen_at in self._pending.items()
+            if now - seen_at >= self.debounce_seconds
+        )
+
+        case_ids = []
+        for case_id in ready:
+            if not self._take_token():
+                break
+            case_ids.append(case_id)
+            del self._pending[case_id]
+
+        if not case_ids:
+            return
+
+        async with AsyncSessionLocal() as session:
+            cases = await MyCaseService(session).get_case_list_for_scheduler(
+                skip=0, limit=len(case_ids), case_ids=case_ids
+            )
+
+        logger.info(
+            f"사건 변경 알림으로 조회 - 알림: {len(case_ids)}건, 조회 대상: {len(cases)}건"
+        )
+        for case in cases:
+            task = asyncio.create_task(self._process(case))
+            self._workers.add(task)
+            task.add_done_callback(self._workers.discard)
+
+    async def _process(self, case: CaseResponseForParser) -> None:
+        try:
+            async with self._semaphore:
+                await self.process_case(case)
+        except Exception as e:
+            logger.error(
+                f"사건 변경 알림 조회 중 오류 - 사건번호: {case.case_number}, 오류: {str(e)}"
+            )
@@ -0,0 +1,103 @@
+"""
+휴면 사건 분류
+
+ERP 에서 종결 처리를 하지 않았지만 법원 이력상 사실상 끝난 사건(판결확정, 종국 등 이후 변화 없음)을
+매일 조회하지 않도록 erp_case_histories 의 법원 이력으로 휴면 사건을 찾습니다.
+휴면 사건은 사건마다 조회하는 날을 나눠서 poll_days 일에 한 번만 조회합니다.
+새 이력이 들어오거나 기일이 잡히면 자동으로 휴면에서 빠집니다.
+"""
+
+from datetime import date
+from typing import Dict, List
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.schema.case_schema import CaseHistoryEventType, CaseStatus
+from app.schema.dormancy_schema import DormantCaseResponse
+
+# 사건이 끝났음을 나타내는 법원 이력 문구(LIKE 패턴)
+FINAL_HISTORY_PATTERNS = [
+    "%판결확정%",
+    "%종국%",
+    "%조정성립%",
+    "%화해성립%",
+    "%소취하%",
+    "%취하간주%",
+]
+
+
+def is_poll_day(case_id: int, today: date, poll_days: int) -> bool:
+    """
+    휴면 사건을 오늘 조회할 차례인지 확인합니다.
+    사건 ID 로 요일을 나눠서 같은 날 휴면 사건이 몰리지 않도록 합니다.
+    """
+
+    if poll_days <= 1:
+        return True
+    return (case_id + today.toordinal()) % poll_days == 0
+
+
+class DormancyService:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get_dormant_cases(self, idle_days: int) -> Dict[int, DormantCaseResponse]:
+        """
+        종결되지 않은 사건 중 휴면 사건을 case_id 기준으로 돌려줍니다.
+
+        휴면 조건
+        - 마지막 법원 이력이 사건 종료 문구(FINAL_HISTORY_PATTERNS)이고
+          (중간에 소취하/조정성립 등이 있었어도 그 뒤에 다른 이력이 있으면 휴면이 아님)
+        - 마지막 법원 이력 날짜가 idle_days 일보다 오래됐고
+        - 다가오는 기일이 없음
+        """
+
+        result = await self.db.execute(
+            text(
+                """
+            SELECT
+                ec.id AS case_id
+                , ec.title
+                , ec.case_number
+                , ec.jurisdiction
+                , last_his.created_at AS last_history_at
+                , last_his.details AS final_history
+            FROM erp_cases ec
+            -- 사건별 마지막 법원 이력(case_id, event_type, created_at, id 인덱스를 거꾸로 1건만 읽음)
+            INNER JOIN LATERAL (
+                SELECT
+                    his.details
+                    , his.created_at
+                FROM erp_case_histories his
+                WHERE
+                    his.case_id = ec.id
+                    AND his.event_type = :event_type
+                ORDER BY his.created_at DESC, his.id DESC
+                LIMIT 1
+            ) last_his ON TRUE
+            WHERE
+                ec.case_number IS NOT NULL
+                AND ec.jurisdiction IS NOT NULL
+                AND ec.status != :status
+                AND last_his.details LIKE ANY(:patterns)
+                AND last_his.created_at < now() - make_interval(days => :idle_days)
+                AND NOT EXISTS (
+                    SELECT 1
+                    FROM erp_case_trial_info trial
+                    WHERE
+                        trial.case_id = ec.id
+                        AND trial.trial_date >= now()
+                )
+            """
+            ),
+            {
+                "patterns": FINAL_HISTORY_PATTERNS,
+                "event_type": CaseHistoryEventType.COURT.value,
+                "status": CaseStatus.CLOSE.value,
+                "idle_days": idle_days,
+            },
+        )
+        rows: List = result.fetchall()
+
+        return {row.case_id: DormantCaseResponse.model_validate(row) for row in rows}
@@ -0,0 +1,217 @@
+"""
+사건 조회 실패 분류와 영구 실패 사건 기록(negative cache)
+
+캡차 서버가 돌려주는 detail.code 로 실패를 일시적(transient) / 영구적(permanent)으로 나눕니다.
+영구 실패한 사건은 erp_supremecourt_parse_failures 에 남기고, 스케줄러는 재조회 시각(next_attempt_at)
+전까지 캡차 조회 없이 건너뜁니다. 재조회 간격은 실패할 때마다 2배씩 늘어납니다.
+사건번호/관할법원/의뢰인이 바뀌면 fingerprint 가 달라지므로 바로 다시 조회합니다.
+"""
+
+import hashlib
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import Integer, bindparam, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.court import normalize_court_name
+from app.schema.case_schema import CaseResponseForParser
+from app.service.parser import CaptchaServerError
+
+FAILURE_PERMANENT = "permanent"
+FAILURE_TRANSIENT = "transient"
+
+# 같은 값으로 다시 조회해도 결과가 바뀌지 않는 캡차 서버 오류 코드
+# 캡차 서버(parse_case)의 detail.code 가 추가/변경되면 같이 맞춰야 합니다.
+PERMANENT_CODES = {
+    "CASE_NOT_FOUND",
+    "PARTY_MISMATCH",
+    "INVALID_COURT",
+    "INVALID_CASE_NUMBER",
+}
+
+# detail.code 가 없는 예전 응답용. 메시지에 아래 문구가 있으면 영구 실패로 봅니다.
+PERMANENT_MESSAGES = (
+    "사건을 찾을 수 없",
+    "당사자명이 일치하지",
+    "법원명을 확인",
+)
+
+
+# 영구 실패 기록(upsert)
+# 재조회 간격 파라미터는 타입을 명시합니다. 타입을 모르는 파라미터만 LEAST 에 넘기면 text 로 추론되어
+# make_interval(days => text) 를 찾지 못합니다.
+_RECORD_FAILURE_SQL = text(
+    """
+    INSERT INTO erp_supremecourt_parse_failures (
+        case_id
+        , fingerprint
+        , failure_code
+        , message
+        , failure_count
+        , first_failed_at
+        , last_failed_at
+        , next_attempt_at
+    ) VALUES (
+        :case_id
+        , :fingerprint
+        , :failure_code
+        , :message
+        , 1
+        , now()
+        , now()
+        , now() + make_interval(days => LEAST(CAST(:backoff_days AS INTEGER), CAST(:max_backoff_days AS INTEGER)))
+    )
+    ON CONFLICT (case_id) DO UPDATE SET
+        failure_count = CASE
+            WHEN erp_supremecourt_parse_failures.fingerprint = EXCLUDED.fingerprint
+            THEN erp_supremecourt_parse_failures.failure_count + 1
+            ELSE 1
+        END
+        , first_failed_at = CASE
+            WHEN erp_supremecourt_parse_failures.fingerprint = EXCLUDED.fingerprint
+            THEN erp_supremecourt_parse_failures.first_failed_at
+            ELSE now()
+        END
+        , next_attempt_at = now() + make_interval(days => CASE
+            WHEN erp_supremecourt_parse_failures.fingerprint = EXCLUDED.fingerprint
+            THEN LEAST(
+                CAST(:backoff_days AS INTEGER) * power(2, LEAST(erp_supremecourt_parse_failures.failure_count, 16))::int,
+                CAST(:max_backoff_days AS INTEGER)
+            )
+            ELSE LEAST(CAST(:backoff_days AS INTEGER), CAST(:max_backoff_days AS INTEGER))
+        END)
+        , fingerprint = EXCLUDED.fingerprint
+        , failure_code = EXCLUDED.failure_code
+        , message = EXCLUDED.message
+        , last_failed_at = now()
+    """
+).bindparams(
+    bindparam("backoff_days", type_=Integer),
+    bindparam("max_backoff_days", type_=Integer),
+)
+
+
+def classify_failure(e: BaseException) -> Tuple[str, str]:
+    """
+    사건 조회 실패를 (분류, 코드)로 돌려줍니다.
+    캡차 서버가 명시적으로 알려준 경우만 영구 실패이고, 네트워크/서버 오류/파싱 오류는 모두 일시적 실패입니다.
+    """
+
+    if not isinstance(e, CaptchaServerError):
+        return FAILURE_TRANSIENT, type(e).__name__
+
+    code = e.code or "UNKNOWN"
+    if code in PERMANENT_CODES:
+        return FAILURE_PERMANENT, code
+    if any(message in e.message for message in PERMANENT_MESSAGES):
+        return FAILURE_PERMANENT, code
+    return FAILURE_TRANSIENT, code
+
+
+def case_fingerprint(case: CaseResponseForParser) -> str:
+    """
+    조회 결과에 영향을 주는 값(사건번호, 관할법원, 의뢰인)의 해시
+    관할법원은 정규화한 법원명을 사용하므로 띄어쓰기/약칭만 바꾼 경우는 같은 값입니다.
+    """
+
+    court_name = normalize_court_name(case.jurisdiction) or case.jurisdiction
+    source = "\x1f".join(
+        [case.case_number or "", court_name or "", case.client_name or ""]
+    )
+    return hashlib.sha256(source.encode("utf-8")).hexdigest()
+
+
+class ParseFailure:
+    """erp_supremecourt_parse_failures 1건"""
+
+    def __init__(
+        self,
+        case_id: int,
+        fingerprint: str,
+        failure_code: str,
+        failure_count: int,
+        next_attempt_at: datetime,
+    ):
+        self.case_id = case_id
+        self.fingerprint = fingerprint
+        self.failure_code = failure_code
+        self.failure_count = failure_count
+        self.next_attempt_at = next_attempt_at
+
+
+class ParseFailureService:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get_active_failures(self) -> Dict[int, ParseFailure]:
+        """
+        아직 재조회 시각이 지나지 않은 영구 실패 사건을 case_id 기준으로 돌려줍니다.
+        """
+
+        result = await self.db.execute(
+            text(
+                """
+            SELECT
+                case_id
+                , fingerprint
+                , failure_code
+                , failure_count
+                , next_attempt_at
+            FROM erp_supremecourt_parse_failures
+            WHERE next_attempt_at > now()
+            """
+            )
+        )
+        rows: List = result.fetchall()
+
+        return {
+            row.case_id: ParseFailure(
+                case_id=row.case_id,
+                fingerprint=row.fingerprint,
+                failure_code=row.failure_code,
+                failure_count=row.failure_count,
+                next_attempt_at=row.next_attempt_at,
+            )
+            for row in rows
+        }
+
+    async def record_failure(
+        self,
+        case_id: int,
+        fingerprint: str,
+        failure_code: str,
+        message: Optional[str],
+        backoff_days: int,
+        max_backoff_days: int,
+    ) -> None:
+        """
+        영구 실패를 기록합니다. (커밋은 호출하는 쪽에서)
+        같은 fingerprint 로 다시 실패하면 횟수를 늘리고 재조회 간격을 2배로 늘립니다.(최대 max_backoff_days)
+        fingerprint 가 바뀌었으면 처음 실패한 것으로 다시 셉니다.
+        """
+
+        await self.db.execute(
+            _RECORD_FAILURE_SQL,
+            {
+                "case_id": case_id,
+                "fingerprint": fingerprint,
+                "failure_code": failure_code,
+                "message": message,
+                "backoff_days": backoff_days,
+                "max_backoff_days": max_backoff_days,
+            },
+        )
+
+    async def clear_failure(self, case_id: int) -> None:
+        """조회에 성공한 사건의 실패 기록을 지웁니다. (커밋은 호출하는 쪽에서)"""
+
+        await self.db.execute(
+            text(
+                """
+            DELETE FROM erp_supremecourt_parse_failures
+            WHERE case_id = :case_id
+            """
+            ),
+            {"case_id": case_id},
+        )
@@ -0,0 +1,98 @@
+"""
+조직(firm_id)별 공정 조회 순서
+
+한 조직이 사건을 대량으로 등록해도 다른 조직 사건이 실행 끝으로 밀리지 않도록
+조직별로 가중치 공정 큐(weighted fair queuing) 방식으로 조회 순서를 섞습니다.
+
+- 가중치(FAIR_FIRM_WEIGHTS): 조직의 k 번째 사건은 가상 시각 k / 가중치 에 배정되고, 가상 시각 순서로 조회합니다.
+  가중치가 2 인 조직은 1 인 조직보다 같은 시간에 2배 많은 사건을 조회합니다.
+- 우선순위 단계(FAIR_FIRM_TIERS): 숫자가 작은 단계의 조직을 먼저 조회합니다.(기본 1)
+- 한도(FAIR_FIRM_QUOTAS, FAIR_DEFAULT_QUOTA): 한 실행에서 조직별로 조회할 최대 사건 수. 넘는 사건은 다음 실행으로 미룹니다.
+
+설정값은 "firm_id:값" 을 쉼표로 이어 붙인 형식입니다.(예: "1:3,14:0.5")
+"""
+
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Tuple, TypeVar
+
+from app.schema.case_schema import CaseResponseForParser
+
+T = TypeVar("T", int, float)
+
+DEFAULT_TIER = 1
+
+
+def parse_firm_map(value: str, cast: Callable[[str], T]) -> Dict[Optional[int], T]:
+    """
+    "firm_id:값,..." 설정값을 dict 로 바꿉니다.
+    조직이 없는 사건(firm_id 없음)은 "none" 으로 지정합니다.
+    """
+
+    result: Dict[Optional[int], T] = {}
+    for part in value.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        try:
+            firm, raw = part.split(":")
+            firm_id = None if firm.strip().lower() == "none" else int(firm)
+            result[firm_id] = cast(raw.strip())
+        except ValueError:
+            raise ValueError(f"조직별 설정 형식이 잘못되었습니다.(firm_id:값): {part}")
+    return result
+
+
+class FairScheduler:
+    def __init__(
+        self,
+        weights: Dict[Optional[int], float],
+        tiers: Dict[Optional[int], int],
+        quotas: Dict[Optional[int], int],
+        default_quota: int = 0,
+    ):
+        self.weights = weights
+        self.tiers = tiers
+        self.quotas = quotas
+        self.default_quota = default_quota
+
+    def quota(self, firm_id: Optional[int]) -> int:
+        """조직의 실행당 최대 조회 사건 수. 0 이면 제한 없음"""
+
+        return self.quotas.get(firm_id, self.default_quota)
+
+    def order(
+        self,
+        cases: List[CaseResponseForParser],
+        rotation: int = 0,
+    ) -> Tuple[List[CaseResponseForParser], List[CaseResponseForParser]]:
+        """
+        (조회할 사건, 한도를 넘어 미룬 사건)을 돌려줍니다.
+        조직 안에서는 넘겨받은 순서를 유지합니다.
+
+        rotation: 한도를 넘는 조직에서 조회할 구간을 돌리는 값(보통 날짜).
+            조직 안의 순서가 매일 같으면 항상 같은 사건만 미뤄지므로 날마다 시작 위치를 옮깁니다.
+        """
+
+        groups: "OrderedDict[Optional[int], List[CaseResponseForParser]]" = OrderedDict()
+        for case in cases:
+            groups.setdefault(case.firm_id, []).append(case)
+
+        deferred: List[CaseResponseForParser] = []
+        keyed: List[Tuple[int, float, int, CaseResponseForParser]] = []
+        for group_index, (firm_id, group) in enumerate(groups.items()):
+            quota = self.quota(firm_id)
+            if quota and len(group) > quota:
+                offset = (rotation * quota) % len(group)
+                group = group[offset:] + group[:offset]
+                deferred.extend(group[quota:])
+                group = group[:quota]
+
+            weight = self.weights.get(firm_id, 1.0)
+            if weight <= 0:
+                weight = 1.0
+            tier = self.tiers.get(firm_id, DEFAULT_TIER)
+            for k, case in enumerate(group):
+                keyed.append((tier, (k + 1) / weight, group_index, case))
+
+        keyed.sort(key=lambda item: item[:3])
+        return [item[3] for item in keyed], deferred
@@ -1,17 +1,15 @@
-from typing import List, Optional
+from typing import Dict, List, Optional, Sequence, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import text
 from datetime import datetime
 
 from app.schema.case_schema import (
-    CaseHistoryResponse,
     CaseHistoryEventType,
     CaseHistoryEventType2,
     CaseRelatedUsers,
     CaseResponseForParser,
     CaseStatus,
     ClientResponse,
-    TrialInfoResponse,
 )
 from app.schema.notification_schema import (
     NotificationAction,
@@ -19,47 +17,199 @@ from app.schema.notification_schema import (
     NotificationType,
 )
 
+# 기존 이력/기일을 파싱 결과와 비교하기 위한 행(id 뒤 필드 순서는 파싱 결과와 같음).
+# 날짜/시각은 ParseCaseService.date_fmt/time_fmt 와 같은 형식의 KST 문자열입니다.
+HistoryRecord = Tuple[int, str, str, Optional[str]]  # (id, date, content, result)
+TrialInfoRecord = Tuple[
+    int, str, str, str, str, Optional[str]
+]  # (id, date, time, type, location, result)
+
+# ParseCaseService.date_fmt("%Y.%m.%d"), time_fmt("%H:%M") 에 대응하는 PostgreSQL 형식
+PG_DATE_FMT = "YYYY.MM.DD"
+PG_TIME_FMT = "HH24:MI"
+
+
+# 사건마다 반복하는 쿼리는 같은 SQL 문자열로 prepared statement 캐시를 재사용하도록 모듈 상수로 둡니다.
+_HISTORY_RECORDS_SQL = text(
+    """
+    SELECT
+        his.id
+        , to_char(his.created_at AT TIME ZONE 'Asia/Seoul', :date_fmt)
+        , his.details
+        , his.result
+    FROM erp_case_histories his
+    WHERE 
+        his.case_id = :case_id
+        AND his.event_type = :event_type
+    ORDER BY his.created_at, his.id
+    """
+)
+
+_INSERT_HISTORY_SQL = text(
+    """
+    INSERT INTO erp_case_histories (
+        case_id
+        , event_type
+        , event_type2
+        , prev_value
+        , curr_value
+        , details
+        , created_at
+        , result
+    )
+    VALUES (
+        :case_id
+        , :event_type
+        , :event_type2
+        , :prev_value
+        , :curr_value
+        , :details
+        , :created_at
+        , :result
+    )
+    RETURNING id
+    """
+)
+
+_INSERT_TRIAL_INFO_SQL = text(
+    """
+    INSERT INTO erp_case_trial_info (
+        case_id
+        , trial_date
+        , trial_agency
+        , trial_agency_address_detail
+        , trial_result
+        , trial_type
+        , source
+    )
+    VALUES (
+        :case_id
+        , :trial_date
+        , :trial_agency
+        , :trial_agency_address_detail
+        , :trial_result
+        , :trial_type
+        , :source
+    )
+    RETURNING id
+    """
+)
+
+_UPDATE_HISTORY_RESULT_SQL = text(
+    """
+    UPDATE erp_case_histories
+    SET result = :result
+    WHERE id = :id
+    """
+)
+
+_UPDATE_TRIAL_INFO_SQL = text(
+    """
+    UPDATE erp_case_trial_info
+    SET
+        trial_agency_address_detail = :trial_agency_address_detail
+        , trial_result = :trial_result
+    WHERE id = :id
+    """
+)
+
+_TRIAL_INFO_RECORDS_SQL = text(
+    """
+    SELECT
+        trial.id
+        , to_char(trial.trial_date AT TIME ZONE 'Asia/Seoul', :date_fmt)
+        , to_char(trial.trial_date AT TIME ZONE 'Asia/Seoul', :time_fmt)
+        , trial.trial_type
+        , trial.trial_agency_address_detail
+        , trial.trial_result
+    FROM erp_case_trial_info trial
+    WHERE 
+        trial.case_id = :case_id
+        AND trial.source = :source
+    ORDER BY trial.trial_date, trial.id
+    """
+)
+
+# COPY 로 여러 건 저장할 때의 컬럼(일괄 가져오기, app.backfill)
+HISTORY_COPY_COLUMNS = (
+    "case_id",
+    "event_type",
+    "event_type2",
+    "prev_value",
+    "curr_value",
+    "details",
+    "created_at",
+    "result",
+)
+TRIAL_INFO_COPY_COLUMNS = (
+    "case_id",
+    "trial_date",
+    "trial_agency",
+    "trial_agency_address_detail",
+    "trial_result",
+    "trial_type",
+    "source",
+)
+
+_CASE_JURISDICTIONS_SQL = text(
+    """
+    SELECT id, jurisdiction
+    FROM erp_cases
+    WHERE id = ANY(:case_ids)
+    """
+)
+
+# 스케줄러 대상 사건에 입력된 관할법원명(정규화 전 값)
+_SCHEDULER_JURISDICTIONS_SQL = text(
+    """
+    SELECT DISTINCT jurisdiction
+    FROM erp_cases
+    WHERE case_number IS NOT NULL
+      AND jurisdiction IS NOT NULL
+      AND status != :status
+    """
+)
+
+# 파싱 이력을 여러 건 한 번에 기록합니다.(배열 파라미터라 건수와 관계없이 같은 prepared statement)
+_INSERT_PARSE_HISTORIES_SQL = text(
+    """
+    INSERT INTO erp_supremecourt_parse_history (
+        case_id
+        , method
+        , result
+    )
+    SELECT * FROM UNNEST(
+        CAST(:case_ids AS BIGINT[])
+        , CAST(:methods AS TEXT[])
+        , CAST(:results AS TEXT[])
+    )
+    """
+)
+
 
 class MyCaseService:
     def __init__(self, db: AsyncSession):
         self.db = db
 
-    async def get_supremCourt_history_by_case_id(
+    async def get_supremCourt_history_records_by_case_id(
         self, case_id: int
-    ) -> List[CaseHistoryResponse]:
+    ) -> List[HistoryRecord]:
         """
-        대법원 나의 사건 정보를 통해 입력된 사건 이력 중 마지막 이력을 조회합니다.
-        마지막 이력은 새로 받아온 정보 중에서 추가할 이력이 있는지 판단하기 위해 사용됩니다.
+        대법원 나의 사건 정보를 통해 입력된 사건 이력을 (id, date, content, result) 로 조회합니다.
 
-        날짜는 같은 날짜(동일 시간)가 있으므로, id 기준으로 정렬하여 마지막 이력을 조회합니다.
+        스케줄러에서 새 이력/결과가 바뀐 이력을 고르는 용도로, 응답 스키마로 변환하지 않고
+        날짜를 KST 문자열로 바꾼 튜플을 오래된 순서로 돌려줍니다.
         """
 
         result = await self.db.execute(
-            text(
-                """
-            SELECT
-                his.id
-                , his.case_id
-                , his.event_type
-                , his.event_type2
-                , his.details
-                , his.created_at
-                , his.result
-            FROM erp_case_histories his
-            WHERE 
-                his.case_id = :case_id
-                AND his.event_type = :event_type
-            ORDER BY his.id DESC
-            """
-            ),
-            {"case_id": case_id, "event_type": CaseHistoryEventType.COURT.value},
+            _HISTORY_RECORDS_SQL,
+            {
+                "case_id": case_id,
+                "event_type": CaseHistoryEventType.COURT.value,
+                "date_fmt": PG_DATE_FMT,
+            },
         )
-        rows = result.fetchall()
-
-        if not rows:
-            return []
-
-        return [CaseHistoryResponse.model_validate(row) for row in rows]
+        return list(result.tuples())
 
     async def create_case_history_from_supremCourt_history(
         self,
@@ -79,31 +229,7 @@ class MyCaseService:
         """
 
         result = await self.db.execute(
-            text(
-                """
-            INSERT INTO erp_case_histories (
-                case_id
-                , event_type
-                , event_type2
-                , prev_value
-                , curr_value
-                , details
-                , created_at
-                , result
-            )
-            VALUES (
-                :case_id
-                , :event_type
-                , :event_type2
-                , :prev_value
-                , :curr_value
-                , :details
-                , :created_at
-                , :result
-            )
-            RETURNING id
-            """
-            ),
+            _INSERT_HISTORY_SQL,
             {
                 "case_id": case_id,
                 "event_type": CaseHistoryEventType.COURT.value,
@@ -137,29 +263,7 @@ class MyCaseService:
         """
 
         result = await self.db.execute(
-            text(
-                """
-            INSERT INTO erp_case_trial_info (
-                case_id
-                , trial_date
-                , trial_agency
-                , trial_agency_address_detail
-                , trial_result
-                , trial_type
-                , source
-            )
-            VALUES (
-                :case_id
-                , :trial_date
-                , :trial_agency
-                , :trial_agency_address_detail
-                , :trial_result
-                , :trial_type
-                , :source
-            )
-            RETURNING id
-            """
-            ),
+            _INSERT_TRIAL_INFO_SQL,
             {
                 "case_id": case_id,
                 "trial_date": trial_date,
@@ -174,46 +278,153 @@ class MyCaseService:
 
         return row.id if row else 0
 
-    async def get_trial_info_by_case_id(self, case_id: int) -> List[TrialInfoResponse]:
+    async def copy_case_histories_from_supremCourt_history(
+        self, rows: Sequence[Tuple[int, datetime, str, Optional[str]]]
+    ) -> int:
         """
-        ### 사건 변론기일 정보 중 마지막 변론기일을 조회합니다.
-        마지막 변론기일은 새로 받아온 정보 중에서 추가할 변론기일이 있는지 판단하기 위해 사용됩니다.
+        대법원 사건 이력 여러 건을 COPY 로 저장합니다.(일괄 가져오기)
+        create_case_history_from_supremCourt_history 와 같은 값으로 저장하고, 저장한 행 수를 돌려줍니다.
 
-        날짜는 같은 날짜(동일 시간)가 있으므로, trial_date 기준으로 정렬하여 마지막 변론기일을 조회합니다.
+        rows: (case_id, created_at, content, trial_result) 목록
         """
 
-        result = await self.db.execute(
-            text(
-                """
-            SELECT
-                trial.id
-                , trial.case_id
-                , trial.trial_date
-                , trial.trial_type
-                , trial.trial_agency_address_detail
-                , trial.trial_result
-            FROM erp_case_trial_info trial
-            WHERE 
-                trial.case_id = :case_id
-                AND trial.source = :source
-            ORDER BY trial.trial_date DESC
-            """
-            ),
-            {"case_id": case_id, "source": CaseHistoryEventType.COURT.value},
+        if not rows:
+            return 0
+
+        court = CaseHistoryEventType.COURT.value
+        etc = CaseHistoryEventType2.ETC.value
+        return await self._copy_records(
+            "erp_case_histories",
+            HISTORY_COPY_COLUMNS,
+            [
+                (case_id, court, etc, None, None, content, created_at, trial_result)
+                for case_id, created_at, content, trial_result in rows
+            ],
         )
-        rows = result.fetchall()
+
+    async def copy_trial_info_from_supremCourt_history(
+        self,
+        rows: Sequence[
+            Tuple[int, datetime, Optional[str], Optional[str], Optional[str], Optional[str]]
+        ],
+    ) -> int:
+        """
+        대법원 사건 변론기일 여러 건을 COPY 로 저장합니다.(일괄 가져오기)
+        create_trial_info_from_supremCourt_history 와 같은 값으로 저장하고, 저장한 행 수를 돌려줍니다.
+
+        rows: (case_id, trial_date, trial_agency, trial_agency_address_detail, trial_result, trial_type) 목록
+        """
 
         if not rows:
-            return []
+            return 0
 
-        return [TrialInfoResponse.model_validate(row) for row in rows]
+        court = CaseHistoryEventType.COURT.value
+        return await self._copy_records(
+            "erp_case_trial_info",
+            TRIAL_INFO_COPY_COLUMNS,
+            [row + (court,) for row in rows],
+        )
+
+    async def _copy_records(
+        self, table: str, columns: Sequence[str], records: List[Tuple]
+    ) -> int:
+        # 세션의 트랜잭션 안에서 asyncpg 커넥션으로 COPY 합니다.(커밋은 호출하는 쪽에서)
+        connection = await self.db.connection()
+        raw = await connection.get_raw_connection()
+        await raw.driver_connection.copy_records_to_table(
+            table, records=records, columns=list(columns)
+        )
+        return len(records)
+
+    async def get_case_jurisdictions(
+        self, case_ids: Sequence[int]
+    ) -> Dict[int, Optional[str]]:
+        """
+        사건 ID 별 관할법원을 조회합니다. 없는 사건은 결과에 없습니다.(종결 사건 포함)
+        """
+
+        result = await self.db.execute(
+            _CASE_JURISDICTIONS_SQL, {"case_ids": list(case_ids)}
+        )
+        return {row.id: row.jurisdiction for row in result.fetchall()}
+
+    async def get_scheduler_jurisdictions(self) -> List[str]:
+        """
+        스케줄러 대상 사건에 입력된 관할법원명 목록을 조회합니다.(입력한 그대로, 중복 제거)
+        """
+
+        result = await self.db.execute(
+            _SCHEDULER_JURISDICTIONS_SQL, {"status": CaseStatus.CLOSE.value}
+        )
+        return [row.jurisdiction for row in result.fetchall()]
+
+    async def update_case_history_result_from_supremCourt_history(
+        self, history_id: int, trial_result: Optional[str] = None
+    ) -> None:
+        """
+        대법원 나의 사건 정보에서 결과가 바뀐 사건 이력의 결과를 수정합니다.
+        """
+
+        await self.db.execute(
+            _UPDATE_HISTORY_RESULT_SQL,
+            {"id": history_id, "result": trial_result},
+        )
+
+    async def update_trial_info_from_supremCourt_history(
+        self,
+        trial_info_id: int,
+        trial_agency_address_detail: Optional[str] = None,
+        trial_result: Optional[str] = None,
+    ) -> None:
+        """
+        대법원 나의 사건 정보에서 장소/결과가 바뀐 사건 변론기일을 수정합니다.
+        """
+
+        await self.db.execute(
+            _UPDATE_TRIAL_INFO_SQL,
+            {
+                "id": trial_info_id,
+                "trial_agency_address_detail": trial_agency_address_detail,
+                "trial_result": trial_result,
+            },
+        )
+
+    async def get_trial_info_records_by_case_id(
+        self, case_id: int
+    ) -> List[TrialInfoRecord]:
+        """
+        사건 변론기일을 (id, date, time, type, location, result) 로 조회합니다.
+
+        스케줄러에서 새 변론기일/결과가 바뀐 변론기일을 고르는 용도로, 응답 스키마로 변환하지 않고
+        일자/시각을 KST 문자열로 바꾼 튜플을 기일 순서로 돌려줍니다.
+        """
+
+        result = await self.db.execute(
+            _TRIAL_INFO_RECORDS_SQL,
+            {
+                "case_id": case_id,
+                "source": CaseHistoryEventType.COURT.value,
+                "date_fmt": PG_DATE_FMT,
+                "time_fmt": PG_TIME_FMT,
+            },
+        )
+        return list(result.tuples())
 
     async def get_case_list_for_scheduler(
-        self, skip: int, limit: int
+        self,
+        skip: int,
+        limit: int,
+        case_ids: Optional[List[int]] = None,
+        firm_id: Optional[int] = None,
+        jurisdictions: Optional[List[str]] = None,
     ) -> List[CaseResponseForParser]:
         """
         나의 사건 정보 업데이를 위한 사건 목록 조회입니다.
         모든 사건을 조회하기 때문에 유저의 요청이 아닌 스케줄러에서만 사용하기 바랍니다.
+
+        case_ids: 지정하면 해당 사건 중 스케줄러 대상인 사건만 조회합니다.
+        firm_id: 지정하면 해당 조직의 사건만 조회합니다.
+        jurisdictions: 지정하면 관할법원명이 목록에 있는 사건만 조회합니다.(입력한 그대로 비교)
         """
 
         results = await self.db.execute(
@@ -255,13 +466,23 @@ class MyCaseService:
             ec.case_number IS NOT NULL
             AND ec.jurisdiction IS NOT NULL
             AND ec.status != :status
+            {"AND ec.id = ANY(:case_ids)" if case_ids else ""}
+            {"AND ec.firm_id = :firm_id" if firm_id else ""}
+            {"AND ec.jurisdiction = ANY(:jurisdictions)" if jurisdictions else ""}
         ORDER BY 
             ec.id ASC
         LIMIT :limit
         OFFSET :skip
         """
             ),
-            {"skip": skip, "limit": limit, "status": CaseStatus.CLOSE.value},
+            {
+                "skip": skip,
+                "limit": limit,
+                "status": CaseStatus.CLOSE.value,
+                "case_ids": case_ids,
+                "firm_id": firm_id,
+                "jurisdictions": jurisdictions,
+            },
         )
         rows = results.fetchall()
 
@@ -274,6 +495,74 @@ class MyCaseService:
 
         return cases
 
+    async def count_cases_for_scheduler(self) -> int:
+        """
+        스케줄러 대상 사건 수를 조회합니다.(진행률 표시용)
+        get_case_list_for_scheduler 의 조건과 같아야 합니다.
+        """
+
+        result = await self.db.execute(
+            text(
+                """
+        SELECT 
+            COUNT(*)
+        FROM 
+            erp_cases ec
+        WHERE 
+            ec.case_number IS NOT NULL
+            AND ec.jurisdiction IS NOT NULL
+            AND ec.status != :status
+        """
+            ),
+            {"status": CaseStatus.CLOSE.value},
+        )
+
+        return result.scalar() or 0
+
+    async def get_next_trial_dates(self) -> Dict[int, datetime]:
+        """
+        스케줄러 대상 사건별 다가오는 가장 빠른 기일(법원 사건 정보로 등록된 기일)을 조회합니다.
+        실행 시간대 안에서 조회 순서(기일이 가까운 사건 먼저)를 정할 때 사용합니다.
+        """
+
+        result = await self.db.execute(
+            text(
+                """
+        SELECT
+            trial.case_id
+            , MIN(trial.trial_date) AS next_trial_date
+        FROM
+            erp_case_trial_info trial
+        INNER JOIN erp_cases ec
+            ON ec.id = trial.case_id
+        WHERE
+            trial.source = :source
+            AND trial.trial_date >= now()
+            AND ec.status != :status
+        GROUP BY trial.case_id
+        """
+            ),
+            {
+                "source": CaseHistoryEventType.COURT.value,
+                "status": CaseStatus.CLOSE.value,
+            },
+        )
+
+        return {row.case_id: row.next_trial_date for row in result.fetchall()}
+
+    async def get_case_for_scheduler(
+        self, case_id: int
+    ) -> Optional[CaseResponseForParser]:
+        """
+        스케줄러 대상 사건 1건을 조회합니다. 대상이 아니면(종결 등) None 을 돌려줍니다.
+        """
+
+        cases = await self.get_case_list_for_scheduler(
+            skip=0, limit=1, case_ids=[case_id]
+        )
+
+        return cases[0] if cases else None
+
     async def get_related_users(
         self, author_id: int, firm_id: Optional[int] = None
     ) -> List[CaseRelatedUsers]:
@@ -409,28 +698,25 @@ class MyCaseService:
 
         return clients
 
-    async def create_supremecourt_parse_history(
-        self, case_id: int, method: str | None, result: str | None
+    async def create_supremecourt_parse_histories(
+        self, records: Sequence[Tuple[int, str | None, str | None]]
     ) -> None:
         """
         캡차 크래커를 이용해서 나의사건정보를 파싱한 이력을 기록
+        records: (case_id, method, result) 목록. 한 번의 INSERT 로 기록합니다.(ParseHistoryWriter)
         """
 
+        if not records:
+            return None
+
+        case_ids, methods, results = zip(*records)
         await self.db.execute(
-            text(
-                """
-            INSERT INTO erp_supremecourt_parse_history (
-                case_id
-                , method
-                , result
-            ) VALUES (
-                :case_id
-                , :method
-                , :result
-            )
-            """
-            ),
-            {"case_id": case_id, "method": method, "result": result},
+            _INSERT_PARSE_HISTORIES_SQL,
+            {
+                "case_ids": list(case_ids),
+                "methods": list(methods),
+                "results": list(results),
+            },
         )
 
         return None
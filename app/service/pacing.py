@@ -0,0 +1,85 @@
+"""
+실행 시간대(window) 설정과 조회 간격 조절
+
+RUN_WINDOWS="07:00-09:30,16:00-17:00" 처럼 실행 시간대를 지정하면 시간대마다 한 번씩 실행하고,
+대상 사건을 시간대 안에 고르게 나눠서 조회합니다.(캡차 서버에 한꺼번에 몰리지 않도록)
+"""
+
+import asyncio
+import time
+from datetime import datetime, timedelta
+from datetime import time as dtime
+from typing import List, Optional, Tuple
+
+
+def parse_run_windows(value: str) -> List[Tuple[dtime, dtime]]:
+    """
+    "HH:MM-HH:MM" 를 쉼표로 이어 붙인 설정값을 (시작, 종료) 목록으로 바꿉니다.
+    종료가 시작보다 이르면 다음 날 종료로 봅니다.
+    """
+
+    windows = []
+    for part in value.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        try:
+            start, end = (
+                datetime.strptime(t.strip(), "%H:%M").time() for t in part.split("-")
+            )
+        except ValueError:
+            raise ValueError(f"RUN_WINDOWS 형식이 잘못되었습니다.(HH:MM-HH:MM): {part}")
+        windows.append((start, end))
+    return windows
+
+
+def window_deadline(started_at: datetime, end: dtime) -> datetime:
+    """실행 시작 시각 기준으로 시간대 종료 시각을 구합니다."""
+
+    deadline = started_at.replace(
+        hour=end.hour, minute=end.minute, second=0, microsecond=0
+    )
+    if deadline <= started_at:
+        deadline += timedelta(days=1)
+    return deadline
+
+
+class DispatchPacer:
+    """
+    남은 사건을 마감 시각까지 고르게 나눠서 조회하도록 다음 조회 전 대기 시간을 정합니다.
+
+    매 사건 시작 시 (마감까지 남은 시간 / 남은 사건 수)를 다음 조회까지의 간격으로 잡으므로
+    앞에서 늦어지면 뒤로 갈수록 간격이 줄고, 마감이 지나면 기다리지 않고 바로 조회합니다.
+    """
+
+    def __init__(self, deadline: datetime):
+        self.deadline = deadline
+        self._next_at: Optional[float] = None
+
+    def seconds_left(self) -> float:
+        return (self.deadline - datetime.now(self.deadline.tzinfo)).total_seconds()
+
+    def dispatched(self, remaining: int) -> None:
+        """사건 1건 조회를 시작할 때 호출합니다. remaining 은 이번 사건을 포함한 남은 사건 수"""
+
+        interval = max(self.seconds_left(), 0.0) / max(remaining, 1)
+        self._next_at = time.monotonic() + interval
+
+    async def wait(self, stop: Optional[asyncio.Event] = None) -> None:
+        """
+        다음 사건 조회 차례까지 기다립니다.
+        stop 이 설정되면(종료 요청) 바로 돌아옵니다.
+        """
+
+        if self._next_at is None:
+            return
+        delay = self._next_at - time.monotonic()
+        if delay <= 0:
+            return
+        if stop is None:
+            await asyncio.sleep(delay)
+            return
+        try:
+            await asyncio.wait_for(stop.wait(), timeout=delay)
+        except asyncio.TimeoutError:
+            pass
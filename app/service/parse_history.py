@@ -0,0 +1,117 @@
+"""
+파싱 이력(erp_supremecourt_parse_history) 모아서 기록하기
+
+파싱 이력은 사건마다 한 행씩 남기는 감사 로그라서 사건 트랜잭션과 따로 버퍼에 모았다가
+batch_size 건이 쌓이거나 flush_seconds 가 지나면 별도 세션에서 한 번의 INSERT 로 기록합니다.
+종료 시(close) 남은 이력을 모두 기록합니다.
+
+- 행은 기록 시점의 created_at 으로 남으므로 실제 조회 시각보다 최대 flush_seconds 늦을 수 있습니다.
+- 기록에 실패하면 버퍼 앞쪽에 되돌려 다음에 다시 기록하고, max_buffer 를 넘으면 오래된 이력부터 버립니다.
+"""
+
+import asyncio
+import logging
+from typing import List, NamedTuple, Optional
+
+from app.core.metrics import PARSE_HISTORY_BUFFERED, PARSE_HISTORY_ROWS
+from app.core.session import AsyncSessionLocal
+from app.service.mycase import MyCaseService
+
+logger = logging.getLogger(__name__)
+
+
+class ParseHistoryRecord(NamedTuple):
+    case_id: int
+    method: Optional[str]
+    result: Optional[str]
+
+
+class ParseHistoryWriter:
+    def __init__(self, batch_size: int, flush_seconds: float, max_buffer: int):
+        self.batch_size = max(batch_size, 1)
+        self.flush_seconds = flush_seconds
+        self.max_buffer = max(max_buffer, self.batch_size)
+        self._buffer: List[ParseHistoryRecord] = []
+        self._lock = asyncio.Lock()
+        self._full = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._closed = False
+
+    async def add(self, case_id: int, method: Optional[str], result: Optional[str]):
+        """
+        파싱 이력 1건을 버퍼에 넣습니다.
+        종료(close) 뒤에 들어온 이력은 바로 기록합니다.(종료 중에 끝난 일괄 조회 등)
+        """
+
+        self._buffer.append(ParseHistoryRecord(case_id, method, result))
+        PARSE_HISTORY_BUFFERED.set(len(self._buffer))
+        if self._closed:
+            await self.flush()
+            return
+
+        if self._task is None:
+            self._task = asyncio.create_task(self._flush_loop())
+        if len(self._buffer) >= self.batch_size:
+            self._full.set()
+
+    async def _flush_loop(self):
+        while True:
+            try:
+                await asyncio.wait_for(self._full.wait(), timeout=self.flush_seconds)
+            except asyncio.TimeoutError:
+                pass
+            self._full.clear()
+            await self.flush()
+
+    async def flush(self):
+        """버퍼의 이력을 모두 기록합니다."""
+
+        async with self._lock:
+            if not self._buffer:
+                return
+            records, self._buffer = self._buffer, []
+            try:
+                async with AsyncSessionLocal() as session:
+                    await MyCaseService(session).create_supremecourt_parse_histories(
+                        records
+                    )
+                    await session.commit()
+            except Exception as e:
+                logger.error(
+                    "파싱 이력 %d건을 기록하지 못해 다음에 다시 기록합니다. 오류: %s",
+                    len(records),
+                    str(e),
+                )
+                PARSE_HISTORY_ROWS.labels(result="retried").inc(len(records))
+                self._buffer[:0] = records
+                overflow = len(self._buffer) - self.max_buffer
+                if overflow > 0:
+                    logger.error("파싱 이력 버퍼가 가득 차서 오래된 이력 %d건을 버립니다.", overflow)
+                    PARSE_HISTORY_ROWS.labels(result="dropped").inc(overflow)
+                    del self._buffer[:overflow]
+            else:
+                PARSE_HISTORY_ROWS.labels(result="written").inc(len(records))
+            finally:
+                PARSE_HISTORY_BUFFERED.set(len(self._buffer))
+
+    async def close(self):
+        """주기 기록을 멈추고 남은 이력을 기록합니다."""
+
+        self._closed = True
+        if self._task is not None:
+            # 기록 중에 취소되지 않도록 진행 중인 기록이 끝난 뒤 취소합니다.
+            async with self._lock:
+                self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        await self.flush()
+        if self._buffer:
+            # 종료 후에는 다시 기록할 기회가 없으므로 로그로만 남깁니다.
+            logger.error(
+                "종료 시 파싱 이력 %d건을 기록하지 못했습니다. 사건: %s",
+                len(self._buffer),
+                ", ".join(str(record.case_id) for record in self._buffer),
+            )
+            PARSE_HISTORY_ROWS.labels(result="dropped").inc(len(self._buffer))
+            self._buffer = []
+            PARSE_HISTORY_BUFFERED.set(0)
@@ -1,52 +1,139 @@
-from datetime import datetime
+from datetime import datetime, timedelta
 from zoneinfo import ZoneInfo
 import re
-from typing import List, Optional, Tuple
+from typing import List, NamedTuple, Optional, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
 import httpx
 from bs4 import BeautifulSoup
 
-from app.schema.case_schema import CaseHistoryResponse, TrialInfoResponse
-from app.service.mycase import MyCaseService
+from app.core.metrics import (
+    STAGE_CAPTCHA_FETCH,
+    STAGE_DB_COMMIT,
+    STAGE_DB_DIFF,
+    STAGE_DB_INSERT,
+    STAGE_PARSE_HISTORY,
+    STAGE_PARSE_TRIAL,
+    track_stage,
+)
+from app.service.mycase import HistoryRecord, MyCaseService, TrialInfoRecord
+from app.service.row_diff import DIFF_INSERT, DIFF_UPDATE, RowChange, diff_rows
+from app.service.snapshot import (
+    SNAPSHOT_HISTORY,
+    SNAPSHOT_TRIAL,
+    CaseSnapshot,
+    CaseSnapshotService,
+    new_rows_since_snapshot,
+)
 
-from app.schema.base import SchemaBase
-from pydantic import Field
 import logging
 
 logger = logging.getLogger(__name__)
 
 
-class SupremCourtHistoryParsedResult(SchemaBase):
-    """대법원 사건 이력 파싱 결과 스키마"""
+class HistoryRow(NamedTuple):
+    """
+    대법원 사건 이력 파싱 결과(1행)
 
-    date: str = Field(..., description="일자")
-    content: str = Field(..., description="내용")
-    result: Optional[str] = Field(None, description="결과")
+    사건마다 수백 행을 만들기 때문에 pydantic 모델 대신 튜플을 사용합니다.
+    필드 순서가 HistoryRecord 의 id 뒤 필드와 같아서 행 자체를 기존 이력과 바로 비교할 수 있습니다.
+    API 응답에는 app.schema.refresh_schema 의 스키마로 변환해서 내보냅니다.
+    """
 
+    date: str
+    content: str
+    result: Optional[str] = None
 
-class SupremCourtTrialInfoParsedResult(SchemaBase):
-    """대법원 사건 변론기일 파싱 결과 스키마"""
 
-    date: str = Field(..., description="일자")
-    time: str = Field(..., description="시간")
-    type: str = Field(..., description="종류")
-    location: str = Field(..., description="장소")
-    result: Optional[str] = Field(None, description="결과")
+class TrialInfoRow(NamedTuple):
+    """대법원 사건 변론기일 파싱 결과(1행). 필드 순서가 TrialInfoRecord 의 id 뒤 필드와 같습니다."""
+
+    date: str
+    time: str
+    type: str
+    location: str
+    result: Optional[str] = None
+
+
+# 같은 행으로 볼 식별 필드 수(앞에서부터). 사건 이력: 일자/내용, 변론기일: 일자/시각/기일구분
+HISTORY_IDENTITY_SIZE = 2
+TRIAL_INFO_IDENTITY_SIZE = 3
+
+
+class RowUpdatePlan(NamedTuple):
+    """
+    사건 이력/변론기일 1종류의 반영 계획(ParseCaseService.plan_*_update)
+
+    inserts: 새로 추가할 행
+    updates: 기존 행을 수정할 행(결과/장소가 바뀐 행)
+    snapshot_matched: 마지막 반영 상태로 새 행을 골랐는지(아니면 기존 테이블과 전체 비교)
+    """
+
+    inserts: List[Tuple]
+    updates: List[RowChange]
+    snapshot_matched: bool
+
+    @property
+    def save_snapshot(self) -> bool:
+        """마지막 반영 상태를 새로 저장해야 하는지"""
+
+        return bool(self.inserts or self.updates or not self.snapshot_matched)
+
+
+def plan_from_changes(changes: List[RowChange]) -> RowUpdatePlan:
+    return RowUpdatePlan(
+        inserts=[c.row for c in changes if c.op == DIFF_INSERT],
+        updates=[c for c in changes if c.op == DIFF_UPDATE],
+        snapshot_matched=False,
+    )
+
+
+class CaptchaServerError(Exception):
+    """
+    캡차 서버(parse_case) 호출 실패
+
+    code: 서버가 돌려준 detail.code. 네트워크 오류는 "NETWORK", JSON 이 아닌 오류 응답은 "HTTP_{status}"
+    status: HTTP 상태 코드(네트워크 오류는 None)
+    """
+
+    def __init__(self, message: str, code: Optional[str] = None, status: Optional[int] = None):
+        super().__init__(message)
+        self.message = message
+        self.code = code
+        self.status = status
+
+
+class CaseParseError(Exception):
+    """응답 html 에서 사건 정보를 찾지 못한 경우"""
 
 
 class ParserUpdateResult:
+    """
+    history/trial_info: 새로 추가한 행
+    updated_history/updated_trial_info: 기존 행의 결과(변론기일은 장소 포함)가 바뀌어 수정한 행
+    """
+
     def __init__(
         self,
-        history: List[SupremCourtHistoryParsedResult],
-        trial_info: List[SupremCourtTrialInfoParsedResult],
+        history: List[HistoryRow],
+        trial_info: List[TrialInfoRow],
+        updated_history: Optional[List[HistoryRow]] = None,
+        updated_trial_info: Optional[List[TrialInfoRow]] = None,
     ):
         self.history = history
         self.trial_info = trial_info
+        self.updated_history = updated_history or []
+        self.updated_trial_info = updated_trial_info or []
 
 
 class ParseCaseService:
-    def __init__(self, db: AsyncSession | None = None):
+    def __init__(self, db: AsyncSession | None = None, autocommit: bool = True):
+        """
+        autocommit: False 이면 사건 이력/변론기일 업데이트 후 커밋하지 않고 오류도 그대로 올려보냅니다.
+            (호출하는 쪽에서 사건 1건의 쓰기를 한 트랜잭션으로 커밋할 때. CaseUnitOfWork)
+        """
+
         self.db = db
+        self.autocommit = autocommit
 
         # 여기서 날짜 포맷을 정의해서 공통으로 사용합시다.
         self.date_fmt = "%Y.%m.%d"
@@ -77,51 +164,56 @@ class ParseCaseService:
             "sa_serial": sa_serial,
             "ds_nm": ds_nm,
         }
-        try:
-            async with httpx.AsyncClient(
-                follow_redirects=True, timeout=httpx.Timeout(30.0)
-            ) as client:
-                response = await client.post(
-                    url,
-                    data=form_data,
-                    headers={"Content-Type": "application/x-www-form-urlencoded"},
-                )
-
-                # 성공 케이스
-                if 200 <= response.status_code < 300:
-                    return response.text
-
-                # 에러 케이스: 의도된(JSON) vs 비의도(plain string)를 구분
-                status = response.status_code
-                body_text = response.text
-                try:
-                    payload = response.json()
-                except ValueError:
-                    payload = None
-
-                if (
-                    isinstance(payload, dict)
-                    and isinstance(payload.get("detail"), dict)
-                    and "code" in payload["detail"]
-                    and "message" in payload["detail"]
-                ):
-                    detail = payload["detail"]
-                    logger.error(
-                        f"사건 정보 조회중 에러가 발생했습니다. message={detail.get('message')}",
-                    )
-                    raise Exception(
-                        f"{detail.get('message') or '상대 서버측의 알 수 없는 오류'}",
+        with track_stage(STAGE_CAPTCHA_FETCH):
+            try:
+                async with httpx.AsyncClient(
+                    follow_redirects=True, timeout=httpx.Timeout(30.0)
+                ) as client:
+                    response = await client.post(
+                        url,
+                        data=form_data,
+                        headers={"Content-Type": "application/x-www-form-urlencoded"},
                     )
-                else:
-                    raise Exception("사건 정보 조회중 에러가 발생했습니다.")
-        except httpx.RequestError as e:
-            # 네트워크 계층 오류 (연결/타임아웃 등)
-            logger.error(f"네트워크 요청이 실패했습니다. {str(e)}")
-            raise Exception("네트워크 요청 실패")
-
-    async def parse_history_from_html(
-        self, html: str
-    ) -> List[SupremCourtHistoryParsedResult]:
+
+                    # 성공 케이스
+                    if 200 <= response.status_code < 300:
+                        return response.text
+
+                    # 에러 케이스: 의도된(JSON) vs 비의도(plain string)를 구분
+                    status = response.status_code
+                    body_text = response.text
+                    try:
+                        payload = response.json()
+                    except ValueError:
+                        payload = None
+
+                    if (
+                        isinstance(payload, dict)
+                        and isinstance(payload.get("detail"), dict)
+                        and "code" in payload["detail"]
+                        and "message" in payload["detail"]
+                    ):
+                        detail = payload["detail"]
+                        logger.error(
+                            f"사건 정보 조회중 에러가 발생했습니다. message={detail.get('message')}",
+                        )
+                        raise CaptchaServerError(
+                            f"{detail.get('message') or '상대 서버측의 알 수 없는 오류'}",
+                            code=str(detail.get("code")),
+                            status=status,
+                        )
+                    else:
+                        raise CaptchaServerError(
+                            "사건 정보 조회중 에러가 발생했습니다.",
+                            code=f"HTTP_{status}",
+                            status=status,
+                        )
+            except httpx.RequestError as e:
+                # 네트워크 계층 오류 (연결/타임아웃 등)
+                logger.error(f"네트워크 요청이 실패했습니다. {str(e)}")
+                raise CaptchaServerError("네트워크 요청 실패", code="NETWORK")
+
+    async def parse_history_from_html(self, html: str) -> List[HistoryRow]:
         """
         ### beautifulsoup 를 사용하여 html로 부터 사건의 사건 이력을 파싱합니다.
 
@@ -158,7 +250,7 @@ class ParseCaseService:
                 break
 
         if not target_tables:
-            raise Exception("사건 진행 내용에 해당하는 테이블을 찾을 수 없습니다.")
+            raise CaseParseError("사건 진행 내용에 해당하는 테이블을 찾을 수 없습니다.")
 
         parsed_results = []
         # 테이블 바디(tbody)에서 각 tr > td를 찾고 문자열을 가져옵니다.
@@ -175,18 +267,12 @@ class ParseCaseService:
                     date = tds[0].get_text(strip=True)
                     content = tds[1].get_text(strip=True)
                     result = tds[2].get_text(strip=True)
-                    parsed_results.append(
-                        SupremCourtHistoryParsedResult(
-                            date=date, content=content, result=result
-                        )
-                    )
+                    parsed_results.append(HistoryRow(date, content, result))
 
-        logger.debug(f"[이력 파싱 완료] 사건 이력: {len(parsed_results)} 건")
+        logger.debug("[이력 파싱 완료] 사건 이력: %d 건", len(parsed_results))
         return parsed_results
 
-    async def parse_trial_info_from_html(
-        self, html: str
-    ) -> List[SupremCourtTrialInfoParsedResult]:
+    async def parse_trial_info_from_html(self, html: str) -> List[TrialInfoRow]:
         """
         html 에서 사건 변론기일(공판기일, 선고기일 등)을 파싱합니다.
 
@@ -240,214 +326,270 @@ class ParseCaseService:
                     location = tds[3].get_text(strip=True)
                     result = tds[4].get_text(strip=True)
                     parsed_results.append(
-                        SupremCourtTrialInfoParsedResult(
-                            date=date,
-                            time=time,
-                            type=type,
-                            location=location,
-                            result=result,
-                        )
+                        TrialInfoRow(date, time, type, location, result)
                     )
                     logger.debug(
-                        f"[변론기일 파싱] {date} {time} {type} {location} {result}"
+                        "[변론기일 파싱] %s %s %s %s %s",
+                        date,
+                        time,
+                        type,
+                        location,
+                        result,
                     )
 
-        logger.debug(f"[이력 파싱 완료] 사건 변론기일: {len(parsed_results)} 건")
+        logger.debug("[이력 파싱 완료] 사건 변론기일: %d 건", len(parsed_results))
         return parsed_results
 
-    async def filter_history_for_update(
+    async def diff_history_for_update(
         self,
-        parsed_results: List[SupremCourtHistoryParsedResult],
-        case_histories: List[CaseHistoryResponse],
-    ) -> List[SupremCourtHistoryParsedResult]:
+        parsed_results: List[HistoryRow],
+        existing_records: List[HistoryRecord],
+    ) -> List[RowChange]:
         """
-        사건 이력 중 새로 받아온 사건 이력과
-        기존 사건 이력을 모두 비교하여
-        새로 받아온 사건 이력 중 추가할 사건 이력을 필터링합니다.
-        """
-
-        if not case_histories:
-            return parsed_results
-
-        # 사전에 기존 이력 키(date, content, result)를 set 로 변환
-        existing_keys = {
-            (
-                ch.created_at.astimezone(self.tz).strftime(self.date_fmt),
-                ch.details,
-                ch.result,
-            )
-            for ch in case_histories
-        }
+        새로 받아온 사건 이력과 기존 사건 이력을 순서대로 비교하여
+        추가할 사건 이력(insert)과 결과가 바뀐 사건 이력(update)을 찾습니다.
 
-        # 필터링된 목록(새 객체로)
-        filtered = [
-            pr
-            for pr in parsed_results
-            if (pr.date, pr.content, pr.result) not in existing_keys
-        ]
+        existing_records: 기존 사건 이력의 (id, date, content, result)
+            (MyCaseService.get_supremCourt_history_records_by_case_id)
+        일자/내용이 같은 기존 이력이 있으면 같은 이력으로 봅니다.
+        """
 
-        return filtered
+        return diff_rows(parsed_results, existing_records, HISTORY_IDENTITY_SIZE)
 
-    async def filter_trial_info_for_update(
+    async def diff_trial_info_for_update(
         self,
-        parsed_results: List[SupremCourtTrialInfoParsedResult],
-        trial_info: List[TrialInfoResponse],
-    ):
-        """
-        사건 변론기일 중 새로 받아온 사건 변론기일과
-        기존 사건 변론기일을 비교하여
-        새로 받아온 사건 변론기일 중 추가할 사건 변론기일이 있는지 판단합니다.
+        parsed_results: List[TrialInfoRow],
+        existing_records: List[TrialInfoRecord],
+    ) -> List[RowChange]:
         """
+        새로 받아온 사건 변론기일과 기존 사건 변론기일을 순서대로 비교하여
+        추가할 변론기일(insert)과 장소/결과가 바뀐 변론기일(update)을 찾습니다.
 
-        if not trial_info:
-            return parsed_results
-
-        # 사전에 기존 변론기일 키(trial_date 등)를 set 로 변환
-        existing_keys = {
-            (
-                ti.trial_date.astimezone(self.tz).strftime(self.date_fmt),
-                ti.trial_date.astimezone(self.tz).strftime(self.time_fmt),
-                ti.trial_type,
-                ti.trial_agency_address_detail,
-                ti.trial_result,
-            )
-            for ti in trial_info
-        }
-
-        # 필터링된 목록(새 객체로)
-        filtered = [
-            pr
-            for pr in parsed_results
-            if (
-                pr.date,
-                pr.time,
-                pr.type,
-                pr.location,
-                pr.result,
-            )
-            not in existing_keys
-        ]
+        existing_records: 기존 변론기일의 (id, date, time, type, location, result)
+            (MyCaseService.get_trial_info_records_by_case_id)
+        일자/시각/기일구분이 같은 기존 변론기일이 있으면 같은 변론기일로 봅니다.
+        """
 
-        return filtered
+        return diff_rows(parsed_results, existing_records, TRIAL_INFO_IDENTITY_SIZE)
 
     async def update_case_history(
         self,
         html: str,
         case_id: int,
-    ) -> List[SupremCourtHistoryParsedResult]:
+        snapshot: Optional[CaseSnapshot] = None,
+    ) -> Tuple[List[HistoryRow], List[HistoryRow]]:
         """
-        사건 이력 중 새로 받아온 사건 이력과
-        기존 사건 이력 중 마지막 사건 이력을 비교하여
-        새로 받아온 사건 이력 중 추가할 사건 이력을 필터링합니다.
+        새로 받아온 사건 이력과 기존 사건 이력을 비교하여
+        새 사건 이력은 추가하고, 결과가 바뀐 사건 이력은 기존 행을 수정합니다.
+        (추가한 사건 이력, 결과가 바뀐 사건 이력)을 돌려줍니다.
+
+        snapshot: 사건의 마지막 반영 상태. 앞부분이 같으면 기존 사건 이력을 조회하지 않습니다.
         """
 
         logger.debug(
-            f"[업데이트 시작] case_id: {case_id}에 대한 사건 이력을 DB 에 업데이트 합니다."
+            "[업데이트 시작] case_id: %s에 대한 사건 이력을 DB 에 업데이트 합니다.",
+            case_id,
         )
 
         if not self.db:
             raise Exception("db is not initialized")
 
         # 사건 이력을 파싱합니다.
-        parsed_results = await self.parse_history_from_html(html)
+        with track_stage(STAGE_PARSE_HISTORY):
+            parsed_results = await self.parse_history_from_html(html)
 
-        # 대법원 사건 이력을 조회합니다.
         case_history_repository = MyCaseService(self.db)
-        case_histories = (
-            await case_history_repository.get_supremCourt_history_by_case_id(case_id)
-        )
-
-        # 사건 이력 중 새로 받아온 사건 이력과 기존 사건 이력을 모두 비교하여
-        # 새로 받아온 사건 이력 중 추가할 사건 이력을 필터링합니다.
-        filtered_results = await self.filter_history_for_update(
-            parsed_results,
-            case_histories,
-        )
+        plan = await self.plan_history_update(case_id, parsed_results, snapshot)
 
         try:
             # 사건 이력 중 새로 받아온 사건 이력 중 추가할 사건 이력을 추가합니다.
-            from datetime import timedelta
-
-            for idx, parsed_result in enumerate(filtered_results):
-                # 사건 이력의 날짜를 datetime으로 변환하고
-                # seconds를 추가하여 사건 이력의 날짜를 구분합니다.(순서 보장)
-                base_dt = datetime.strptime(parsed_result.date, self.date_fmt).replace(
-                    tzinfo=self.tz
-                )
-                dt_with_seconds = base_dt + timedelta(seconds=idx)
-                await case_history_repository.create_case_history_from_supremCourt_history(
-                    case_id=case_id,
-                    date=dt_with_seconds,
-                    content=parsed_result.content,
-                    trial_result=parsed_result.result,
-                )
-            await self.db.commit()
+            with track_stage(STAGE_DB_INSERT):
+                for idx, parsed_result in enumerate(plan.inserts):
+                    await case_history_repository.create_case_history_from_supremCourt_history(
+                        case_id=case_id,
+                        date=self.history_created_at(parsed_result, idx),
+                        content=parsed_result.content,
+                        trial_result=parsed_result.result,
+                    )
+                # 결과가 바뀐 사건 이력은 새로 추가하지 않고 기존 행의 결과를 수정합니다.
+                for change in plan.updates:
+                    await case_history_repository.update_case_history_result_from_supremCourt_history(
+                        history_id=change.existing_id,
+                        trial_result=change.row.result,
+                    )
+                if plan.save_snapshot:
+                    await CaseSnapshotService(self.db).save_history(
+                        case_id, parsed_results
+                    )
+            if self.autocommit:
+                with track_stage(STAGE_DB_COMMIT):
+                    await self.db.commit()
             logger.debug(
-                f"[업데이트 완료] case_id: {case_id}에 대한 사건 이력을 DB 에 업데이트 완료."
+                "[업데이트 완료] case_id: %s에 대한 사건 이력을 DB 에 업데이트 완료.",
+                case_id,
             )
         except Exception as e:
+            if not self.autocommit:
+                raise
             await self.db.rollback()
             logger.error(f"Error occurred while updating case history: {str(e)}")
 
-        return filtered_results
+        return plan.inserts, [c.row for c in plan.updates]
+
+    async def plan_history_update(
+        self,
+        case_id: int,
+        parsed_results: List[HistoryRow],
+        snapshot: Optional[CaseSnapshot] = None,
+    ) -> RowUpdatePlan:
+        """
+        새로 받아온 사건 이력 중 추가할 사건 이력과 결과가 바뀐 사건 이력을 고릅니다.(DB 는 읽기만 합니다)
+
+        snapshot: 사건의 마지막 반영 상태. 앞부분이 같으면 기존 사건 이력을 조회하지 않습니다.
+        """
+
+        with track_stage(STAGE_DB_DIFF):
+            if snapshot is None:
+                snapshot = await CaseSnapshotService(self.db).get_snapshot(case_id)
+            new_results = new_rows_since_snapshot(
+                SNAPSHOT_HISTORY,
+                parsed_results,
+                snapshot.history_count,
+                snapshot.history_digest,
+            )
+            if new_results is not None:
+                return RowUpdatePlan(new_results, [], snapshot_matched=True)
+
+            # 요약이 없거나 달라졌으면 대법원 사건 이력을 조회하고
+            # 새로 받아온 사건 이력과 기존 사건 이력을 순서대로 비교합니다.
+            existing_records = await MyCaseService(
+                self.db
+            ).get_supremCourt_history_records_by_case_id(case_id)
+            changes = await self.diff_history_for_update(
+                parsed_results,
+                existing_records,
+            )
+            return plan_from_changes(changes)
+
+    def history_created_at(self, row: HistoryRow, index: int) -> datetime:
+        """
+        사건 이력의 날짜를 datetime으로 변환하고
+        index 만큼 seconds를 추가하여 사건 이력의 날짜를 구분합니다.(순서 보장)
+        """
+
+        base_dt = datetime.strptime(row.date, self.date_fmt).replace(tzinfo=self.tz)
+        return base_dt + timedelta(seconds=index)
+
+    def trial_datetime(self, row: TrialInfoRow) -> datetime:
+        """변론기일의 date 와 time을 합쳐서 datetime으로 변환합니다."""
+
+        return datetime.strptime(
+            row.date + " " + row.time,
+            self.date_fmt + " " + self.time_fmt,
+        ).replace(tzinfo=self.tz)
 
     async def update_case_trial_info(
         self,
         html: str,
         case_id: int,
         agency_name: Optional[str] = None,
-    ) -> List[SupremCourtTrialInfoParsedResult]:
+        snapshot: Optional[CaseSnapshot] = None,
+    ) -> Tuple[List[TrialInfoRow], List[TrialInfoRow]]:
         """
-        사건 변론기일 중 새로 받아온 사건 변론기일과
-        기존 사건 변론기일 중 마지막 사건 변론기일을 비교하여
-        새로 받아온 사건 변론기일 중 추가할 사건 변론기일이 있는지 판단합니다.
+        새로 받아온 사건 변론기일과 기존 사건 변론기일을 비교하여
+        새 변론기일은 추가하고, 장소/결과가 바뀐 변론기일은 기존 행을 수정합니다.
+        (추가한 변론기일, 장소/결과가 바뀐 변론기일)을 돌려줍니다.
+
+        snapshot: 사건의 마지막 반영 상태. 앞부분이 같으면 기존 변론기일을 조회하지 않습니다.
         """
 
         logger.debug(
-            f"[업데이트 시작] case_id: {case_id}에 대한 사건 변론기일을 DB 에 업데이트 합니다."
+            "[업데이트 시작] case_id: %s에 대한 사건 변론기일을 DB 에 업데이트 합니다.",
+            case_id,
         )
 
         if not self.db:
             raise Exception("db is not initialized")
 
         # 사건 변론기일을 파싱합니다.
-        parsed_results = await self.parse_trial_info_from_html(html)
+        with track_stage(STAGE_PARSE_TRIAL):
+            parsed_results = await self.parse_trial_info_from_html(html)
 
-        # 사건 변론기일 중 마지막 사건 변론기일을 조회합니다.
         case_history_repository = MyCaseService(self.db)
-        trial_info = await case_history_repository.get_trial_info_by_case_id(case_id)
-
-        # 사건 변론기일 중 새로 받아온 사건 변론기일과 기존 사건 변론기일 중 마지막 사건 변론기일을 비교하여
-        # 새로 받아온 사건 변론기일 중 추가할 사건 변론기일이 있는지 판단합니다.
-        filtered_results = await self.filter_trial_info_for_update(
-            parsed_results,
-            trial_info=trial_info,
-        )
+        plan = await self.plan_trial_info_update(case_id, parsed_results, snapshot)
 
         try:
             # 사건 변론기일 중 새로 받아온 사건 변론기일 중 추가할 사건 변론기일을 추가합니다.
-            # parsed_result.date 와 parsed_result.time을 합쳐서 datetime으로 변환합니다.
-            for parsed_result in filtered_results:
-                await case_history_repository.create_trial_info_from_supremCourt_history(
-                    case_id=case_id,
-                    trial_date=datetime.strptime(
-                        parsed_result.date + " " + parsed_result.time,
-                        self.date_fmt + " " + self.time_fmt,
-                    ).replace(tzinfo=self.tz),
-                    trial_type=parsed_result.type,
-                    trial_agency=agency_name,
-                    trial_agency_address_detail=parsed_result.location,
-                    trial_result=parsed_result.result,
-                )
-            await self.db.commit()
+            with track_stage(STAGE_DB_INSERT):
+                for parsed_result in plan.inserts:
+                    await case_history_repository.create_trial_info_from_supremCourt_history(
+                        case_id=case_id,
+                        trial_date=self.trial_datetime(parsed_result),
+                        trial_type=parsed_result.type,
+                        trial_agency=agency_name,
+                        trial_agency_address_detail=parsed_result.location,
+                        trial_result=parsed_result.result,
+                    )
+                # 장소/결과가 바뀐 변론기일은 새로 추가하지 않고 기존 행을 수정합니다.
+                for change in plan.updates:
+                    await case_history_repository.update_trial_info_from_supremCourt_history(
+                        trial_info_id=change.existing_id,
+                        trial_agency_address_detail=change.row.location,
+                        trial_result=change.row.result,
+                    )
+                if plan.save_snapshot:
+                    await CaseSnapshotService(self.db).save_trial_info(
+                        case_id, parsed_results
+                    )
+            if self.autocommit:
+                with track_stage(STAGE_DB_COMMIT):
+                    await self.db.commit()
             logger.debug(
-                f"[업데이트 완료] case_id: {case_id}에 대한 사건 변론기일을 DB 에 업데이트 완료."
+                "[업데이트 완료] case_id: %s에 대한 사건 변론기일을 DB 에 업데이트 완료.",
+                case_id,
             )
         except Exception as e:
+            if not self.autocommit:
+                raise
             await self.db.rollback()
             logger.error(f"Error occurred while updating case trial info: {str(e)}")
 
-        return filtered_results
+        return plan.inserts, [c.row for c in plan.updates]
+
+    async def plan_trial_info_update(
+        self,
+        case_id: int,
+        parsed_results: List[TrialInfoRow],
+        snapshot: Optional[CaseSnapshot] = None,
+    ) -> RowUpdatePlan:
+        """
+        새로 받아온 사건 변론기일 중 추가할 변론기일과 장소/결과가 바뀐 변론기일을 고릅니다.(DB 는 읽기만 합니다)
+
+        snapshot: 사건의 마지막 반영 상태. 앞부분이 같으면 기존 변론기일을 조회하지 않습니다.
+        """
+
+        with track_stage(STAGE_DB_DIFF):
+            if snapshot is None:
+                snapshot = await CaseSnapshotService(self.db).get_snapshot(case_id)
+            new_results = new_rows_since_snapshot(
+                SNAPSHOT_TRIAL,
+                parsed_results,
+                snapshot.trial_count,
+                snapshot.trial_digest,
+            )
+            if new_results is not None:
+                return RowUpdatePlan(new_results, [], snapshot_matched=True)
+
+            # 요약이 없거나 달라졌으면 사건 변론기일을 조회하고
+            # 새로 받아온 사건 변론기일과 기존 사건 변론기일을 순서대로 비교합니다.
+            existing_records = await MyCaseService(
+                self.db
+            ).get_trial_info_records_by_case_id(case_id)
+            changes = await self.diff_trial_info_for_update(
+                parsed_results,
+                existing_records,
+            )
+            return plan_from_changes(changes)
 
     async def parse_agency_name(self, html: str) -> str:
         """
@@ -469,15 +611,28 @@ class ParseCaseService:
     ) -> ParserUpdateResult:
         """
         사건 이력과 사건 변론기일을 업데이트합니다.
+        autocommit 이 False 이면 커밋하지 않으므로 호출하는 쪽에서 커밋합니다.
         """
 
-        new_history = await self.update_case_history(html, case_id)
+        # 사건 이력/변론기일 모두 같은 요약 행을 사용하므로 한 번만 조회합니다.
+        with track_stage(STAGE_DB_DIFF):
+            snapshot = await CaseSnapshotService(self.db).get_snapshot(case_id)
+        new_history, updated_history = await self.update_case_history(
+            html, case_id, snapshot
+        )
 
         # TODO: html 에서 관할기관명을 가져올 수는 있지만, 안정성을 위해 나중에는 필수 파라미터롤 수정하는 것이 좋겠다.
         # 현재는 repository 에서도 optional 값으로 되어 있음
         if not agency_name:
             agency_name = await self.parse_agency_name(html)
 
-        new_trial_info = await self.update_case_trial_info(html, case_id, agency_name)
+        new_trial_info, updated_trial_info = await self.update_case_trial_info(
+            html, case_id, agency_name, snapshot
+        )
 
-        return ParserUpdateResult(history=new_history, trial_info=new_trial_info)  #
+        return ParserUpdateResult(
+            history=new_history,
+            trial_info=new_trial_info,
+            updated_history=updated_history,
+            updated_trial_info=updated_trial_info,
+        )  #
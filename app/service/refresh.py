@@ -0,0 +1,153 @@
+import asyncio
+import logging
+import time
+from datetime import datetime, timezone
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+from app.core.court import normalize_court_name
+from app.schema.case_schema import CaseResponseForParser
+from app.service.parser import HistoryRow, TrialInfoRow
+
+logger = logging.getLogger(__name__)
+
+# refresh() 결과가 어디서 왔는지
+SOURCE_FRESH = "fresh"  # 이번 요청으로 새로 조회
+SOURCE_JOINED = "joined"  # 진행 중이던 조회에 합류
+SOURCE_CACHE = "cache"  # TTL 캐시
+
+# (사건 ID, 법원 목록의 관할법원명, 사건번호, 의뢰인)
+RefreshKey = Tuple[int, Optional[str], Optional[str], Optional[str]]
+
+
+def refresh_key(case: CaseResponseForParser) -> RefreshKey:
+    """
+    중복 제거/캐시 키. 조회 결과에 영향을 주는 값(case_fingerprint 와 같은 값)이 바뀌면 다른 조회로 봅니다.
+    (사건번호/관할법원을 수정해서 알림이 오면 수정 전 값의 캐시나 진행 중인 조회를 쓰지 않음)
+    """
+
+    court_name = normalize_court_name(case.jurisdiction) or case.jurisdiction
+    return case.case_id, court_name, case.case_number, case.client_name
+
+
+class CaseProcessResult:
+    """
+    사건 1건 처리 결과
+
+    outcome: success / failed / skipped
+    message: 실패 또는 스킵 사유
+    reason: 실패한 단계(failure_reason)
+    history/trial_info: 새로 추가된 이력/기일
+    updated_history/updated_trial_info: 결과가 바뀌어 수정된 이력/기일
+    """
+
+    def __init__(
+        self,
+        case_id: int,
+        outcome: str,
+        message: Optional[str] = None,
+        history: Optional[List[HistoryRow]] = None,
+        trial_info: Optional[List[TrialInfoRow]] = None,
+        updated_history: Optional[List[HistoryRow]] = None,
+        updated_trial_info: Optional[List[TrialInfoRow]] = None,
+        reason: Optional[str] = None,
+    ):
+        self.case_id = case_id
+        self.outcome = outcome
+        self.message = message
+        self.reason = reason
+        self.history = history or []
+        self.trial_info = trial_info or []
+        self.updated_history = updated_history or []
+        self.updated_trial_info = updated_trial_info or []
+        self.finished_at = datetime.now(timezone.utc)
+
+
+class CaseRefresher:
+    """
+    사건 단위 조회의 중복 제거와 결과 캐시
+
+    - 같은 사건(refresh_key)에 대한 조회가 진행 중이면 새로 캡차를 풀지 않고 진행 중인 작업의 결과를 같이 받습니다.
+      (API 요청끼리, API 요청과 스케줄러 실행 사이 모두 해당)
+    - 성공한 결과는 쓰기가 커밋된 뒤(cache) ttl_seconds 동안 캐시해서 몇 분 안에 다시 요청하면 그대로 돌려줍니다.
+    """
+
+    def __init__(self, ttl_seconds: float):
+        self.ttl_seconds = ttl_seconds
+        self._inflight: Dict[RefreshKey, asyncio.Task] = {}
+        self._cache: Dict[RefreshKey, Tuple[float, CaseProcessResult]] = {}
+
+    def get_cached(self, key: RefreshKey) -> Optional[CaseProcessResult]:
+        entry = self._cache.get(key)
+        if not entry:
+            return None
+
+        cached_at, result = entry
+        if time.monotonic() - cached_at > self.ttl_seconds:
+            del self._cache[key]
+            return None
+        return result
+
+    def cache(self, key: RefreshKey, result: CaseProcessResult) -> None:
+        """성공한 결과를 캐시합니다.(사건 쓰기가 커밋된 뒤에 호출)"""
+
+        self._cache[key] = (time.monotonic(), result)
+
+    def is_running(self, key: RefreshKey) -> bool:
+        return key in self._inflight
+
+    async def run(
+        self,
+        key: RefreshKey,
+        job: Callable[[], Awaitable[Optional[CaseProcessResult]]],
+        use_cache: bool = True,
+    ) -> Tuple[Optional[CaseProcessResult], str]:
+        """
+        사건 조회 작업을 실행하고 (결과, 출처)를 돌려줍니다.
+        요청한 쪽이 취소되어도 진행 중인 작업은 취소되지 않습니다.(다른 요청이 기다리고 있을 수 있음)
+        """
+
+        if use_cache:
+            cached = self.get_cached(key)
+            if cached:
+                return cached, SOURCE_CACHE
+
+        source = SOURCE_JOINED
+        task = self._inflight.get(key)
+        if task is None:
+            source = SOURCE_FRESH
+            task = asyncio.ensure_future(job())
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._on_done(key, t))
+
+        return await asyncio.shield(task), source
+
+    def running_tasks(self) -> List[asyncio.Task]:
+        """진행 중인 조회 작업(종료 시 기다리기 위함)"""
+
+        return list(self._inflight.values())
+
+    async def cancel_all(self) -> None:
+        """진행 중인 조회를 모두 취소합니다.(종료 시 대기 시간을 넘긴 경우)"""
+
+        tasks = list(self._inflight.values())
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _on_done(self, key: RefreshKey, task: asyncio.Task) -> None:
+        self._inflight.pop(key, None)
+        if not task.cancelled():
+            # 결과를 가져가지 않으면 asyncio 가 예외를 로그로 남기므로 확인만 합니다.
+            task.exception()
+        self._prune()
+
+    def _prune(self) -> None:
+        now = time.monotonic()
+        expired = [
+            key
+            for key, (cached_at, _) in self._cache.items()
+            if now - cached_at > self.ttl_seconds
+        ]
+        for key in expired:
+            del self._cache[key]
@@ -0,0 +1,216 @@
+import asyncio
+import logging
+import uuid
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Awaitable, Callable, List, Optional, Tuple
+
+from app.core.court import normalize_court_name
+from app.core.logging_config import case_id_var
+from app.core.session import AsyncSessionLocal
+from app.schema.case_schema import CaseResponseForParser
+from app.schema.refresh_job_schema import (
+    RefreshJobCreate,
+    RefreshJobResponse,
+    RefreshJobStatus,
+)
+from app.service.mycase import MyCaseService
+from app.service.refresh import SOURCE_CACHE, CaseProcessResult
+
+logger = logging.getLogger(__name__)
+
+ProcessCase = Callable[
+    [CaseResponseForParser], Awaitable[Tuple[Optional[CaseProcessResult], str]]
+]
+
+
+class RefreshJob:
+    """일괄 조회 작업 1건의 상태"""
+
+    def __init__(self, request: RefreshJobCreate, concurrency: int):
+        self.job_id = uuid.uuid4().hex
+        self.request = request
+        self.concurrency = concurrency
+        self.status = RefreshJobStatus.PENDING
+        self.total = 0
+        self.outcomes = {"success": 0, "failed": 0, "skipped": 0}
+        self.cached = 0
+        self.changed = 0
+        self.created_at = datetime.now(timezone.utc)
+        self.started_at: Optional[datetime] = None
+        self.finished_at: Optional[datetime] = None
+        self.error: Optional[str] = None
+        self.task: Optional[asyncio.Task] = None
+
+    def to_response(self) -> RefreshJobResponse:
+        return RefreshJobResponse(
+            job_id=self.job_id,
+            status=self.status,
+            firm_id=self.request.firm_id,
+            case_ids=self.request.case_ids,
+            jurisdiction=self.request.jurisdiction,
+            concurrency=self.concurrency,
+            total=self.total,
+            done=sum(self.outcomes.values()),
+            success=self.outcomes["success"],
+            failed=self.outcomes["failed"],
+            skipped=self.outcomes["skipped"],
+            cached=self.cached,
+            changed=self.changed,
+            created_at=self.created_at,
+            started_at=self.started_at,
+            finished_at=self.finished_at,
+            error=self.error,
+        )
+
+
+class RefreshJobManager:
+    """
+    일괄 조회 작업 관리
+
+    작업마다 concurrency 개의 worker 가 사건 큐에서 하나씩 꺼내 스케줄러의 사건 처리 경로(process_case)로 처리합니다.
+    작업 상태는 메모리에만 두고 최근 max_jobs 개만 보관합니다.(재시작하면 사라짐)
+    종료(shutdown) 시에는 새 사건을 꺼내지 않고, 남은 사건이 있는 작업은 interrupted 로 끝냅니다.
+    """
+
+    PAGE_SIZE = 100
+
+    def __init__(
+        self, process_case: ProcessCase, default_concurrency: int, max_jobs: int = 100
+    ):
+        self.process_case = process_case
+        self.default_concurrency = default_concurrency
+        self.max_jobs = max_jobs
+        self._jobs: "OrderedDict[str, RefreshJob]" = OrderedDict()
+        self._stopping = False
+
+    def create(self, request: RefreshJobCreate) -> RefreshJob:
+        job = RefreshJob(request, request.concurrency or self.default_concurrency)
+        self._jobs[job.job_id] = job
+        while len(self._jobs) > self.max_jobs:
+            self._jobs.popitem(last=False)
+
+        job.task = asyncio.create_task(self._run(job))
+        logger.info(
+            f"일괄 조회 작업 생성 - job_id: {job.job_id}, 필터: {request.model_dump(exclude_none=True)}"
+        )
+        return job
+
+    def get(self, job_id: str) -> Optional[RefreshJob]:
+        return self._jobs.get(job_id)
+
+    async def shutdown(self, timeout: float) -> None:
+        """
+        worker 가 새 사건을 꺼내지 않도록 멈추고 진행 중인 사건 처리를 timeout 초까지 기다립니다.
+        기다리지 못한 작업은 취소하고, 끝나지 않은 작업은 모두 interrupted 로 남깁니다.
+        """
+
+        self._stopping = True
+        tasks = [job.task for job in self._jobs.values() if job.task and not job.task.done()]
+        if tasks:
+            _, pending = await asyncio.wait(tasks, timeout=max(timeout, 0))
+            if pending:
+                logger.warning("일괄 조회 작업 %d건을 기다리지 못하고 취소합니다.", len(pending))
+                for task in pending:
+                    task.cancel()
+                await asyncio.gather(*pending, return_exceptions=True)
+
+        # 시작하기 전에 취소된 작업은 _run 이 실행되지 않으므로 여기서 상태를 남깁니다.
+        for job in self._jobs.values():
+            if job.status in (RefreshJobStatus.PENDING, RefreshJobStatus.RUNNING):
+                job.status = RefreshJobStatus.INTERRUPTED
+                job.finished_at = job.finished_at or datetime.now(timezone.utc)
+
+    async def _load_cases(self, request: RefreshJobCreate) -> List[CaseResponseForParser]:
+        cases: List[CaseResponseForParser] = []
+        async with AsyncSessionLocal() as session:
+            repo = MyCaseService(session)
+            jurisdictions = None
+            if request.jurisdiction:
+                # 관할법원은 직접 입력한 값이라 표기가 제각각이므로 같은 법원으로 정규화되는 이름을 모두 찾습니다.
+                jurisdictions = [
+                    name
+                    for name in await repo.get_scheduler_jurisdictions()
+                    if normalize_court_name(name) == request.jurisdiction
+                ]
+                if not jurisdictions:
+                    return cases
+            skip = 0
+            while True:
+                page = await repo.get_case_list_for_scheduler(
+                    skip=skip,
+                    limit=self.PAGE_SIZE,
+                    case_ids=request.case_ids,
+                    firm_id=request.firm_id,
+                    jurisdictions=jurisdictions,
+                )
+                if not page:
+                    break
+                cases.extend(page)
+                skip += self.PAGE_SIZE
+        return cases
+
+    async def _run(self, job: RefreshJob) -> None:
+        job.status = RefreshJobStatus.RUNNING
+        job.started_at = datetime.now(timezone.utc)
+        try:
+            cases = await self._load_cases(job.request)
+            job.total = len(cases)
+
+            queue: asyncio.Queue[CaseResponseForParser] = asyncio.Queue()
+            for case in cases:
+                queue.put_nowait(case)
+
+            workers = [
+                asyncio.create_task(self._worker(job, queue))
+                for _ in range(min(job.concurrency, max(len(cases), 1)))
+            ]
+            await asyncio.gather(*workers)
+            # 종료 요청으로 worker 가 멈춘 경우 남은 사건이 있습니다.
+            job.status = (
+                RefreshJobStatus.FINISHED if queue.empty() else RefreshJobStatus.INTERRUPTED
+            )
+        except asyncio.CancelledError:
+            job.status = RefreshJobStatus.INTERRUPTED
+            raise
+        except Exception as e:
+            logger.error(f"일괄 조회 작업 중 오류 - job_id: {job.job_id}, 오류: {str(e)}")
+            job.status = RefreshJobStatus.FAILED
+            job.error = str(e)
+        finally:
+            job.finished_at = datetime.now(timezone.utc)
+            logger.info(
+                f"일괄 조회 작업 종료 - job_id: {job.job_id}, 상태: {job.status.value}, "
+                f"대상: {job.total}건, 결과: {job.outcomes}"
+            )
+
+    async def _worker(
+        self, job: RefreshJob, queue: "asyncio.Queue[CaseResponseForParser]"
+    ) -> None:
+        while not self._stopping:
+            try:
+                case = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+
+            case_id_var.set(case.case_id)
+            try:
+                result, source = await self.process_case(case)
+            except Exception as e:
+                logger.error(
+                    f"일괄 조회 중 사건 처리 오류 - 사건번호: {case.case_number}, 오류: {str(e)}"
+                )
+                job.outcomes["failed"] += 1
+                continue
+
+            outcome = result.outcome if result else "skipped"
+            job.outcomes[outcome] = job.outcomes.get(outcome, 0) + 1
+            if source == SOURCE_CACHE:
+                job.cached += 1
+            if result and (
+                result.history
+                or result.trial_info
+                or result.updated_history
+                or result.updated_trial_info
+            ):
+                job.changed += 1
@@ -0,0 +1,108 @@
+"""
+파싱 결과와 기존 행의 순서 비교(sequence diff)
+
+대법원 사건 정보는 기존 행의 결과 칸을 나중에 채우는 경우가 있어서(예: 기일의 결과, 이력의 결과)
+값 전체를 키로 비교하면 같은 행이 새 행으로 한 번 더 추가되고 알림도 다시 나갑니다.
+그래서 행마다 식별 필드(사건 이력: 일자/내용, 변론기일: 일자/시각/기일구분)를 정해두고
+
+- 값이 모두 같은 기존 행이 있으면 unchanged
+- 값은 다르지만 식별 필드가 같은 기존 행이 남아 있으면 update(기존 행을 그 자리에서 수정)
+- 둘 다 없으면 insert
+
+로 나눕니다. 식별 필드가 같은 행이 여러 개면 순서대로 짝을 짓습니다.
+"""
+
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+DIFF_INSERT = "insert"
+DIFF_UPDATE = "update"
+DIFF_UNCHANGED = "unchanged"
+
+
+class RowChange(NamedTuple):
+    """
+    파싱 결과 1행의 비교 결과
+
+    existing_id: 짝지은 기존 행 id(insert 는 None)
+    previous: update 인 경우 기존 행 값(id 제외)
+    """
+
+    op: str
+    row: Tuple
+    existing_id: Optional[int] = None
+    previous: Optional[Tuple] = None
+
+
+def diff_rows(
+    parsed_results: Sequence[Tuple],
+    existing_rows: Sequence[Tuple],
+    identity_size: int,
+) -> List[RowChange]:
+    """
+    parsed_results: 파싱 결과 행(필드 순서는 기존 행의 id 뒤 필드와 같음)
+    existing_rows: (id, 필드...) 형태의 기존 행. 오래된 순서
+    identity_size: 앞에서부터 식별 필드로 쓸 필드 수
+
+    파싱 결과와 같은 순서로 RowChange 를 돌려줍니다.
+    식별 필드가 같은 행끼리 묶어서, 묶음의 행 수가 같으면 순서대로 짝을 짓고
+    다르면 값이 같은 행을 먼저 짝지은 뒤 남은 행을 순서대로 짝을 짓습니다.
+    """
+
+    existing_groups: Dict[Tuple, List[Tuple]] = {}
+    for existing in existing_rows:
+        existing_groups.setdefault(existing[1 : 1 + identity_size], []).append(
+            existing
+        )
+
+    identities = [tuple(row[:identity_size]) for row in parsed_results]
+    parsed_counts: Dict[Tuple, int] = {}
+    for identity in identities:
+        parsed_counts[identity] = parsed_counts.get(identity, 0) + 1
+
+    changes: List[Optional[RowChange]] = [None] * len(parsed_results)
+    cursors: Dict[Tuple, int] = {}
+    uneven: Dict[Tuple, List[int]] = {}
+    for index, (row, identity) in enumerate(zip(parsed_results, identities)):
+        group = existing_groups.get(identity)
+        if not group:
+            changes[index] = RowChange(DIFF_INSERT, row)
+        elif len(group) == parsed_counts[identity]:
+            # 묶음의 행 수가 같으면 순서대로 짝을 짓습니다.(대부분의 경우)
+            cursor = cursors.get(identity, 0)
+            cursors[identity] = cursor + 1
+            changes[index] = _pair(row, group[cursor])
+        else:
+            uneven.setdefault(identity, []).append(index)
+
+    for identity, indexes in uneven.items():
+        # 행 수가 다르면 값이 같은 행을 먼저 짝짓고 남은 행만 순서대로 짝을 짓습니다.
+        group = existing_groups[identity]
+        by_value: Dict[Tuple, List[Tuple]] = {}
+        for existing in reversed(group):
+            by_value.setdefault(existing[1:], []).append(existing)
+        matched = set()
+        unmatched = []
+        for index in indexes:
+            candidates = by_value.get(parsed_results[index])
+            if candidates:
+                existing = candidates.pop()
+                matched.add(existing[0])
+                changes[index] = RowChange(
+                    DIFF_UNCHANGED, parsed_results[index], existing[0]
+                )
+            else:
+                unmatched.append(index)
+
+        remaining = [existing for existing in group if existing[0] not in matched]
+        for index, existing in zip(unmatched, remaining):
+            changes[index] = _pair(parsed_results[index], existing)
+        for index in unmatched[len(remaining) :]:
+            changes[index] = RowChange(DIFF_INSERT, parsed_results[index])
+
+    return changes
+
+
+def _pair(row: Tuple, existing: Tuple) -> RowChange:
+    if existing[1:] == row:
+        return RowChange(DIFF_UNCHANGED, row, existing[0])
+    return RowChange(DIFF_UPDATE, row, existing[0], existing[1:])
@@ -0,0 +1,199 @@
+import json
+from typing import List, Optional, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.metrics import RunStats
+from app.schema.run_schema import SchedulerRunResponse, SchedulerRunStatus
+
+
+class SchedulerRunService:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def create_run(self, stats: RunStats) -> int:
+        """
+        스케줄러 실행 시작을 기록합니다.
+        """
+
+        result = await self.db.execute(
+            text(
+                """
+            INSERT INTO erp_scheduler_runs (
+                trigger
+                , status
+                , started_at
+            ) VALUES (
+                :trigger
+                , :status
+                , :started_at
+            )
+            RETURNING id
+            """
+            ),
+            {
+                "trigger": stats.trigger,
+                "status": SchedulerRunStatus.RUNNING.value,
+                "started_at": stats.started_at,
+            },
+        )
+        row = result.fetchone()
+
+        return row.id if row else 0
+
+    async def finish_run(
+        self,
+        run_id: int,
+        stats: RunStats,
+        status: SchedulerRunStatus,
+        error: Optional[str] = None,
+        checkpoint: Optional[List[int]] = None,
+    ) -> None:
+        """
+        스케줄러 실행 종료 시 결과와 통계를 기록합니다.
+        checkpoint: 중단된 경우 아직 조회하지 않은 사건 ID
+        """
+
+        await self.db.execute(
+            text(
+                """
+            UPDATE erp_scheduler_runs
+            SET
+                status = :status
+                , finished_at = :finished_at
+                , duration_seconds = :duration_seconds
+                , cases_total = :cases_total
+                , cases_success = :cases_success
+                , cases_failed = :cases_failed
+                , cases_skipped = :cases_skipped
+                , cases_changed = :cases_changed
+                , new_history = :new_history
+                , new_trial = :new_trial
+                , throughput_per_min = :throughput_per_min
+                , stage_seconds = CAST(:stage_seconds AS JSONB)
+                , failures = CAST(:failures AS JSONB)
+                , error = :error
+                , profile = CAST(:profile AS JSONB)
+                , firms = CAST(:firms AS JSONB)
+                , checkpoint = CAST(:checkpoint AS JSONB)
+            WHERE id = :run_id
+            """
+            ),
+            {
+                "run_id": run_id,
+                "status": status.value,
+                "finished_at": stats.finished_at,
+                "duration_seconds": stats.duration_seconds,
+                "cases_total": stats.cases_total,
+                "cases_success": stats.outcomes.get("success", 0),
+                "cases_failed": stats.outcomes.get("failed", 0),
+                "cases_skipped": stats.outcomes.get("skipped", 0),
+                "cases_changed": stats.cases_changed,
+                "new_history": stats.new_history,
+                "new_trial": stats.new_trial,
+                "throughput_per_min": stats.throughput_per_min,
+                "stage_seconds": json.dumps(
+                    {k: round(v, 3) for k, v in stats.stage_seconds.items()}
+                ),
+                "failures": json.dumps(stats.failures),
+                "error": error,
+                "profile": json.dumps(stats.profile) if stats.profile else None,
+                "firms": json.dumps(stats.firms),
+                "checkpoint": (
+                    json.dumps({"remaining_case_ids": checkpoint})
+                    if checkpoint
+                    else None
+                ),
+            },
+        )
+
+        return None
+
+    async def get_recent_runs(self, limit: int = 20) -> List[SchedulerRunResponse]:
+        """
+        최근 스케줄러 실행 목록을 조회합니다.
+        """
+
+        result = await self.db.execute(
+            text(
+                """
+            SELECT
+                r.id
+                , r.trigger
+                , r.status
+                , r.started_at
+                , r.finished_at
+                , r.duration_seconds
+                , r.cases_total
+                , r.cases_success
+                , r.cases_failed
+                , r.cases_skipped
+                , r.cases_changed
+                , r.new_history
+                , r.new_trial
+                , r.throughput_per_min
+                , r.stage_seconds
+                , r.failures
+                , r.error
+                , r.profile
+                , r.firms
+                , r.checkpoint
+            FROM erp_scheduler_runs r
+            ORDER BY r.started_at DESC
+            LIMIT :limit
+            """
+            ),
+            {"limit": limit},
+        )
+        rows = result.fetchall()
+
+        if not rows:
+            return []
+
+        return [SchedulerRunResponse.model_validate(row) for row in rows]
+
+    async def take_checkpoint(
+        self, max_age_hours: int
+    ) -> Optional[Tuple[int, List[int]]]:
+        """
+        max_age_hours 안에 중단된 가장 최근 실행의 (실행 ID, 남은 사건 ID)를 돌려주고 checkpoint 를 비웁니다.
+        여러 프로세스가 동시에 시작해도 한 곳에서만 가져가도록 행 잠금을 사용합니다.(커밋은 호출하는 쪽에서)
+        """
+
+        result = await self.db.execute(
+            text(
+                """
+            WITH target AS (
+                SELECT
+                    r.id
+                    , r.checkpoint
+                FROM erp_scheduler_runs r
+                WHERE
+                    r.status = :status
+                    AND r.checkpoint IS NOT NULL
+                    AND r.started_at > now() - make_interval(hours => :max_age_hours)
+                ORDER BY r.started_at DESC
+                LIMIT 1
+                FOR UPDATE SKIP LOCKED
+            )
+            UPDATE erp_scheduler_runs runs
+            SET checkpoint = NULL
+            FROM target
+            WHERE runs.id = target.id
+            RETURNING
+                runs.id
+                , target.checkpoint
+            """
+            ),
+            {
+                "status": SchedulerRunStatus.INTERRUPTED.value,
+                "max_age_hours": max_age_hours,
+            },
+        )
+        row = result.fetchone()
+
+        if not row or not row.checkpoint:
+            return None
+
+        return row.id, list(row.checkpoint.get("remaining_case_ids") or [])
@@ -1,28 +1,95 @@
-from datetime import datetime, timedelta
+from contextlib import nullcontext
+from datetime import datetime, timedelta, timezone
+from datetime import time as dtime
 import logging
 import asyncio
+import time
+import multiprocessing
+import os
+import signal
+from concurrent.futures import ProcessPoolExecutor
 from math import e
-from typing import List
+from typing import Awaitable, Callable, List
+from zoneinfo import ZoneInfo
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
 
-from app.core.session import AsyncSessionLocal
+from app.core.events import run_events
+from app.core.logging_config import case_id_var, run_id_var
+from app.core.metrics import (
+    CASES_AFTER_DEADLINE,
+    DORMANT_CASES,
+    RUN_DEADLINE_MISSED,
+    RUN_DEADLINE_SLACK_SECONDS,
+    RUN_IN_PROGRESS,
+    RUN_LAST_FINISHED,
+    RUN_SECONDS,
+    STAGE_ALIMTALK,
+    STAGE_PARSE_LOG,
+    STAGE_SYSTEM_NOTIFICATION,
+    UNKNOWN_COURT_CASES,
+    RunStats,
+    current_run,
+    failure_reason,
+    record_case,
+    record_new_rows,
+    track_stage,
+)
+from app.core.profiling import RunProfiler
+from app.core.session import AsyncSessionLocal, engine
 from app.schema.case_schema import CaseRelatedUsers, CaseResponseForParser
+from app.schema.run_schema import SchedulerRunStatus
 from app.service.parser import (
     ParseCaseService,
-    SupremCourtHistoryParsedResult,
-    SupremCourtTrialInfoParsedResult,
+    ParserUpdateResult,
+    HistoryRow,
+    TrialInfoRow,
 )
 import re
 from app.core.config import settings
+from app.core.court import normalize_court_name
 from app.service.alimtalk import AlimTalkService
+from app.service.case_listener import CaseChangeListener
+from app.service.dormancy import DormancyService, is_poll_day
+from app.service.fairness import FairScheduler, parse_firm_map
+from app.service.failure import (
+    FAILURE_PERMANENT,
+    ParseFailure,
+    ParseFailureService,
+    case_fingerprint,
+    classify_failure,
+)
 from app.service.mycase import MyCaseService
+from app.service.pacing import DispatchPacer, parse_run_windows, window_deadline
+from app.service.parse_history import ParseHistoryWriter
+from app.service.refresh import (
+    SOURCE_FRESH,
+    SOURCE_JOINED,
+    CaseProcessResult,
+    CaseRefresher,
+    refresh_key,
+)
+from app.service.refresh_job import RefreshJobManager
+from app.service.run_history import SchedulerRunService
+from app.service.unit_of_work import CaseUnitOfWork
 
 
 logger = logging.getLogger(__name__)
 
+KST = ZoneInfo("Asia/Seoul")
+
+# 정기 실행 등록 프로세스를 하나로 제한하기 위한 pg advisory lock 키
+LEADER_LOCK_KEY = 7_240_301
+
 
 class SupremeCourtScheduler:
-    def __init__(self):
+    def __init__(self, processes: int = 1):
+        """
+        processes: 2 이상이면 정기 실행 대상 사건을 사건 ID 기준으로 나눠서 프로세스 여러 개로 조회합니다.
+        """
+
+        self.processes = processes
         self.scheduler = AsyncIOScheduler(timezone="Asia/Seoul")
         self.alimtalk = AlimTalkService(
             api_url=settings.KAKAO_NOTI_API_URL,
@@ -30,6 +97,46 @@ class SupremeCourtScheduler:
             app_key=settings.KAKAO_NOTI_APP_KEY,
             sender_key=settings.KAKAO_NOTI_SENDER_KEY,
         )
+        # 관리자 API 로 요청한 다음 실행 프로파일링(사건 샘플링 비율). None 이면 요청 없음
+        self.profile_next_run: float | None = None
+        # 실행 중인 스케줄러 작업 통계(진행 상황 조회용). 실행 중이 아니면 None
+        self.current_stats: RunStats | None = None
+        # 종료 요청을 받으면 설정. 정기 실행은 새 사건 조회를 멈추고 남은 사건을 checkpoint 로 남깁니다.
+        self._draining = asyncio.Event()
+        # 실행 중인 _runner 태스크(종료 시 기다리기 위함)
+        self._runner_tasks: set[asyncio.Task] = set()
+        # 파싱 이력(erp_supremecourt_parse_history)을 모아서 기록
+        self.parse_history = ParseHistoryWriter(
+            batch_size=settings.PARSE_HISTORY_BATCH_SIZE,
+            flush_seconds=settings.PARSE_HISTORY_FLUSH_SECONDS,
+            max_buffer=settings.PARSE_HISTORY_MAX_BUFFER,
+        )
+        # 정기 실행 등록 권한(advisory lock)을 잡고 있는 커넥션
+        self._leader_conn: AsyncConnection | None = None
+        # 사건 단위 조회 중복 제거/결과 캐시(스케줄러 실행과 API 요청이 공유)
+        self.refresher = CaseRefresher(ttl_seconds=settings.REFRESH_CACHE_TTL_SECONDS)
+        # 조직별 공정 조회 순서
+        self.fair = FairScheduler(
+            weights=parse_firm_map(settings.FAIR_FIRM_WEIGHTS, float),
+            tiers=parse_firm_map(settings.FAIR_FIRM_TIERS, int),
+            quotas=parse_firm_map(settings.FAIR_FIRM_QUOTAS, int),
+            default_quota=settings.FAIR_DEFAULT_QUOTA,
+        )
+        # 일괄 조회 작업(API)
+        self.refresh_jobs = RefreshJobManager(
+            process_case=lambda case: self.process_case(case, method="bulk"),
+            default_concurrency=settings.REFRESH_JOB_CONCURRENCY,
+        )
+        # 새 사건/사건번호 변경 즉시 조회
+        self.case_listener: CaseChangeListener | None = None
+        if settings.CASE_LISTENER_ENABLED:
+            self.case_listener = CaseChangeListener(
+                engine,
+                process_case=lambda case: self.process_case(case, method="notify"),
+                debounce_seconds=settings.CASE_LISTENER_DEBOUNCE_SECONDS,
+                rate_per_minute=settings.CASE_LISTENER_RATE_PER_MINUTE,
+                max_concurrency=settings.CASE_LISTENER_CONCURRENCY,
+            )
 
     async def start(self):
         # 디버깅용
@@ -37,150 +144,1047 @@ class SupremeCourtScheduler:
         #     self._runner, "date", run_date=datetime.now() + timedelta(seconds=10)
         # )
 
-        # 매일 10시 0분, 17시 0분에 실행
-        self.scheduler.add_job(self._runner, "cron", hour=10, minute=0)
-        # self.scheduler.add_job(self._runner, "cron", hour=17, minute=0)
+        if not await self._acquire_leader():
+            # 다른 프로세스(uvicorn --workers, 다른 워커 등)가 정기 실행을 담당
+            # 사건 변경 알림도 모든 프로세스가 받으므로 정기 실행을 담당하는 프로세스에서만 조회합니다.
+            logger.info("다른 프로세스가 정기 실행을 담당하고 있어 정기 실행을 등록하지 않습니다.")
+            logger.info("나의사건정보 스케줄러 시작")
+            return
+
+        windows = parse_run_windows(settings.RUN_WINDOWS)
+        if windows:
+            # 실행 시간대마다 시작 시각에 실행하고 종료 시각까지 나눠서 조회
+            for window_start, window_end in windows:
+                self.scheduler.add_job(
+                    self._runner,
+                    "cron",
+                    hour=window_start.hour,
+                    minute=window_start.minute,
+                    kwargs={"window_end": window_end},
+                )
+                logger.info(
+                    "실행 시간대 등록: %s-%s",
+                    window_start.strftime("%H:%M"),
+                    window_end.strftime("%H:%M"),
+                )
+        else:
+            # 매일 10시 0분, 17시 0분에 실행
+            self.scheduler.add_job(self._runner, "cron", hour=10, minute=0)
+            # self.scheduler.add_job(self._runner, "cron", hour=17, minute=0)
 
         self.scheduler.start()
+        await self._resume_checkpoint()
+        if self.case_listener:
+            await self.case_listener.start()
         logger.info("나의사건정보 스케줄러 시작")
 
     async def shutdown(self):
-        self.scheduler.shutdown()
+        """
+        새 사건 조회를 멈추고 진행 중인 사건 처리를 SHUTDOWN_GRACE_SECONDS 까지 기다린 뒤 종료합니다.
+        정기 실행이 중단되면 남은 사건을 checkpoint 로 남겨서 다음 시작 시 이어서 조회합니다.
+        일괄 조회 작업은 남은 사건을 조회하지 않고 interrupted 로 끝냅니다.
+        대기 시간을 넘기면 진행 중인 작업을 취소합니다.
+        """
+
+        grace = settings.SHUTDOWN_GRACE_SECONDS
+        deadline = time.monotonic() + grace
+        logger.info("나의사건정보 스케줄러 종료 요청 - 진행 중인 작업 대기(최대 %.0f초)", grace)
+
+        self._draining.set()
+        # 1회 실행(app.worker once/cases)에서는 APScheduler 를 시작하지 않음
+        if self.scheduler.running:
+            self.scheduler.pause()
+
+        if self.case_listener:
+            try:
+                await asyncio.wait_for(
+                    self.case_listener.stop(), timeout=max(deadline - time.monotonic(), 0)
+                )
+            except asyncio.TimeoutError:
+                logger.warning("사건 변경 알림 조회를 기다리지 못하고 취소했습니다.")
+
+        await self.refresh_jobs.shutdown(timeout=deadline - time.monotonic())
+        if self._runner_tasks:
+            await self._drain(set(self._runner_tasks), deadline, "정기 실행")
+        # 요청한 쪽이 취소되어도 shield 로 감싼 사건 조회(API, 일괄 조회)는 계속 진행 중일 수 있습니다.
+        inflight = self.refresher.running_tasks()
+        if inflight:
+            await self._drain(set(inflight), deadline, "사건 조회")
+        # 진행 중인 사건 처리가 끝난 뒤 남은 파싱 이력을 기록합니다.
+        await self.parse_history.close()
+
+        if self.scheduler.running:
+            self.scheduler.shutdown(wait=False)
+        await self._release_leader()
         logger.info("나의사건정보 스케줄러 종료")
 
-    async def _runner(self):
+    def request_drain(self):
+        """새 사건 조회를 멈추도록 요청합니다.(멀티 프로세스 실행의 하위 프로세스에서 종료 신호를 받은 경우)"""
+
+        self._draining.set()
+
+    async def _acquire_leader(self) -> bool:
+        """
+        정기 실행을 등록할 프로세스를 하나로 정하기 위해 pg advisory lock 을 잡습니다.
+        잠금은 커넥션에 묶여 있으므로 종료할 때까지 커넥션을 유지합니다.
+        DB 오류로 확인하지 못하면 예전처럼 정기 실행을 등록합니다.
+        """
+
+        try:
+            conn = await engine.connect()
+        except Exception as e:
+            logger.error(f"정기 실행 잠금 확인 중 오류: {str(e)}")
+            return True
+
+        try:
+            acquired = (
+                await conn.execute(
+                    text("SELECT pg_try_advisory_lock(:key)"), {"key": LEADER_LOCK_KEY}
+                )
+            ).scalar()
+        except Exception as e:
+            logger.error(f"정기 실행 잠금 확인 중 오류: {str(e)}")
+            await conn.close()
+            return True
+
+        if not acquired:
+            await conn.close()
+            return False
+
+        # 트랜잭션을 닫아도 세션 수준 advisory lock 은 유지됩니다.
+        await conn.commit()
+        self._leader_conn = conn
+        return True
+
+    async def _release_leader(self):
+        if self._leader_conn is None:
+            return
+        try:
+            await self._leader_conn.close()
+        except Exception as e:
+            logger.error(f"정기 실행 잠금 해제 중 오류: {str(e)}")
+        self._leader_conn = None
+
+    async def _drain(self, tasks: set[asyncio.Task], deadline: float, name: str):
+        """tasks 가 끝나기를 deadline 까지 기다리고, 남은 태스크는 취소합니다."""
+
+        _, pending = await asyncio.wait(
+            tasks, timeout=max(deadline - time.monotonic(), 0)
+        )
+        if not pending:
+            return
+
+        logger.warning("%s 작업 %d건을 기다리지 못하고 취소합니다.", name, len(pending))
+        for task in pending:
+            task.cancel()
+        # 스케줄러 실행 쪽 조회는 shield 로 감싸져 있어서 따로 취소해야 합니다.
+        await self.refresher.cancel_all()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+    async def _resume_checkpoint(self):
+        """
+        CHECKPOINT_MAX_AGE_HOURS 안에 중단된 실행이 있으면 남은 사건을 바로 이어서 조회합니다.
+        """
+
+        try:
+            async with AsyncSessionLocal() as session:
+                checkpoint = await SchedulerRunService(session).take_checkpoint(
+                    max_age_hours=settings.CHECKPOINT_MAX_AGE_HOURS
+                )
+                await session.commit()
+        except Exception as e:
+            logger.error(f"중단된 실행 확인 중 오류: {str(e)}")
+            return
+
+        if not checkpoint:
+            return
+
+        run_id, case_ids = checkpoint
+        if not case_ids:
+            return
+
+        logger.info("중단된 실행(%d)의 남은 사건 %d건을 이어서 조회합니다.", run_id, len(case_ids))
+        self.scheduler.add_job(
+            self._runner, kwargs={"trigger": "resume", "case_ids": case_ids}
+        )
+
+    async def _runner(
+        self,
+        window_end: dtime | None = None,
+        trigger: str = "cron",
+        case_ids: List[int] | None = None,
+    ):
+        """
+        window_end: 실행 시간대 종료 시각. 있으면 이 시각까지 고르게 나눠서 조회합니다.
+        case_ids: 중단된 실행을 이어서 조회하는 경우 남은 사건 ID
+        """
+
         logger.info("나의사건정보 스케줄러 실행")
+        runner_task = asyncio.current_task()
+        if runner_task:
+            self._runner_tasks.add(runner_task)
+
+        stats = RunStats(trigger=trigger)
+        if window_end:
+            stats.deadline = window_deadline(datetime.now(KST), window_end)
+        token = current_run.set(stats)
+        run_id = await self._record_run_start(stats)
+        run_token = run_id_var.set(run_id)
+        self.current_stats = stats
+
+        profiler = self._take_profiler()
+        if profiler:
+            profiler.start()
+
+        RUN_IN_PROGRESS.inc()
+        started = time.perf_counter()
+        status, error = SchedulerRunStatus.FINISHED, None
+        try:
+            if self.processes > 1:
+                await self._run_cases_in_processes(
+                    stats, deadline=stats.deadline, case_ids=case_ids
+                )
+            else:
+                await self._run_cases(
+                    stats, profiler, deadline=stats.deadline, case_ids=case_ids
+                )
+            if stats.remaining_case_ids():
+                status = SchedulerRunStatus.INTERRUPTED
+        except asyncio.CancelledError:
+            status = SchedulerRunStatus.INTERRUPTED
+            raise
+        except Exception as e:
+            status, error = SchedulerRunStatus.FAILED, str(e)
+            raise
+        finally:
+            RUN_SECONDS.observe(time.perf_counter() - started)
+            RUN_LAST_FINISHED.set_to_current_time()
+            RUN_IN_PROGRESS.dec()
+
+            stats.finish()
+            if profiler:
+                try:
+                    stats.profile = await profiler.stop()
+                except Exception as e:
+                    logger.error(f"프로파일링 결과 저장 중 오류: {str(e)}")
+            checkpoint = None
+            if status == SchedulerRunStatus.INTERRUPTED:
+                checkpoint = stats.remaining_case_ids()
+                logger.info("실행이 중단되어 남은 사건 %d건을 기록합니다.", len(checkpoint))
+            await self._record_run_finish(run_id, stats, status, error, checkpoint)
+            run_events.publish(
+                "run_finished",
+                {"runId": run_id, "status": status.value, **stats.progress()},
+            )
+            self.current_stats = None
+            self._runner_tasks.discard(runner_task)
+            current_run.reset(token)
+            run_id_var.reset(run_token)
+
+    async def run_once(self, trigger: str = "manual"):
+        """정기 실행과 같은 작업을 지금 1회 실행합니다.(app.worker once)"""
+
+        await self._runner(trigger=trigger)
+
+    async def _run_cases_in_processes(
+        self,
+        stats: RunStats,
+        deadline: datetime | None = None,
+        case_ids: List[int] | None = None,
+    ):
+        """
+        조회할 사건과 순서(건너뛰기, 조직별 공정 순서/한도)를 이 프로세스에서 한 번 정하고,
+        그 순서를 번갈아 processes 개로 나눠서 하위 프로세스에서 조회한 뒤 통계를 합칩니다.
+        하위 프로세스는 각자 이벤트 루프와 DB 엔진을 가지며 실행 이력은 기록하지 않습니다.(이 프로세스에서 기록)
+        종료 요청을 받으면 하위 프로세스에 SIGTERM 을 보내고 종료 대기 시간까지 기다린 뒤,
+        넘기면 남은 하위 프로세스를 종료합니다. 끝내지 못한 사건은 stats.remaining_case_ids() 로 남습니다.
+        """
+
+        # 하위 프로세스용 모듈은 멀티 프로세스 실행에서만 불러옵니다.
+        from app.service.shard import init_shard_worker, run_shard
+
+        async with AsyncSessionLocal() as session:
+            due = await self._plan_cases(
+                session, MyCaseService(session), stats, deadline, case_ids
+            )
+        # 공정 순서를 유지하도록 번갈아 나눕니다.(조직별 한도는 이미 적용되어 프로세스 수만큼 늘어나지 않음)
+        chunks = [
+            [case.case_id for case in due[index :: self.processes]]
+            for index in range(self.processes)
+        ]
+        chunks = [chunk for chunk in chunks if chunk]
+        if not chunks:
+            logger.info("스케줄러 작업 종료 - 조회할 사건이 없습니다.")
+            return
+        logger.info(
+            "스케줄러 작업 시작 - %d건을 프로세스 %d개로 나눠서 조회", len(due), len(chunks)
+        )
+
+        # 하위 프로세스가 끝날 때마다 끝낸 사건을 빼서, 도중에 중단되어도 남은 사건이 checkpoint 로 남도록 합니다.
+        stats.pending_case_ids = [case.case_id for case in due]
+        stats.pending_index = 0
+        if self._draining.is_set():
+            logger.info("종료 요청으로 조회를 시작하지 않습니다. 남은 사건: %d건", len(due))
+            return
+
+        loop = asyncio.get_running_loop()
+        pool = ProcessPoolExecutor(
+            max_workers=len(chunks),
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=init_shard_worker,
+        )
+        futures = {
+            loop.run_in_executor(
+                pool,
+                run_shard,
+                index,
+                chunk,
+                run_id_var.get(),
+                stats.trigger,
+                deadline,
+            ): (index, chunk)
+            for index, chunk in enumerate(chunks)
+        }
+        pending = set(futures)
+        draining = asyncio.ensure_future(self._draining.wait())
+        errors = []
+        try:
+            while pending:
+                done, _ = await asyncio.wait(
+                    pending | {draining} if not draining.done() else pending,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                if draining in done:
+                    # 하위 프로세스도 새 사건 조회를 멈추고 남은 사건을 통계로 돌려주게 합니다.
+                    # (systemd 는 보통 하위 프로세스에도 신호를 보내지만, 상위 프로세스만 종료하는 경우 대비)
+                    logger.info("하위 프로세스 %d개에 종료를 요청합니다.", len(pending))
+                    self._signal_shards(pool, signal.SIGTERM)
+                for future in done & pending:
+                    pending.discard(future)
+                    index, chunk = futures[future]
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        logger.error(f"하위 프로세스 {index} 실행 중 오류: {str(e)}")
+                        errors.append(f"{index}: {str(e)}")
+                        continue
+                    stats.merge(result)
+                    finished = set(chunk) - set(result.remaining_case_ids())
+                    stats.pending_case_ids = [
+                        case_id for case_id in stats.pending_case_ids if case_id not in finished
+                    ]
+        finally:
+            draining.cancel()
+            if pending:
+                # 종료 대기 시간(SHUTDOWN_GRACE_SECONDS)을 넘겨 취소된 경우. 남은 하위 프로세스를 종료합니다.
+                # 끝내지 못한 사건은 stats.pending_case_ids 에 남아 있습니다.
+                logger.warning("하위 프로세스 %d개를 기다리지 못하고 종료합니다.", len(pending))
+                self._signal_shards(pool, signal.SIGKILL)
+                for future in pending:
+                    future.cancel()
+            pool.shutdown(wait=False, cancel_futures=True)
+
+        logger.info("스케줄러 작업 종료")
+        if errors:
+            raise Exception(f"하위 프로세스 {len(errors)}개 실패 - " + ", ".join(errors))
+
+    @staticmethod
+    def _signal_shards(pool: ProcessPoolExecutor, sig: int):
+        # ProcessPoolExecutor 는 작업자 프로세스에 신호를 보내는 API 가 없어서 _processes 를 사용합니다.
+        for process in list((pool._processes or {}).values()):
+            if process.is_alive():
+                try:
+                    os.kill(process.pid, sig)
+                except ProcessLookupError:
+                    pass
+
+    async def run_shard(
+        self,
+        case_ids: List[int],
+        run_id: int | None,
+        trigger: str,
+        deadline: datetime | None = None,
+    ) -> RunStats:
+        """
+        멀티 프로세스 실행에서 하위 프로세스가 맡은 사건을 받은 순서대로 조회하고 통계를 돌려줍니다.
+        실행 이력(erp_scheduler_runs)은 상위 프로세스가 기록합니다.
+        """
+
+        stats = RunStats(trigger=trigger)
+        stats.deadline = deadline
+        token = current_run.set(stats)
+        run_token = run_id_var.set(run_id)
+        try:
+            await self._run_cases(
+                stats, deadline=deadline, case_ids=case_ids, planned=True
+            )
+        finally:
+            stats.finish()
+            current_run.reset(token)
+            run_id_var.reset(run_token)
+        return stats
+
+    def request_profile(self, sample_rate: float = 1.0):
+        """
+        다음 스케줄러 실행 1회를 프로파일링하도록 예약합니다.
+        sample_rate 가 1 미만이면 해당 비율의 사건만 프로파일링합니다.
+        """
+
+        self.profile_next_run = sample_rate
+        logger.info(f"다음 스케줄러 실행 프로파일링 예약 (sample_rate={sample_rate})")
+
+    def _take_profiler(self) -> RunProfiler | None:
+        """
+        이번 실행에 사용할 프로파일러를 만듭니다.
+        관리자 API 예약이 우선이고, 없으면 Settings.PROFILE_RUNS 설정을 따릅니다.
+        """
+
+        sample_rate = self.profile_next_run
+        self.profile_next_run = None
+
+        if self.processes > 1:
+            if sample_rate is not None or settings.PROFILE_RUNS:
+                logger.info("멀티 프로세스 실행은 프로파일링하지 않습니다.")
+            return None
+
+        if sample_rate is None:
+            if not settings.PROFILE_RUNS:
+                return None
+            sample_rate = settings.PROFILE_CASE_SAMPLE_RATE
+
+        return RunProfiler(
+            output_dir=settings.PROFILE_DIR,
+            sample_rate=sample_rate,
+            top_n=settings.PROFILE_TOP_N,
+        )
+
+    async def _record_run_start(self, stats: RunStats) -> int | None:
+        """
+        실행 시작을 erp_scheduler_runs 에 기록합니다.
+        통계 기록 실패로 스케줄러 작업이 멈추면 안 되므로 오류는 로그만 남깁니다.
+        """
+
+        try:
+            async with AsyncSessionLocal() as session:
+                run_id = await SchedulerRunService(session).create_run(stats)
+                await session.commit()
+                return run_id
+        except Exception as e:
+            logger.error(f"스케줄러 실행 이력 생성 중 오류: {str(e)}")
+            return None
+
+    async def _record_run_finish(
+        self,
+        run_id: int | None,
+        stats: RunStats,
+        status: SchedulerRunStatus,
+        error: str | None,
+        checkpoint: List[int] | None = None,
+    ):
+        logger.info(
+            f"스케줄러 실행 통계 - 대상: {stats.cases_total}건, 성공: {stats.outcomes['success']}건, "
+            f"실패: {stats.outcomes['failed']}건, 스킵: {stats.outcomes['skipped']}건, "
+            f"변경: {stats.cases_changed}건, 소요: {stats.duration_seconds:.1f}초"
+        )
+        if not run_id:
+            return
+
+        try:
+            async with AsyncSessionLocal() as session:
+                await SchedulerRunService(session).finish_run(
+                    run_id, stats, status=status, error=error, checkpoint=checkpoint
+                )
+                await session.commit()
+        except Exception as e:
+            logger.error(f"스케줄러 실행 이력 갱신 중 오류: {str(e)}")
+
+    async def _run_cases(
+        self,
+        stats: RunStats,
+        profiler: RunProfiler | None = None,
+        deadline: datetime | None = None,
+        case_ids: List[int] | None = None,
+        planned: bool = False,
+    ):
+        """
+        대상 사건을 조회합니다.
+        조직별 공정 큐 순서로 조회하고, 조직별 한도를 넘는 사건은 다음 실행으로 미룹니다.
+        deadline 이 있으면(실행 시간대 모드) 조직 안에서는 기일이 가까운 사건부터,
+        종료 시각까지 고르게 나눠서 조회합니다.
+        case_ids 가 있으면 해당 사건만 조회합니다.(중단된 실행 이어서 조회)
+        planned 이면 case_ids 를 상위 프로세스가 정한 조회 순서로 보고 그대로 조회합니다.(멀티 프로세스 실행)
+        종료 요청을 받으면 새 사건 조회를 멈추고, 남은 사건은 stats.remaining_case_ids() 로 남습니다.
+        """
 
         # 작업 단위로 비동기 세션 생성/종료
         async with AsyncSessionLocal() as session:
-            parser = ParseCaseService(session)
+            parser = ParseCaseService(session, autocommit=False)
             repo = MyCaseService(session)
 
-            skip = 0
-            LIMIT = 10
+            if planned:
+                due = await self._load_planned_cases(repo, stats, case_ids or [])
+            else:
+                due = await self._plan_cases(session, repo, stats, deadline, case_ids)
+            # 사건 목록을 읽은 트랜잭션을 닫아서 첫 사건을 조회하는 동안 커넥션을 잡고 있지 않습니다.
+            await session.commit()
+
+            pacer: DispatchPacer | None = None
+            if deadline:
+                pacer = DispatchPacer(deadline)
+                logger.info(
+                    "실행 시간대 종료 %s 까지 %d건 조회 (평균 간격 %.1f초)",
+                    deadline.strftime("%H:%M"),
+                    len(due),
+                    max(pacer.seconds_left(), 0.0) / max(len(due), 1),
+                )
 
-            # 업데이트할 사건 목록 조회
-            logger.info(f"스케줄러 작업 시작")
-            while True:
-                cases = await repo.get_case_list_for_scheduler(skip=skip, limit=LIMIT)
-                if not cases:
+            stats.pending_case_ids = [case.case_id for case in due]
+            for index, case in enumerate(due):
+                stats.pending_index = index
+                if pacer and index:
+                    await pacer.wait(stop=self._draining)
+                if self._draining.is_set():
+                    logger.info("종료 요청으로 조회를 멈춥니다. 남은 사건: %d건", len(due) - index)
                     break
+                if pacer:
+                    if pacer.seconds_left() < 0:
+                        CASES_AFTER_DEADLINE.inc()
+                    pacer.dispatched(len(due) - index)
 
-                for case in cases:
-                    # 테스트용
-                    # if case.case_id != 189:
-                    #     continue
+                case_id_var.set(case.case_id)
+                wait_seconds = (
+                    datetime.now(timezone.utc) - stats.started_at
+                ).total_seconds()
+                with profiler.case(case.case_id) if profiler else nullcontext():
+                    # 같은 사건을 API 로 조회 중이면 그 결과를 같이 사용합니다.
+                    result, source = await self.refresher.run(
+                        refresh_key(case),
+                        lambda case=case: self._process_case(
+                            session, parser, repo, case
+                        ),
+                        use_cache=False,
+                    )
 
-                    logger.info(
-                        f"스케줄러 작업 대상 사건: {case.title}, 사건번호: {case.case_number}"
+                stats.pending_index = index + 1
+                if result and source == SOURCE_JOINED:
+                    # 합류한 조회의 결과는 그 작업에서만 집계되므로 이 실행 통계에도 남깁니다.
+                    stats.record_joined(
+                        result.outcome,
+                        reason=result.reason,
+                        history=len(result.history),
+                        trial=len(result.trial_info),
+                        updated_history=len(result.updated_history),
+                        updated_trial=len(result.updated_trial_info),
                     )
-                    if not case.client_name:
-                        logger.info(
-                            f"의뢰인 이름이 없어 사건 정보를 파싱하지 않습니다. 사건번호: {case.case_number}"
-                        )
-                        continue
 
-                    if not case.jurisdiction:
-                        logger.info(
-                            f"관할법원 정보가 없어 사건 정보를 파싱하지 않습니다. 사건번호: {case.case_number}"
-                        )
-                        continue
+                if result:
+                    stats.record_firm(case.firm_id, result.outcome, wait_seconds)
+                self._publish_case_done(
+                    stats,
+                    case,
+                    result.outcome if result else None,
+                    history=len(result.history) if result else 0,
+                    trial=len(result.trial_info) if result else 0,
+                )
 
-                    # 사건 번호 파싱
-                    parsed_case_number = self._parse_case_number(case.case_number)
-                    if not parsed_case_number:
-                        logger.info(
-                            f"사건번호가 형식에 맞지 않아서 사건 정보를 파싱하지 않습니다. 사건번호: {case.case_number}"
-                        )
-                        continue
-                    year, gubun, serial = parsed_case_number
+            case_id_var.set(None)
+            if pacer:
+                self._record_deadline(pacer)
+            logger.info("스케줄러 작업 종료")
 
-                    try:
-                        parsed_html = await parser.get_html_from_capcha_server(
-                            sch_bub_nm=case.jurisdiction,
-                            sel_sa_year=year,
-                            sa_gubun=gubun,
-                            sa_serial=serial,
-                            ds_nm=case.client_name,
-                        )
+    async def _plan_cases(
+        self,
+        session: AsyncSession,
+        repo: MyCaseService,
+        stats: RunStats,
+        deadline: datetime | None = None,
+        case_ids: List[int] | None = None,
+    ) -> List[CaseResponseForParser]:
+        """
+        이번 실행에서 조회할 사건을 조회 순서대로 돌려줍니다.
+        휴면/영구 실패/관할법원 확인 불가 사건과 조직별 한도를 넘은 사건은 skipped 로 기록합니다.
+        """
 
-                        result = await parser.update(
-                            html=parsed_html,
-                            case_id=case.case_id,
-                            agency_name=case.jurisdiction,
-                        )
+        if case_ids:
+            stats.cases_planned = len(case_ids)
+        else:
+            stats.cases_planned = await repo.count_cases_for_scheduler()
+        # 재조회 시각 전인 영구 실패 사건
+        failures = await ParseFailureService(session).get_active_failures()
+        # 휴면 사건(조회 주기를 늘림)
+        dormant = await DormancyService(session).get_dormant_cases(
+            idle_days=settings.DORMANCY_IDLE_DAYS
+        )
+        DORMANT_CASES.set(len(dormant))
+        today = datetime.now().date()
+        dormant_skipped = 0
+        # 법원 목록에서 찾지 못한 관할법원명별 사건 수(캡차 서버에 보내지 않고 한 번에 보고)
+        unknown_courts: dict[str, int] = {}
+        if dormant:
+            logger.info(
+                "휴면 사건 %d건은 %d일에 한 번만 조회합니다.",
+                len(dormant),
+                settings.DORMANCY_POLL_DAYS,
+            )
+        run_events.publish(
+            "run_started", {"runId": run_id_var.get(), **stats.progress()}
+        )
 
-                        # 스케줄러 동작 이력을 기록합니다.
-                        await repo.create_supremecourt_parse_history(
-                            case_id=case.case_id,
-                            method="scheduler",
-                            result="success",
-                        )
-                        await session.commit()
-                    except Exception as e:
-                        logger.error(
-                            f"사건 정보를 파싱하는 중 오류가 발생했습니다. 사건번호: {case.case_number}, 오류: {str(e)}"
-                        )
-                        await session.rollback()
-                        await repo.create_supremecourt_parse_history(
-                            case_id=case.case_id,
-                            method="scheduler",
-                            result=str(e),
-                        )
-                        await session.commit()
-                        continue
+        skip = 0
+        LIMIT = 10
 
-                    if not result.history and not result.trial_info:
-                        continue
+        # 업데이트할 사건 목록 조회
+        logger.info(f"스케줄러 작업 시작")
+        due: List[CaseResponseForParser] = []
+        while True:
+            cases = await repo.get_case_list_for_scheduler(
+                skip=skip, limit=LIMIT, case_ids=case_ids
+            )
+            if not cases:
+                break
 
-                    logger.info(
-                        f"대상사건: {case.title}({case.case_number}), 이력업데이트 {len(result.history) if result.history else 0}건, 기일업데이트 {len(result.trial_info) if result.trial_info else 0}건"
+            for case in cases:
+                # 테스트용
+                # if case.case_id != 189:
+                #     continue
+
+                case_id_var.set(case.case_id)
+                is_dormant_skip = case.case_id in dormant and not is_poll_day(
+                    case.case_id, today, settings.DORMANCY_POLL_DAYS
+                )
+                if is_dormant_skip:
+                    dormant_skipped += 1
+                is_unknown_court = bool(case.jurisdiction) and not normalize_court_name(
+                    case.jurisdiction
+                )
+                if is_unknown_court:
+                    unknown_courts[case.jurisdiction] = (
+                        unknown_courts.get(case.jurisdiction, 0) + 1
                     )
+                if (
+                    is_dormant_skip
+                    or is_unknown_court
+                    or self._in_backoff(case, failures.get(case.case_id))
+                ):
+                    record_case("skipped")
+                    stats.record_firm(case.firm_id, "skipped")
+                    self._publish_case_done(stats, case, "skipped")
+                    continue
 
-                    # 변호사 및 소속 조직구성원
-                    if (
-                        case.firm_id == 1
-                    ):  # 테스트를 위해 일단 디스커버리 사건만 알림톡을 보낸다.
-                        target_users = await repo.get_related_users(
-                            author_id=case.author_id,
-                            firm_id=case.firm_id,
-                            # author_id=72,
-                            # firm_id=None,
-                        )
+                due.append(case)
 
-                        # 테스트(테스트대표변호사, 테스트로펌)
-                        # target_users = await repo.get_related_users(
-                        #     author_id=72, firm_id=14
-                        # )
-
-                        # 사건 의뢰인(의뢰인에게 까지 보내야 하면 주석 해제)
-                        # target_users.extend(
-                        #     await repo.get_related_clients_by_case_id(
-                        #         case_id=case.case_id
-                        #     )
-                        # )
-
-                        # 알림톡 보내기
-                        await self._send_alimtalk(
-                            target_users=target_users,
-                            case=case,
-                            history=result.history,
-                            trial_info=result.trial_info,
-                        )
+            skip += LIMIT
 
-                        # 시스템 알림 생성. 백그라운드 태스크로 실행
-                        asyncio.create_task(
-                            self._create_system_notification(
-                                target_users=target_users,
-                                case=case,
-                                history=result.history,
-                                trial_info=result.trial_info,
-                            )
+        case_id_var.set(None)
+        if dormant_skipped:
+            logger.info("휴면 사건 %d건을 건너뛰었습니다.", dormant_skipped)
+        if unknown_courts:
+            self._report_unknown_courts(unknown_courts)
+
+        if deadline:
+            next_trials = await repo.get_next_trial_dates()
+            due.sort(key=lambda case: self._urgency(case, next_trials))
+
+        # 시간대 모드는 조직 안의 급한 사건이 미뤄지지 않도록 한도 구간을 돌리지 않습니다.
+        due, deferred = self.fair.order(
+            due, rotation=0 if deadline else today.toordinal()
+        )
+        for case in deferred:
+            record_case("skipped")
+            stats.record_firm(case.firm_id, "skipped")
+            self._publish_case_done(stats, case, "skipped")
+        if deferred:
+            logger.info("조직별 한도를 넘은 사건 %d건은 다음 실행으로 미룹니다.", len(deferred))
+        return due
+
+    async def _load_planned_cases(
+        self, repo: MyCaseService, stats: RunStats, case_ids: List[int]
+    ) -> List[CaseResponseForParser]:
+        """
+        상위 프로세스가 정한 사건을 그 순서대로 불러옵니다.(멀티 프로세스 실행)
+        그 사이 종결되었거나 사건번호/관할법원이 지워진 사건은 빠집니다.
+        """
+
+        stats.cases_planned = len(case_ids)
+        order = {case_id: index for index, case_id in enumerate(case_ids)}
+        cases: List[CaseResponseForParser] = []
+        skip = 0
+        LIMIT = 100
+        while True:
+            page = await repo.get_case_list_for_scheduler(
+                skip=skip, limit=LIMIT, case_ids=case_ids
+            )
+            if not page:
+                break
+            cases.extend(page)
+            skip += LIMIT
+        cases.sort(key=lambda case: order[case.case_id])
+        return cases
+
+    def _publish_case_done(
+        self,
+        stats: RunStats,
+        case: CaseResponseForParser,
+        outcome: str | None,
+        history: int = 0,
+        trial: int = 0,
+    ):
+        run_events.publish(
+            "case_done",
+            {
+                "caseId": case.case_id,
+                "caseNumber": case.case_number,
+                "outcome": outcome,
+                "caseNewHistory": history,
+                "caseNewTrial": trial,
+                **stats.progress(),
+            },
+        )
+
+    def _report_unknown_courts(self, unknown_courts: dict[str, int]):
+        """법원 목록에서 찾지 못한 관할법원명을 한 번에 남깁니다.(COURT_ALIASES 로 바로잡을 수 있음)"""
+
+        total = sum(unknown_courts.values())
+        UNKNOWN_COURT_CASES.inc(total)
+        logger.warning(
+            "관할법원명을 법원 목록에서 찾지 못해 %d건을 조회하지 않습니다. %s",
+            total,
+            ", ".join(
+                f"{name!r} {count}건"
+                for name, count in sorted(
+                    unknown_courts.items(), key=lambda item: -item[1]
+                )
+            ),
+        )
+
+    def _urgency(
+        self, case: CaseResponseForParser, next_trials: dict[int, datetime]
+    ) -> tuple:
+        """
+        실행 시간대 안에서의 조회 순서. 다가오는 기일이 빠른 사건이 먼저이고, 기일이 없는 사건은 뒤로 보냅니다.
+        """
+
+        next_trial = next_trials.get(case.case_id)
+        if next_trial is None:
+            return (1, case.case_id)
+        return (0, next_trial, case.case_id)
+
+    def _record_deadline(self, pacer: DispatchPacer):
+        slack = pacer.seconds_left()
+        RUN_DEADLINE_SLACK_SECONDS.set(slack)
+        if slack >= 0:
+            return
+
+        RUN_DEADLINE_MISSED.inc()
+        logger.warning(
+            "실행 시간대 종료 시각(%s)을 %.0f초 넘겼습니다.",
+            pacer.deadline.strftime("%H:%M"),
+            -slack,
+        )
+
+    def _in_backoff(
+        self, case: CaseResponseForParser, failure: ParseFailure | None
+    ) -> bool:
+        """
+        영구 실패로 재조회를 미룬 사건인지 확인합니다.
+        실패 이후 사건번호/관할법원/의뢰인이 바뀌었으면 다시 조회합니다.
+        """
+
+        if not failure or failure.fingerprint != case_fingerprint(case):
+            return False
+
+        logger.info(
+            "영구 실패 사건이라 조회를 건너뜁니다. 사건번호: %s, 사유: %s, 실패 횟수: %d, 재조회: %s",
+            case.case_number,
+            failure.failure_code,
+            failure.failure_count,
+            failure.next_attempt_at,
+        )
+        return True
+
+    async def refresh_case(
+        self, case_id: int, force: bool = False, method: str = "api"
+    ) -> tuple[CaseProcessResult | None, str]:
+        """
+        사건 1건을 즉시 조회합니다.(API 요청, app.worker cases)
+        스케줄러 실행과 같은 경로(조회 → 업데이트 → 알림)로 처리하고 (결과, 출처)를 돌려줍니다.
+        스케줄러 대상이 아닌 사건(종결, 사건번호/관할법원 없음)이면 결과는 None 입니다.
+
+        force: True 이면 캐시된 결과를 무시합니다.(진행 중인 조회에는 합류)
+        method: 파싱 이력에 남길 실행 방식
+        """
+
+        async with AsyncSessionLocal() as session:
+            case = await MyCaseService(session).get_case_for_scheduler(case_id)
+        if not case:
+            return None, SOURCE_FRESH
+
+        return await self.process_case(case, method=method, use_cache=not force)
+
+    async def process_case(
+        self,
+        case: CaseResponseForParser,
+        method: str,
+        use_cache: bool = True,
+    ) -> tuple[CaseProcessResult | None, str]:
+        """
+        스케줄러 실행 밖에서(API, 일괄 조회 작업) 사건 1건을 별도 세션으로 처리합니다.
+        진행 중인 같은 사건 조회가 있으면 합류하고, use_cache 이면 캐시된 결과를 사용합니다.
+        영구 실패로 재조회를 미룬 사건이어도 요청받은 것이므로 조회합니다.
+        """
+
+        async def job() -> CaseProcessResult:
+            async with AsyncSessionLocal() as session:
+                token = case_id_var.set(case.case_id)
+                try:
+                    return await self._process_case(
+                        session,
+                        ParseCaseService(session, autocommit=False),
+                        MyCaseService(session),
+                        case,
+                        method=method,
+                    )
+                finally:
+                    case_id_var.reset(token)
+
+        return await self.refresher.run(refresh_key(case), job, use_cache=use_cache)
+
+    async def _process_case(
+        self,
+        session: AsyncSession,
+        parser: ParseCaseService,
+        repo: MyCaseService,
+        case: CaseResponseForParser,
+        method: str = "scheduler",
+    ) -> CaseProcessResult:
+        """
+        사건 1건을 처리합니다.
+        캡차 서버에서 html 을 받아와 이력/기일을 업데이트하고, 새로 추가된 내용이 있으면 알림을 보냅니다.
+        사건의 쓰기(이력/기일, 실패 기록, 시스템 알림)는 한 트랜잭션으로 커밋하고, 알림톡은 커밋한 뒤에 보냅니다.
+        파싱 이력은 커밋한 뒤에 ParseHistoryWriter 로 모아서 기록합니다.
+
+        parser: autocommit=False 로 만든 ParseCaseService
+        method: 파싱 이력(erp_supremecourt_parse_history)에 남길 실행 방식(scheduler, api 등)
+        """
+
+        logger.info(
+            "스케줄러 작업 대상 사건: %s, 사건번호: %s",
+            case.title,
+            case.case_number,
+        )
+        if not case.client_name:
+            message = "의뢰인 이름이 없어 사건 정보를 파싱하지 않습니다."
+            logger.info("%s 사건번호: %s", message, case.case_number)
+            record_case("skipped")
+            return CaseProcessResult(case.case_id, "skipped", message)
+
+        if not case.jurisdiction:
+            message = "관할법원 정보가 없어 사건 정보를 파싱하지 않습니다."
+            logger.info("%s 사건번호: %s", message, case.case_number)
+            record_case("skipped")
+            return CaseProcessResult(case.case_id, "skipped", message)
+
+        # 관할법원명을 법원 목록의 이름으로 바꿉니다.(캡차 서버 요청 값)
+        court_name = normalize_court_name(case.jurisdiction)
+        if not court_name:
+            message = "관할법원명을 법원 목록에서 찾을 수 없어 사건 정보를 파싱하지 않습니다."
+            logger.info("%s 사건번호: %s, 관할법원: %r", message, case.case_number, case.jurisdiction)
+            UNKNOWN_COURT_CASES.inc()
+            record_case("skipped")
+            return CaseProcessResult(case.case_id, "skipped", message)
+
+        # 사건 번호 파싱
+        parsed_case_number = self._parse_case_number(case.case_number)
+        if not parsed_case_number:
+            message = "사건번호가 형식에 맞지 않아서 사건 정보를 파싱하지 않습니다."
+            logger.info("%s 사건번호: %s", message, case.case_number)
+            record_case("skipped")
+            return CaseProcessResult(case.case_id, "skipped", message)
+        year, gubun, serial = parsed_case_number
+
+        uow = CaseUnitOfWork(session)
+        try:
+            parsed_html = await parser.get_html_from_capcha_server(
+                sch_bub_nm=court_name,
+                sel_sa_year=year,
+                sa_gubun=gubun,
+                sa_serial=serial,
+                ds_nm=case.client_name,
+            )
+
+            # 이력/기일, 파싱 이력, 시스템 알림을 한 트랜잭션으로 커밋합니다.
+            await uow.begin_case()
+            result = await parser.update(
+                html=parsed_html,
+                case_id=case.case_id,
+                agency_name=court_name,
+            )
+
+            with track_stage(STAGE_PARSE_LOG):
+                await ParseFailureService(session).clear_failure(case.case_id)
+
+            send_alimtalk = await self._notify(session, repo, case, result)
+            processed = CaseProcessResult(
+                case.case_id,
+                "success",
+                history=result.history,
+                trial_info=result.trial_info,
+                updated_history=result.updated_history,
+                updated_trial_info=result.updated_trial_info,
+            )
+
+            # 성공 집계/파싱 이력/결과 캐시/알림톡은 쓰기가 커밋된 뒤에 남깁니다.
+            async def on_commit():
+                record_case("success")
+                record_new_rows(
+                    history=len(processed.history),
+                    trial=len(processed.trial_info),
+                    updated_history=len(processed.updated_history),
+                    updated_trial=len(processed.updated_trial_info),
+                )
+                # 스케줄러 동작 이력을 기록합니다.(모아서 기록)
+                await self.parse_history.add(case.case_id, method, "success")
+                self.refresher.cache(refresh_key(case), processed)
+                if send_alimtalk:
+                    await send_alimtalk()
+
+            async def on_rollback(error: Exception):
+                logger.error(
+                    f"사건 쓰기를 커밋하지 못해 실패로 기록합니다. 사건번호: {case.case_number}, 오류: {str(error)}"
+                )
+                processed.outcome = "failed"
+                processed.message = str(error)
+                processed.reason = failure_reason(error)
+                processed.history = processed.trial_info = []
+                processed.updated_history = processed.updated_trial_info = []
+                record_case("failed", reason=processed.reason)
+                await self.parse_history.add(case.case_id, method, str(error))
+
+            await uow.end_case(after_commit=on_commit, on_rollback=on_rollback)
+        except Exception as e:
+            logger.error(
+                f"사건 정보를 파싱하는 중 오류가 발생했습니다. 사건번호: {case.case_number}, 오류: {str(e)}"
+            )
+            reason = failure_reason(e)
+            record_case("failed", reason=reason)
+            kind, code = classify_failure(e)
+            await self.parse_history.add(case.case_id, method, str(e))
+            try:
+                await uow.rollback_case()
+                if kind == FAILURE_PERMANENT:
+                    logger.info(
+                        "영구 실패로 분류했습니다. 사건번호: %s, 코드: %s",
+                        case.case_number,
+                        code,
+                    )
+                    await uow.begin_case()
+                    with track_stage(STAGE_PARSE_LOG):
+                        await ParseFailureService(session).record_failure(
+                            case_id=case.case_id,
+                            fingerprint=case_fingerprint(case),
+                            failure_code=code,
+                            message=str(e),
+                            backoff_days=settings.PARSE_FAILURE_BACKOFF_DAYS,
+                            max_backoff_days=settings.PARSE_FAILURE_BACKOFF_MAX_DAYS,
                         )
+                    await uow.end_case()
+            except Exception as record_error:
+                # 실패 기록에 실패해도 다음 사건 처리는 계속합니다.(다음 실행에서 다시 조회)
+                logger.error(
+                    f"사건 실패를 기록하는 중 오류가 발생했습니다. 사건번호: {case.case_number}, 오류: {str(record_error)}"
+                )
+                try:
+                    await uow.rollback_case()
+                except Exception as rollback_error:
+                    logger.error(f"사건 쓰기를 되돌리는 중 오류가 발생했습니다. 오류: {str(rollback_error)}")
+            return CaseProcessResult(case.case_id, "failed", str(e), reason=reason)
 
-                skip += LIMIT
+        if (
+            result.history
+            or result.trial_info
+            or result.updated_history
+            or result.updated_trial_info
+        ):
+            logger.info(
+                "대상사건: %s(%s), 이력업데이트 %d건, 기일업데이트 %d건, 결과변경 이력 %d건, 기일 %d건",
+                case.title,
+                case.case_number,
+                len(result.history) if result.history else 0,
+                len(result.trial_info) if result.trial_info else 0,
+                len(result.updated_history),
+                len(result.updated_trial_info),
+            )
 
-            logger.info("스케줄러 작업 종료")
+        return processed
+
+    async def _notify(
+        self,
+        session: AsyncSession,
+        repo: MyCaseService,
+        case: CaseResponseForParser,
+        result: ParserUpdateResult,
+    ) -> Callable[[], Awaitable[None]] | None:
+        """
+        새로 추가되거나 결과가 바뀐 이력/기일이 있으면 시스템 알림을 사건 쓰기와 같은 트랜잭션에 생성하고,
+        커밋한 뒤에 보낼 알림톡 발송 작업을 돌려줍니다.
+        """
+
+        if (
+            not result.history
+            and not result.trial_info
+            and not result.updated_history
+            and not result.updated_trial_info
+        ):
+            return None
+
+        # 변호사 및 소속 조직구성원
+        if (
+            case.firm_id != 1
+        ):  # 테스트를 위해 일단 디스커버리 사건만 알림톡을 보낸다.
+            return None
+
+        target_users = await repo.get_related_users(
+            author_id=case.author_id,
+            firm_id=case.firm_id,
+            # author_id=72,
+            # firm_id=None,
+        )
+
+        # 테스트(테스트대표변호사, 테스트로펌)
+        # target_users = await repo.get_related_users(
+        #     author_id=72, firm_id=14
+        # )
+
+        # 사건 의뢰인(의뢰인에게 까지 보내야 하면 주석 해제)
+        # target_users.extend(
+        #     await repo.get_related_clients_by_case_id(
+        #         case_id=case.case_id
+        #     )
+        # )
+
+        await self._create_system_notification(
+            session=session,
+            target_users=target_users,
+            case=case,
+            history=result.history,
+            trial_info=result.trial_info,
+            updated=bool(result.updated_history or result.updated_trial_info),
+        )
+
+        # 알림톡 보내기(새로 추가된 이력/기일만. 결과가 바뀐 경우는 시스템 알림만 생성)
+        if not result.history and not result.trial_info:
+            return None
+
+        async def send_alimtalk():
+            with track_stage(STAGE_ALIMTALK):
+                await self._send_alimtalk(
+                    target_users=target_users,
+                    case=case,
+                    history=result.history,
+                    trial_info=result.trial_info,
+                )
+
+        return send_alimtalk
 
     def _parse_case_number(self, case_number: str) -> tuple[str, str, str] | None:
         """
@@ -200,8 +1204,8 @@ class SupremeCourtScheduler:
         self,
         target_users: List[CaseRelatedUsers],
         case: CaseResponseForParser,
-        history: List[SupremCourtHistoryParsedResult],
-        trial_info: List[SupremCourtTrialInfoParsedResult],
+        history: List[HistoryRow],
+        trial_info: List[TrialInfoRow],
     ):
         if not history and not trial_info:
             return
@@ -270,44 +1274,45 @@ class SupremeCourtScheduler:
 
     async def _create_system_notification(
         self,
+        session: AsyncSession,
         target_users: List[CaseRelatedUsers],
         case: CaseResponseForParser,
-        history: List[SupremCourtHistoryParsedResult],
-        trial_info: List[SupremCourtTrialInfoParsedResult],
+        history: List[HistoryRow],
+        trial_info: List[TrialInfoRow],
+        updated: bool = False,
     ):
-        async with AsyncSessionLocal() as session:
-            repo = MyCaseService(session)
-            if history:
-                for user in target_users:
-                    try:
-                        await repo.create_system_notification(
-                            title="사건의 새 진행내용이 추가되었습니다.",
-                            content=f"[{case.case_number}/{case.jurisdiction}] {case.title}",
-                            case_id=case.case_id,
-                            user_id=user.user_id,
-                        )
-                        await session.commit()
-                    except Exception as e:
-                        await session.rollback()
-                        logger.error(
-                            f"시스템 알림(진행내용) 생성 중 오류 - 대상: {user.username}({user.user_id}), 사건번호: {case.case_number}, 오류: {str(e)}"
-                        )
+        """
+        사건 쓰기와 같은 트랜잭션에 시스템 알림을 생성합니다.(커밋은 호출하는 쪽에서)
+        알림 생성에 실패해도 사건 쓰기는 남도록 SAVEPOINT 안에서 생성합니다.
 
-            if trial_info:
-                for user in target_users:
-                    try:
-                        await repo.create_system_notification(
-                            title="사건의 새 기일이 추가되었습니다.",
-                            content=f"[{case.case_number}/{case.jurisdiction}] {case.title}",
-                            case_id=case.case_id,
-                            user_id=user.user_id,
-                        )
-                        await session.commit()
-                    except Exception as e:
-                        await session.rollback()
-                        logger.error(
-                            f"시스템 알림(기일) 생성 중 오류 - 대상: {user.username}({user.user_id}), 사건번호: {case.case_number}, 오류: {str(e)}"
-                        )
+        updated: 기존 이력/기일의 결과가 바뀐 경우. 새 이력/기일 알림과 따로 한 건 생성합니다.
+        """
+
+        notifications = []
+        if history:
+            notifications.append(("진행내용", "사건의 새 진행내용이 추가되었습니다."))
+        if trial_info:
+            notifications.append(("기일", "사건의 새 기일이 추가되었습니다."))
+        if updated:
+            notifications.append(("결과 변경", "사건 진행내용/기일의 결과가 변경되었습니다."))
+
+        with track_stage(STAGE_SYSTEM_NOTIFICATION):
+            repo = MyCaseService(session)
+            try:
+                async with session.begin_nested():
+                    for _, title in notifications:
+                        for user in target_users:
+                            await repo.create_system_notification(
+                                title=title,
+                                content=f"[{case.case_number}/{case.jurisdiction}] {case.title}",
+                                case_id=case.case_id,
+                                user_id=user.user_id,
+                            )
+            except Exception as e:
+                logger.error(
+                    f"시스템 알림({', '.join(kind for kind, _ in notifications)}) 생성 중 오류 - 사건번호: {case.case_number}, 오류: {str(e)}"
+                )
+                return
 
             logger.info(
                 f"시스템 알림 생성 완료 - 사건번호: {case.case_number}, 대상자 수: {len(target_users)}"
@@ -0,0 +1,75 @@
+"""
+멀티 프로세스 실행의 하위 프로세스 진입점
+
+상위 프로세스(SupremeCourtScheduler(processes=K))가 정기 실행마다 조회할 사건과 순서(조직별 공정 순서/한도)를 정하고,
+spawn 방식으로 하위 프로세스 K개를 띄워 run_shard() 에 나눈 사건 ID 목록을 넘깁니다.
+하위 프로세스는 받은 순서대로 조회하며, 새 인터프리터에서 시작하므로 DB 엔진/이벤트 루프를 각자 만듭니다.
+
+- 정기 실행(APScheduler)과 사건 변경 알림은 등록하지 않습니다.(상위 프로세스만 담당)
+- 로그는 프로세스마다 LOG_FILE.<index> 파일에 남깁니다.(같은 파일을 여러 프로세스가 로테이션하지 않도록)
+- SIGTERM/SIGINT 를 받으면 새 사건 조회를 멈추고 남은 사건을 통계로 돌려줍니다.(checkpoint 는 상위 프로세스가 기록)
+  상위 프로세스도 종료 요청을 받으면 하위 프로세스에 SIGTERM 을 보냅니다.
+- prometheus 지표와 사건별 진행 상황 이벤트(SSE)는 하위 프로세스 안에만 남습니다.(상위 프로세스에는 끝난 뒤 합친 통계만 전달)
+"""
+
+import asyncio
+import signal
+from datetime import datetime
+from typing import List, Optional
+
+from app.core.config import settings
+from app.core.logging_config import setup_logging, stop_logging
+from app.core.metrics import RunStats
+
+
+# 이벤트 루프를 만들기 전에 받은 종료 신호(시작 직후 상위 프로세스가 종료를 요청한 경우)
+_drain_requested = False
+
+
+def _remember_drain(signum, frame):
+    global _drain_requested
+    _drain_requested = True
+
+
+def init_shard_worker():
+    """하위 프로세스 시작 시 실행(ProcessPoolExecutor initializer). 사건을 받기 전의 종료 신호로 죽지 않도록 합니다."""
+
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        signal.signal(sig, _remember_drain)
+
+
+def run_shard(
+    shard_index: int,
+    case_ids: List[int],
+    run_id: Optional[int],
+    trigger: str,
+    deadline: Optional[datetime] = None,
+) -> RunStats:
+    settings.LOG_FILE = f"{settings.LOG_FILE}.{shard_index}"
+    setup_logging()
+    try:
+        return asyncio.run(_run_shard(case_ids, run_id, trigger, deadline))
+    finally:
+        stop_logging()
+
+
+async def _run_shard(
+    case_ids: List[int],
+    run_id: Optional[int],
+    trigger: str,
+    deadline: Optional[datetime],
+) -> RunStats:
+    from app.service.scheduler import SupremeCourtScheduler
+
+    scheduler = SupremeCourtScheduler()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(sig, scheduler.request_drain)
+    if _drain_requested:
+        scheduler.request_drain()
+
+    try:
+        return await scheduler.run_shard(case_ids, run_id, trigger, deadline)
+    finally:
+        # 진행 중인 사건 처리까지 기다림
+        await scheduler.shutdown()
@@ -0,0 +1,151 @@
+"""
+사건별 마지막 반영 상태(snapshot)로 새 행 고르기
+
+대법원 사건 정보는 사건 이력/변론기일 표에 새 행이 뒤에 붙는 형태로 바뀌므로
+마지막으로 반영한 파싱 결과의 행 수와 해시만 erp_supremecourt_case_snapshots 에 남겨두고,
+새로 받아온 결과의 앞부분이 같으면 뒤에 붙은 행만 새 행으로 봅니다.
+요약이 없거나 앞부분이 달라진 경우(법원에서 기존 행 수정 등)에만 기존 테이블 전체와 비교합니다.
+
+요약은 행을 추가하는 트랜잭션 안에서 같이 갱신하므로 추가가 롤백되면 요약도 그대로 남습니다.
+"""
+
+import hashlib
+from typing import List, Optional, Sequence, Tuple, TypeVar
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.metrics import SNAPSHOT_LOOKUPS
+
+Row = TypeVar("Row", bound=Tuple)
+
+SNAPSHOT_HISTORY = "history"
+SNAPSHOT_TRIAL = "trial"
+
+_GET_SNAPSHOT_SQL = text(
+    """
+    SELECT
+        case_id
+        , history_count
+        , history_digest
+        , trial_count
+        , trial_digest
+    FROM erp_supremecourt_case_snapshots
+    WHERE case_id = :case_id
+    """
+)
+
+# 사건 이력/변론기일 요약을 따로 갱신하는 upsert(같은 SQL 문자열로 prepared statement 를 재사용)
+_SAVE_SNAPSHOT_SQL = {
+    prefix: text(
+        f"""
+    INSERT INTO erp_supremecourt_case_snapshots (
+        case_id
+        , {prefix}_count
+        , {prefix}_digest
+        , updated_at
+    ) VALUES (
+        :case_id
+        , :count
+        , :digest
+        , now()
+    )
+    ON CONFLICT (case_id) DO UPDATE SET
+        {prefix}_count = EXCLUDED.{prefix}_count
+        , {prefix}_digest = EXCLUDED.{prefix}_digest
+        , updated_at = now()
+    """
+    )
+    for prefix in (SNAPSHOT_HISTORY, SNAPSHOT_TRIAL)
+}
+
+
+def rows_digest(rows: Sequence[Tuple]) -> bytes:
+    """파싱 결과 행들을 순서대로 이어 붙인 해시"""
+
+    digest = hashlib.blake2b(digest_size=16)
+    for row in rows:
+        digest.update("\x1f".join([field or "" for field in row]).encode("utf-8"))
+        digest.update(b"\x1e")
+    return digest.digest()
+
+
+def new_rows_since_snapshot(
+    kind: str,
+    parsed_results: List[Row],
+    count: Optional[int],
+    digest: Optional[bytes],
+) -> Optional[List[Row]]:
+    """
+    요약과 비교해서 뒤에 새로 붙은 행을 돌려줍니다.
+    요약이 없거나 앞부분이 달라졌으면 None(기존 테이블과 전체 비교 필요)
+    """
+
+    if count is None or digest is None:
+        SNAPSHOT_LOOKUPS.labels(kind=kind, result="miss").inc()
+        return None
+    if len(parsed_results) < count or rows_digest(parsed_results[:count]) != digest:
+        SNAPSHOT_LOOKUPS.labels(kind=kind, result="mismatch").inc()
+        return None
+
+    SNAPSHOT_LOOKUPS.labels(kind=kind, result="hit").inc()
+    return parsed_results[count:]
+
+
+class CaseSnapshot:
+    """erp_supremecourt_case_snapshots 1건"""
+
+    def __init__(
+        self,
+        case_id: int,
+        history_count: Optional[int] = None,
+        history_digest: Optional[bytes] = None,
+        trial_count: Optional[int] = None,
+        trial_digest: Optional[bytes] = None,
+    ):
+        self.case_id = case_id
+        self.history_count = history_count
+        self.history_digest = history_digest
+        self.trial_count = trial_count
+        self.trial_digest = trial_digest
+
+
+class CaseSnapshotService:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get_snapshot(self, case_id: int) -> CaseSnapshot:
+        """사건의 요약을 조회합니다. 없으면 빈 요약을 돌려줍니다."""
+
+        result = await self.db.execute(
+            _GET_SNAPSHOT_SQL,
+            {"case_id": case_id},
+        )
+        row = result.fetchone()
+        if not row:
+            return CaseSnapshot(case_id=case_id)
+
+        return CaseSnapshot(
+            case_id=row.case_id,
+            history_count=row.history_count,
+            history_digest=bytes(row.history_digest) if row.history_digest else None,
+            trial_count=row.trial_count,
+            trial_digest=bytes(row.trial_digest) if row.trial_digest else None,
+        )
+
+    async def save_history(self, case_id: int, rows: Sequence[Tuple]) -> None:
+        """사건 이력 요약을 갱신합니다. (커밋은 호출하는 쪽에서)"""
+
+        await self._save(case_id, SNAPSHOT_HISTORY, len(rows), rows_digest(rows))
+
+    async def save_trial_info(self, case_id: int, rows: Sequence[Tuple]) -> None:
+        """변론기일 요약을 갱신합니다. (커밋은 호출하는 쪽에서)"""
+
+        await self._save(case_id, SNAPSHOT_TRIAL, len(rows), rows_digest(rows))
+
+    async def _save(self, case_id: int, prefix: str, count: int, digest: bytes) -> None:
+        # prefix: SNAPSHOT_HISTORY / SNAPSHOT_TRIAL (컬럼명 앞부분)
+        await self.db.execute(
+            _SAVE_SNAPSHOT_SQL[prefix],
+            {"case_id": case_id, "count": count, "digest": digest},
+        )
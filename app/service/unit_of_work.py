@@ -0,0 +1,75 @@
+"""
+사건 처리 쓰기 단위(unit of work)
+
+사건 1건의 쓰기(사건 이력/기일, 마지막 반영 상태, 실패 기록, 시스템 알림)를 한 트랜잭션으로 커밋합니다.
+트랜잭션은 캡차 서버 조회가 끝난 뒤(begin_case) 시작해서 쓰기가 끝나면(end_case) 바로 커밋하므로
+네트워크 요청 동안에는 커넥션과 행 잠금을 잡고 있지 않습니다.
+(여러 사건을 한 트랜잭션으로 묶으면 다음 사건을 조회하는 동안 트랜잭션이 열려 있으므로 묶지 않습니다.)
+
+알림톡처럼 되돌릴 수 없는 작업과 성공 집계는 end_case(after_commit=...) 로 넘겨서 커밋한 뒤에 실행합니다.
+(커밋에 실패하면 보내지 않고, 다음 실행에서 같은 이력을 새로 찾아 보냅니다.)
+커밋에 실패해도 예외를 올리지 않고 on_rollback 작업을 실행하므로 다음 사건 처리는 계속됩니다.
+"""
+
+import logging
+from typing import Awaitable, Callable, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.metrics import STAGE_DB_COMMIT, track_stage
+from app.core.session import acquire_connection
+
+logger = logging.getLogger(__name__)
+
+AfterCommit = Callable[[], Awaitable[None]]
+# 커밋에 실패했을 때 실행할 작업. 커밋 오류를 받습니다.
+OnRollback = Callable[[Exception], Awaitable[None]]
+
+
+class CaseUnitOfWork:
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def begin_case(self):
+        """사건 쓰기를 시작할 때 호출합니다. 트랜잭션이 없으면 커넥션을 할당합니다."""
+
+        if not self.session.in_transaction():
+            await acquire_connection(self.session)
+
+    async def rollback_case(self):
+        """사건 처리 중 오류가 나면 이 사건의 쓰기를 되돌립니다."""
+
+        await self.session.rollback()
+
+    async def end_case(
+        self,
+        after_commit: Optional[AfterCommit] = None,
+        on_rollback: Optional[OnRollback] = None,
+    ):
+        """
+        사건 쓰기를 커밋합니다.
+        after_commit: 이 사건의 쓰기가 커밋된 뒤에 실행할 작업
+        on_rollback: 커밋에 실패해서 이 사건의 쓰기가 되돌려졌을 때 실행할 작업
+        """
+
+        try:
+            with track_stage(STAGE_DB_COMMIT):
+                await self.session.commit()
+        except Exception as e:
+            logger.error("사건 쓰기를 커밋하지 못했습니다. 오류: %s", str(e))
+            try:
+                await self.session.rollback()
+            except Exception as rollback_error:
+                logger.error(f"사건 쓰기를 되돌리는 중 오류가 발생했습니다. 오류: {str(rollback_error)}")
+            if on_rollback:
+                await self._run(lambda: on_rollback(e))
+            return
+
+        if after_commit:
+            await self._run(after_commit)
+
+    async def _run(self, callback: AfterCommit):
+        try:
+            await callback()
+        except Exception as e:
+            logger.error(f"커밋 후 작업 중 오류가 발생했습니다. 오류: {str(e)}")
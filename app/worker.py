@@ -0,0 +1,115 @@
+"""
+API 서버 없이 스케줄러만 실행하는 진입점
+
+메모리가 작은 서버에서 FastAPI/uvicorn 없이 스케줄러만 띄우거나, 1회 실행할 때 사용합니다.
+(API, /metrics, SSE 가 필요하면 기존처럼 uvicorn app.main:app 으로 실행합니다.)
+
+    $ python -m app.worker run              # 상시 실행(정기 실행 + 사건 변경 알림). SIGTERM/SIGINT 로 종료
+    $ python -m app.worker once             # 정기 실행 작업을 지금 1회 실행하고 종료
+    $ python -m app.worker cases 12 34      # 지정한 사건만 조회하고 종료
+    $ python -m app.worker run -p 4         # 정기 실행을 프로세스 4개로 나눠서 조회(기본 WORKER_PROCESSES)
+
+스케줄러/DB 모듈은 명령을 확인한 뒤에 불러옵니다.(--help 등은 설정 없이도 동작)
+"""
+
+import argparse
+import asyncio
+import logging
+import signal
+import sys
+from typing import List
+
+logger = logging.getLogger("app.worker")
+
+
+async def _run_forever(processes: int) -> int:
+    from app.service.scheduler import SupremeCourtScheduler
+
+    scheduler = SupremeCourtScheduler(processes=processes)
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(sig, stop.set)
+
+    await scheduler.start()
+    try:
+        await stop.wait()
+    finally:
+        await scheduler.shutdown()
+    return 0
+
+
+async def _run_once(processes: int) -> int:
+    from app.service.scheduler import SupremeCourtScheduler
+
+    scheduler = SupremeCourtScheduler(processes=processes)
+    try:
+        await scheduler.run_once(trigger="manual")
+    finally:
+        # 진행 중인 사건 처리까지 기다림
+        await scheduler.shutdown()
+    return 0
+
+
+async def _run_cases(case_ids: List[int]) -> int:
+    from app.service.scheduler import SupremeCourtScheduler
+
+    scheduler = SupremeCourtScheduler()
+    failed = 0
+    try:
+        for case_id in case_ids:
+            result, _ = await scheduler.refresh_case(case_id, method="cli")
+            if result is None:
+                failed += 1
+                print(f"{case_id}\tnot_found\t사건이 없거나 나의 사건 정보 조회 대상이 아닙니다.")
+                continue
+            if result.outcome == "failed":
+                failed += 1
+            print(
+                f"{case_id}\t{result.outcome}\t"
+                f"이력 {len(result.history)}건, 기일 {len(result.trial_info)}건, "
+                f"결과 변경 {len(result.updated_history) + len(result.updated_trial_info)}건"
+                + (f"\t{result.message}" if result.message else "")
+            )
+    finally:
+        await scheduler.shutdown()
+    return 1 if failed else 0
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m app.worker", description="나의사건정보 스케줄러(API 서버 없이 실행)"
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+    run = commands.add_parser("run", help="상시 실행(정기 실행 + 사건 변경 알림)")
+    once = commands.add_parser("once", help="정기 실행 작업을 지금 1회 실행")
+    for command in (run, once):
+        command.add_argument(
+            "-p",
+            "--processes",
+            type=int,
+            default=None,
+            help="정기 실행을 나눠서 조회할 프로세스 수(기본 WORKER_PROCESSES)",
+        )
+    cases = commands.add_parser("cases", help="지정한 사건만 조회")
+    cases.add_argument("case_ids", nargs="+", type=int, metavar="CASE_ID")
+    args = parser.parse_args(argv)
+
+    from app.core.config import settings
+    from app.core.logging_config import setup_logging, stop_logging
+
+    setup_logging()
+    try:
+        if args.command == "run":
+            return asyncio.run(
+                _run_forever(args.processes or settings.WORKER_PROCESSES)
+            )
+        if args.command == "once":
+            return asyncio.run(_run_once(args.processes or settings.WORKER_PROCESSES))
+        return asyncio.run(_run_cases(args.case_ids))
+    finally:
+        stop_logging()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,223 @@
+"""
+ParseCaseService 파서/필터 마이크로 벤치마크
+
+사용법
+    $ python -m benchmarks.bench_parser
+    $ python -m benchmarks.bench_parser --json bench.json
+    $ python -m benchmarks.bench_parser --compare bench.json --threshold 0.15
+
+각 함수 x 코퍼스 페이지 조합에 대해 초당 실행 횟수(ops/sec)와
+1회 호출당 메모리 할당 최대치(peak KiB, tracemalloc)를 측정합니다.
+--compare 로 이전 결과를 넘기면 ops/sec 가 threshold 이상 떨어진 항목이 있을 때 1 로 종료합니다.
+파서 구현이나 BeautifulSoup 백엔드를 바꿀 때 전후 비교 용도로 사용하세요.
+"""
+
+import argparse
+import json
+import logging
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Coroutine, Dict, List
+
+from benchmarks.corpus import build_corpus
+from app.service.mycase import HistoryRecord, TrialInfoRecord
+from app.service.parser import ParseCaseService
+from app.service.snapshot import SNAPSHOT_HISTORY, new_rows_since_snapshot, rows_digest
+
+# 기존 DB 에 이미 저장되어 있다고 가정하는 행 수를 제외한 "새 행" 수
+NEW_ROWS = 3
+
+
+def run_sync(coro: Coroutine) -> Any:
+    """
+    파서 메소드는 async 이지만 내부에 await 가 없으므로
+    이벤트 루프 없이 코루틴을 직접 구동해서 루프 오버헤드를 측정에서 제외합니다.
+    """
+
+    try:
+        coro.send(None)
+    except StopIteration as stop:
+        return stop.value
+    raise RuntimeError("코루틴이 중단되었습니다. 이벤트 루프가 필요한 함수입니다.")
+
+
+def _existing_histories(parser: ParseCaseService, html: str) -> List[HistoryRecord]:
+    """
+    MyCaseService.get_supremCourt_history_records_by_case_id 가 돌려주는 형태의 기존 이력
+    첫 행은 결과가 비어 있던 것으로 두어 update 경로도 같이 측정합니다.
+    """
+
+    parsed = run_sync(parser.parse_history_from_html(html))
+    records = [
+        (idx + 1,) + tuple(pr)
+        for idx, pr in enumerate(parsed[: max(len(parsed) - NEW_ROWS, 0)])
+    ]
+    if records:
+        records[0] = records[0][:-1] + ("",)
+    return records
+
+
+def _existing_trials(parser: ParseCaseService, html: str) -> List[TrialInfoRecord]:
+    """MyCaseService.get_trial_info_records_by_case_id 가 돌려주는 형태의 기존 변론기일"""
+
+    parsed = run_sync(parser.parse_trial_info_from_html(html))
+    records = [
+        (idx + 1,) + tuple(pr)
+        for idx, pr in enumerate(parsed[: max(len(parsed) - NEW_ROWS, 0)])
+    ]
+    if records:
+        records[0] = records[0][:-1] + ("",)
+    return records
+
+
+def build_cases(parser: ParseCaseService) -> Dict[str, Callable[[], Any]]:
+    """
+    "함수명[페이지]" 이름으로 측정할 호출을 만듭니다.
+    파싱이 실패하는 페이지(malformed)는 예외 경로 자체를 측정합니다.
+    """
+
+    cases: Dict[str, Callable[[], Any]] = {}
+    for name, html in build_corpus().items():
+
+        def history(html=html):
+            try:
+                return run_sync(parser.parse_history_from_html(html))
+            except Exception:
+                return None
+
+        cases[f"parse_history_from_html[{name}]"] = history
+        cases[f"parse_trial_info_from_html[{name}]"] = (
+            lambda html=html: run_sync(parser.parse_trial_info_from_html(html))
+        )
+        cases[f"parse_agency_name[{name}]"] = lambda html=html: run_sync(
+            parser.parse_agency_name(html)
+        )
+
+        if history() is not None:
+            parsed_history = run_sync(parser.parse_history_from_html(html))
+            existing_history = _existing_histories(parser, html)
+            cases[f"diff_history_for_update[{name}]"] = (
+                lambda p=parsed_history, e=existing_history: run_sync(
+                    parser.diff_history_for_update(p, e)
+                )
+            )
+            # 요약(snapshot)의 앞부분 비교 경로: 마지막 NEW_ROWS 행이 새로 붙은 경우
+            known = parsed_history[: max(len(parsed_history) - NEW_ROWS, 0)]
+            cases[f"new_rows_since_snapshot[{name}]"] = (
+                lambda p=parsed_history, n=len(known), d=rows_digest(known): (
+                    new_rows_since_snapshot(SNAPSHOT_HISTORY, p, n, d)
+                )
+            )
+
+        parsed_trials = run_sync(parser.parse_trial_info_from_html(html))
+        if parsed_trials:
+            existing_trials = _existing_trials(parser, html)
+            cases[f"diff_trial_info_for_update[{name}]"] = (
+                lambda p=parsed_trials, e=existing_trials: run_sync(
+                    parser.diff_trial_info_for_update(p, e)
+                )
+            )
+
+    return cases
+
+
+def measure(fn: Callable[[], Any], min_time: float) -> Dict[str, float]:
+    # 워밍업
+    fn()
+
+    # 처리량: min_time 동안 반복 실행
+    rounds = 0
+    started = time.perf_counter()
+    elapsed = 0.0
+    while elapsed < min_time:
+        fn()
+        rounds += 1
+        elapsed = time.perf_counter() - started
+
+    # 할당량: 1회 호출 기준 peak 메모리와 남아있는 블록 수
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    tracemalloc.reset_peak()
+    result = fn()
+    _, peak = tracemalloc.get_traced_memory()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    del result
+
+    retained_blocks = sum(
+        stat.count_diff for stat in after.compare_to(before, "filename")
+    )
+
+    return {
+        "ops_per_sec": rounds / elapsed,
+        "mean_us": elapsed / rounds * 1_000_000,
+        "peak_kib": peak / 1024,
+        "retained_blocks": retained_blocks,
+    }
+
+
+def compare(
+    results: Dict[str, Dict[str, float]],
+    baseline: Dict[str, Dict[str, float]],
+    threshold: float,
+) -> List[str]:
+    regressions = []
+    for name, stats in results.items():
+        base = baseline.get(name)
+        if not base:
+            continue
+        drop = 1 - stats["ops_per_sec"] / base["ops_per_sec"]
+        if drop > threshold:
+            regressions.append(
+                f"{name}: {base['ops_per_sec']:.1f} -> {stats['ops_per_sec']:.1f} ops/sec ({drop:.0%} 감소)"
+            )
+    return regressions
+
+
+def main(argv: List[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description="ParseCaseService 벤치마크")
+    ap.add_argument("--min-time", type=float, default=0.5, help="항목별 측정 시간(초)")
+    ap.add_argument("-k", dest="keyword", default="", help="이름에 포함된 항목만 실행")
+    ap.add_argument("--json", dest="json_path", help="결과를 json 으로 저장")
+    ap.add_argument("--compare", dest="compare_path", help="비교할 이전 결과 json")
+    ap.add_argument(
+        "--threshold", type=float, default=0.15, help="허용하는 ops/sec 감소 비율"
+    )
+    args = ap.parse_args(argv)
+
+    # 대법원 페이지처럼 의도된 실패 경로에서 남기는 error 로그는 측정에 방해가 되므로 끕니다.
+    logging.disable(logging.CRITICAL)
+
+    parser = ParseCaseService()
+    results: Dict[str, Dict[str, float]] = {}
+
+    print(f"{'benchmark':<52} {'ops/sec':>12} {'mean(us)':>12} {'peak(KiB)':>10}")
+    for name, fn in build_cases(parser).items():
+        if args.keyword not in name:
+            continue
+        stats = measure(fn, args.min_time)
+        results[name] = stats
+        print(
+            f"{name:<52} {stats['ops_per_sec']:>12.1f} {stats['mean_us']:>12.1f} {stats['peak_kib']:>10.1f}"
+        )
+
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+
+    if args.compare_path:
+        with open(args.compare_path, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print("\n[성능 저하]")
+            for line in regressions:
+                print(f"  {line}")
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
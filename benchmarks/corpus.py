@@ -0,0 +1,136 @@
+"""
+파서 벤치마크용 대법원 나의 사건 검색 html 코퍼스
+
+실제 응답을 저장해두면 개인정보(당사자 이름 등)가 그대로 남기 때문에
+2025.05.27 기준 페이지 구조(thead > span, tbody > tr > td)를 그대로 흉내낸 html 을 생성해서 사용합니다.
+페이지 구조가 바뀌면 이 파일의 템플릿도 같이 수정해야 합니다.
+"""
+
+from datetime import datetime, timedelta
+from typing import Dict, List, Tuple
+from zoneinfo import ZoneInfo
+
+KST = ZoneInfo("Asia/Seoul")
+
+DATE_FMT = "%Y.%m.%d"
+TIME_FMT = "%H:%M"
+
+_HISTORY_CONTENTS = [
+    ("소장접수", ""),
+    ("소송비용납부서 제출", ""),
+    ("피고 답변서 제출", ""),
+    ("원고 준비서면 제출", ""),
+    ("변론기일(법정 제358호 10:30)", "속행"),
+    ("원고 증거신청서 제출", ""),
+    ("피고 소송대리인 위임장 제출", ""),
+    ("판결선고기일(법정 제358호 14:00)", "판결선고"),
+    ("판결정본 송달", "도달"),
+]
+
+_TRIAL_TYPES = ["변론기일", "변론준비기일", "조정기일", "판결선고기일"]
+
+
+def _history_rows(count: int, start: datetime) -> List[Tuple[str, str, str]]:
+    rows = []
+    for i in range(count):
+        content, result = _HISTORY_CONTENTS[i % len(_HISTORY_CONTENTS)]
+        date = (start + timedelta(days=i * 3)).strftime(DATE_FMT)
+        rows.append((date, f"{content} #{i + 1}", result))
+    return rows
+
+
+def _trial_rows(count: int, start: datetime) -> List[Tuple[str, str, str, str, str]]:
+    rows = []
+    for i in range(count):
+        dt = start + timedelta(days=i * 28, hours=(i % 4))
+        rows.append(
+            (
+                dt.strftime(DATE_FMT),
+                dt.strftime(TIME_FMT),
+                _TRIAL_TYPES[i % len(_TRIAL_TYPES)],
+                f"법정 제{358 + (i % 3)}호",
+                "속행" if i % 2 == 0 else "",
+            )
+        )
+    return rows
+
+
+def _thead(columns: List[str]) -> str:
+    ths = "".join(f"<th scope='col'><span>{c}</span></th>" for c in columns)
+    return f"<thead><tr>{ths}</tr></thead>"
+
+
+def _tbody(rows) -> str:
+    trs = "".join(
+        "<tr>" + "".join(f"<td><span>{cell}</span></td>" for cell in row) + "</tr>"
+        for row in rows
+    )
+    return f"<tbody>{trs}</tbody>"
+
+
+def _page(agency: str, history_rows, trial_rows=None) -> str:
+    # 당사자 / 기본 정보 테이블은 파서가 건너뛰어야 하는 "방해" 테이블입니다.
+    basic_table = (
+        "<table class='aglify-table'>"
+        + _thead(["구분", "이름", "종국결과"])
+        + _tbody([("원고", "홍길동", ""), ("피고", "주식회사 레몬", "")])
+        + "</table>"
+    )
+    history_table = (
+        "<table class='aglify-table'>"
+        + _thead(["일자", "내용", "결과", "공시문"])
+        + _tbody([row + ("",) for row in history_rows])
+        + "</table>"
+    )
+    trial_table = ""
+    if trial_rows is not None:
+        trial_table = (
+            "<table class='aglify-table'>"
+            + _thead(["일자", "시각", "기일구분", "기일장소", "결과"])
+            + _tbody(trial_rows)
+            + "</table>"
+        )
+
+    return (
+        "<html><head><meta charset='utf-8'><title>나의 사건 검색</title></head><body>"
+        "<div id='mf_wfm_header'><ul class='gnb'>"
+        + "".join(f"<li><a href='#'>메뉴{i}</a></li>" for i in range(30))
+        + "</ul></div>"
+        f"<h3 class='tit'>기본 내용 ({agency})</h3>"
+        + basic_table
+        + "<h3 class='tit'>최근 기일 내용</h3>"
+        + trial_table
+        + "<h3 class='tit'>진행 내용</h3>"
+        + history_table
+        + "</body></html>"
+    )
+
+
+def build_corpus() -> Dict[str, str]:
+    """
+    벤치마크 대상 페이지 모음을 생성합니다.
+
+    - small: 일반적인 1심 사건(이력 12건, 기일 4건)
+    - large: 장기 사건(이력 300건, 기일 40건)
+    - supreme: 대법원 사건(최근 기일 내용 테이블 없음)
+    - malformed: 진행 내용 테이블 헤더가 깨진 페이지(파싱 실패 경로)
+    """
+
+    start = datetime(2023, 1, 2, 10, 0)
+
+    malformed = _page(
+        "서울고등법원", _history_rows(20, start), _trial_rows(8, start)
+    ).replace("<span>내용</span>", "<b>내용</b>")
+    # 닫히지 않은 태그가 섞여 들어오는 경우도 재현합니다.
+    malformed = malformed.replace("</tbody>", "<tr><td>2024.01.01<td>", 1)
+
+    return {
+        "small": _page(
+            "서울중앙지방법원", _history_rows(12, start), _trial_rows(4, start)
+        ),
+        "large": _page(
+            "수원지방법원", _history_rows(300, start), _trial_rows(40, start)
+        ),
+        "supreme": _page("대법원", _history_rows(25, start), None),
+        "malformed": malformed,
+    }
@@ -0,0 +1,337 @@
+"""
+스케줄러 조회 쿼리 실행 계획 점검
+
+사용법
+    $ python -m benchmarks.explain_queries --analyze
+    $ python -m benchmarks.explain_queries --json plans.json
+    $ python -m benchmarks.explain_queries --compare plans.json --threshold 0.2
+
+리포지토리 메소드(MyCaseService 등)를 실제로 호출하면서, 실행하는 SQL 마다
+EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) 을 먼저 실행해서 실행 계획을 모읍니다.
+(SQL 을 따로 복사해두지 않으므로 리포지토리 쿼리를 고치면 바로 점검 대상이 됩니다.)
+
+- 주요 테이블(WATCHED_TABLES)을 Seq Scan 으로 읽는 항목이 있으면 1 로 종료합니다.
+  테이블 행 수(pg_class.reltuples)가 --min-rows 미만이면 Postgres 가 Seq Scan 을 고르는 게 정상이므로 제외합니다.
+- --compare 로 이전 결과를 넘기면 계획 비용(Total Cost)이 threshold 이상 늘어난 항목이 있을 때 1 로 종료합니다.
+
+운영 DB 가 아니라 운영 데이터를 복원한 로컬 Postgres 에서 실행합니다.
+빈 로컬 Postgres 에서는 benchmarks/explain_seed.sql 로 테이블/데이터를 만들고 마이그레이션을 적용한 뒤 실행합니다.
+조회는 모두 롤백하는 트랜잭션 안에서 실행합니다.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import sys
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.session import AsyncSessionLocal, engine
+from app.schema.case_schema import CaseHistoryEventType
+from app.service.dormancy import DormancyService
+from app.service.failure import ParseFailureService
+from app.service.mycase import MyCaseService
+from app.service.snapshot import CaseSnapshotService
+
+# Seq Scan 이 나오면 안 되는 테이블(사건 수/이력 수에 비례해서 커지는 테이블)
+WATCHED_TABLES = {
+    "erp_cases",
+    "erp_case_histories",
+    "erp_case_trial_info",
+    "erp_case_clients",
+    "erp_clients",
+    "users",
+    "erp_supremecourt_case_snapshots",
+    "erp_supremecourt_parse_failures",
+}
+
+Samples = Dict[str, Any]
+QueryCall = Callable[[AsyncSession, Samples], Awaitable[Any]]
+
+
+class ExplainSession:
+    """
+    리포지토리에 세션 대신 넘겨서, execute() 마다 같은 SQL/파라미터로 EXPLAIN 을 먼저 실행하고 계획을 모읍니다.
+    리포지토리 메소드가 결과를 그대로 쓸 수 있도록 원래 SQL 도 실행해서 돌려줍니다.
+    """
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+        self.plans: List[Dict[str, Any]] = []
+
+    async def execute(self, statement, params=None):
+        explain = text("EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) " + statement.text)
+        plan = (await self.session.execute(explain, params)).scalar()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        self.plans.append(plan[0])
+        return await self.session.execute(statement, params)
+
+
+# (이름, 호출, Seq Scan 을 허용하는 테이블)
+# 전체 사건을 세거나 모으는 쿼리는 erp_cases 전체를 읽는 게 정상이므로 허용합니다.
+QUERIES: List[Tuple[str, QueryCall, Set[str]]] = [
+    (
+        "get_supremCourt_history_records_by_case_id",
+        lambda db, s: MyCaseService(db).get_supremCourt_history_records_by_case_id(
+            s["history_case_id"]
+        ),
+        set(),
+    ),
+    (
+        "get_trial_info_records_by_case_id",
+        lambda db, s: MyCaseService(db).get_trial_info_records_by_case_id(
+            s["trial_case_id"]
+        ),
+        set(),
+    ),
+    (
+        "get_case_list_for_scheduler",
+        lambda db, s: MyCaseService(db).get_case_list_for_scheduler(skip=0, limit=100),
+        set(),
+    ),
+    (
+        "get_case_for_scheduler",
+        lambda db, s: MyCaseService(db).get_case_for_scheduler(s["history_case_id"]),
+        set(),
+    ),
+    (
+        "count_cases_for_scheduler",
+        lambda db, s: MyCaseService(db).count_cases_for_scheduler(),
+        {"erp_cases"},
+    ),
+    (
+        "get_next_trial_dates",
+        lambda db, s: MyCaseService(db).get_next_trial_dates(),
+        {"erp_cases"},
+    ),
+    (
+        "get_related_users",
+        lambda db, s: MyCaseService(db).get_related_users(
+            author_id=s["author_id"], firm_id=s["firm_id"]
+        ),
+        set(),
+    ),
+    (
+        "get_clients_by_case_id",
+        lambda db, s: MyCaseService(db).get_clients_by_case_id(s["history_case_id"]),
+        set(),
+    ),
+    (
+        "get_snapshot",
+        lambda db, s: CaseSnapshotService(db).get_snapshot(s["history_case_id"]),
+        set(),
+    ),
+    (
+        "get_active_failures",
+        lambda db, s: ParseFailureService(db).get_active_failures(),
+        set(),
+    ),
+    (
+        "get_dormant_cases",
+        lambda db, s: DormancyService(db).get_dormant_cases(
+            settings.DORMANCY_IDLE_DAYS
+        ),
+        {"erp_cases", "erp_case_histories"},
+    ),
+]
+
+
+async def pick_samples(session: AsyncSession) -> Samples:
+    """계획이 실제 규모를 반영하도록 이력/기일/조직 구성원이 가장 많은 값을 파라미터로 씁니다."""
+
+    history = await session.execute(
+        text(
+            """
+        SELECT case_id FROM erp_case_histories
+        WHERE event_type = :event_type
+        GROUP BY case_id ORDER BY COUNT(*) DESC LIMIT 1
+        """
+        ),
+        {"event_type": CaseHistoryEventType.COURT.value},
+    )
+    trial = await session.execute(
+        text(
+            """
+        SELECT case_id FROM erp_case_trial_info
+        WHERE source = :source
+        GROUP BY case_id ORDER BY COUNT(*) DESC LIMIT 1
+        """
+        ),
+        {"source": CaseHistoryEventType.COURT.value},
+    )
+    user = await session.execute(
+        text(
+            """
+        SELECT firm_id, MIN(id) AS author_id FROM users
+        WHERE firm_id IS NOT NULL AND phone IS NOT NULL
+        GROUP BY firm_id ORDER BY COUNT(*) DESC LIMIT 1
+        """
+        )
+    )
+    history_case_id = history.scalar()
+    trial_case_id = trial.scalar()
+    user_row = user.fetchone()
+    if history_case_id is None or trial_case_id is None or user_row is None:
+        raise RuntimeError(
+            "법원 사건 이력/기일/조직 구성원 데이터가 없습니다. "
+            "운영 데이터를 복원하거나 benchmarks/explain_seed.sql 로 데이터를 넣은 DB 에서 실행하세요."
+        )
+
+    return {
+        "history_case_id": history_case_id,
+        "trial_case_id": trial_case_id,
+        "firm_id": user_row.firm_id,
+        "author_id": user_row.author_id,
+    }
+
+
+async def table_rows(session: AsyncSession) -> Dict[str, float]:
+    result = await session.execute(
+        text("SELECT relname, reltuples FROM pg_class WHERE relname = ANY(:names)"),
+        {"names": sorted(WATCHED_TABLES)},
+    )
+    return {row.relname: row.reltuples for row in result.fetchall()}
+
+
+def walk(node: Dict[str, Any]):
+    yield node
+    for child in node.get("Plans", []):
+        yield from walk(child)
+
+
+def seq_scans(
+    plan: Dict[str, Any], allowed: Set[str], rows: Dict[str, float], min_rows: int
+) -> List[str]:
+    """계획에서 허용하지 않은 주요 테이블 Seq Scan 을 찾습니다."""
+
+    found = []
+    for node in walk(plan["Plan"]):
+        relation = node.get("Relation Name")
+        if node.get("Node Type") != "Seq Scan" or relation not in WATCHED_TABLES:
+            continue
+        if relation in allowed or rows.get(relation, 0) < min_rows:
+            continue
+        found.append(relation)
+    return found
+
+
+def summarize(plan: Dict[str, Any]) -> Dict[str, float]:
+    root = plan["Plan"]
+    return {
+        "total_cost": root["Total Cost"],
+        "execution_ms": plan.get("Execution Time", 0.0),
+        "shared_hit": root.get("Shared Hit Blocks", 0),
+        "shared_read": root.get("Shared Read Blocks", 0),
+    }
+
+
+def compare(
+    results: Dict[str, Dict[str, float]],
+    baseline: Dict[str, Dict[str, float]],
+    threshold: float,
+) -> List[str]:
+    regressions = []
+    for name, stats in results.items():
+        base = baseline.get(name)
+        if not base or not base["total_cost"]:
+            continue
+        growth = stats["total_cost"] / base["total_cost"] - 1
+        if growth > threshold:
+            regressions.append(
+                f"{name}: cost {base['total_cost']:.1f} -> {stats['total_cost']:.1f} ({growth:.0%} 증가)"
+            )
+    return regressions
+
+
+async def run(args) -> Tuple[Dict[str, Dict[str, float]], List[str]]:
+    results: Dict[str, Dict[str, float]] = {}
+    violations: List[str] = []
+
+    async with AsyncSessionLocal() as session:
+        try:
+            if args.analyze:
+                for table in sorted(WATCHED_TABLES):
+                    await session.execute(text(f"ANALYZE {table}"))
+            samples = await pick_samples(session)
+            rows = await table_rows(session)
+
+            print(
+                f"{'query':<52} {'cost':>12} {'time(ms)':>10} {'hit':>8} {'read':>8}"
+            )
+            for name, call, allowed in QUERIES:
+                if args.keyword not in name:
+                    continue
+                explain = ExplainSession(session)
+                await call(explain, samples)
+                for index, plan in enumerate(explain.plans):
+                    key = name if len(explain.plans) == 1 else f"{name}#{index}"
+                    stats = summarize(plan)
+                    results[key] = stats
+                    scans = seq_scans(plan, allowed, rows, args.min_rows)
+                    print(
+                        f"{key:<52} {stats['total_cost']:>12.1f} {stats['execution_ms']:>10.2f}"
+                        f" {stats['shared_hit']:>8} {stats['shared_read']:>8}"
+                        + (f"  Seq Scan: {', '.join(scans)}" if scans else "")
+                    )
+                    violations.extend(f"{key}: Seq Scan on {table}" for table in scans)
+        finally:
+            await session.rollback()
+
+    await engine.dispose()
+    return results, violations
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    ap = argparse.ArgumentParser(description="스케줄러 조회 쿼리 실행 계획 점검")
+    ap.add_argument("-k", dest="keyword", default="", help="이름에 포함된 항목만 실행")
+    ap.add_argument(
+        "--analyze", action="store_true", help="점검 전에 주요 테이블 통계를 갱신(ANALYZE)"
+    )
+    ap.add_argument(
+        "--min-rows",
+        type=int,
+        default=10000,
+        help="이 행 수 미만인 테이블의 Seq Scan 은 허용",
+    )
+    ap.add_argument("--json", dest="json_path", help="결과를 json 으로 저장")
+    ap.add_argument("--compare", dest="compare_path", help="비교할 이전 결과 json")
+    ap.add_argument(
+        "--threshold", type=float, default=0.2, help="허용하는 계획 비용 증가 비율"
+    )
+    args = ap.parse_args(argv)
+
+    logging.disable(logging.CRITICAL)
+
+    results, violations = asyncio.run(run(args))
+
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+
+    failed = False
+    if violations:
+        print("\n[Seq Scan]")
+        for line in violations:
+            print(f"  {line}")
+        failed = True
+
+    if args.compare_path:
+        with open(args.compare_path, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print("\n[계획 비용 증가]")
+            for line in regressions:
+                print(f"  {line}")
+            failed = True
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
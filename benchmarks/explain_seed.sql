@@ -0,0 +1,233 @@
+-- 쿼리 실행 계획 점검(benchmarks/explain_queries.py)용 시드 데이터
+--
+-- 빈 로컬 Postgres 에 스케줄러가 읽는 ERP 테이블(스케줄러가 쓰는 컬럼만)을 만들고 운영과 비슷한 분포로 데이터를 넣은 뒤
+-- migrations/001~008 을 적용합니다. 난수는 setseed 로 고정해서 실행할 때마다 같은 데이터가 만들어집니다.
+-- 운영 데이터를 복원한 DB 에는 실행하지 않습니다.(erp_cases 에 행이 있으면 중단)
+--
+--   $ createdb scourt_explain
+--   $ psql -d scourt_explain -f benchmarks/explain_seed.sql
+--   $ DATABASE=scourt_explain python -m benchmarks.explain_queries --analyze --json plans.json
+--
+-- 행 수(대략): 사건 20,000 / 법원 사건 이력 300,000 / 기일 80,000 / 의뢰인 20,000 / 사건 의뢰인 24,000 / 사용자 12,000
+-- - 사건 ID 가 1000 의 배수인 사건은 이력 300건, 1000 으로 나눈 나머지가 500 인 사건은 기일 100건(긴 사건)
+-- - 다가오는 기일은 사건 20건 중 1건에만 있습니다.(get_next_trial_dates 가 인덱스로 읽는지 확인)
+-- - 사건 10건 중 1건은 판결확정 후 90일 넘게 이력이 없는 휴면 사건입니다.
+
+\set ON_ERROR_STOP on
+
+CREATE TABLE IF NOT EXISTS erp_cases (
+    id BIGSERIAL PRIMARY KEY,
+    title VARCHAR(255) NOT NULL,
+    status VARCHAR(20) NOT NULL,
+    case_number VARCHAR(50),
+    jurisdiction VARCHAR(100),
+    author_id BIGINT NOT NULL,
+    firm_id BIGINT
+);
+
+DO $$
+BEGIN
+    IF EXISTS (SELECT 1 FROM erp_cases) THEN
+        RAISE EXCEPTION 'erp_cases 에 데이터가 있습니다. 빈 DB 에서 실행하세요.';
+    END IF;
+END
+$$;
+
+CREATE TABLE IF NOT EXISTS users (
+    id BIGSERIAL PRIMARY KEY,
+    username VARCHAR(100) NOT NULL,
+    firm_id BIGINT,
+    dtype VARCHAR(31),
+    phone VARCHAR(20)
+);
+
+CREATE TABLE IF NOT EXISTS erp_user_notification_setting (
+    user_id BIGINT PRIMARY KEY,
+    new_history BOOLEAN,
+    new_trial BOOLEAN
+);
+
+CREATE TABLE IF NOT EXISTS erp_clients (
+    id BIGSERIAL PRIMARY KEY,
+    name VARCHAR(100),
+    client_type VARCHAR(10),
+    address VARCHAR(255),
+    detailed_address VARCHAR(255),
+    postal_code VARCHAR(10),
+    referral_source VARCHAR(100),
+    resident_registration_number VARCHAR(20),
+    contact_number_1 VARCHAR(20),
+    contact_number_2 VARCHAR(20),
+    email VARCHAR(255),
+    tax_invoice_email VARCHAR(255),
+    corporation_name VARCHAR(255),
+    corporation_representative_name VARCHAR(100),
+    business_registration_number VARCHAR(20),
+    corporation_registration_number VARCHAR(20),
+    manager_name VARCHAR(100),
+    registering_firm_id BIGINT
+);
+
+CREATE TABLE IF NOT EXISTS erp_case_clients (
+    id BIGSERIAL PRIMARY KEY,
+    case_id BIGINT NOT NULL,
+    client_id BIGINT NOT NULL,
+    is_opponent INTEGER NOT NULL DEFAULT 0,
+    litigant_role VARCHAR(20)
+);
+
+CREATE TABLE IF NOT EXISTS erp_case_histories (
+    id BIGSERIAL PRIMARY KEY,
+    case_id BIGINT NOT NULL,
+    event_type VARCHAR(20) NOT NULL,
+    event_type2 VARCHAR(30),
+    prev_value JSONB,
+    curr_value JSONB,
+    details TEXT,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+    result VARCHAR(100)
+);
+
+CREATE TABLE IF NOT EXISTS erp_case_trial_info (
+    id BIGSERIAL PRIMARY KEY,
+    case_id BIGINT NOT NULL,
+    trial_date TIMESTAMPTZ NOT NULL,
+    trial_agency VARCHAR(100),
+    trial_agency_address_detail VARCHAR(255),
+    trial_result VARCHAR(100),
+    trial_type VARCHAR(50),
+    source VARCHAR(20)
+);
+
+CREATE TABLE IF NOT EXISTS erp_supremecourt_parse_history (
+    id BIGSERIAL PRIMARY KEY,
+    case_id BIGINT NOT NULL,
+    method VARCHAR(20),
+    result TEXT,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+
+SELECT setseed(0.42);
+
+-- 조직 200개, 조직마다 구성원 60명(마지막 한 명씩은 전화번호 없음)
+INSERT INTO users (id, username, firm_id, dtype, phone)
+SELECT
+    u
+    , '사용자' || u
+    , 1 + (u - 1) % 200
+    , CASE WHEN u <= 200 THEN 'Lawyer' ELSE 'Staff' END
+    , CASE WHEN u > 11800 THEN NULL ELSE '010' || lpad(u::text, 8, '0') END
+FROM generate_series(1, 12000) AS u;
+
+INSERT INTO erp_user_notification_setting (user_id, new_history, new_trial)
+SELECT u, random() < 0.9, random() < 0.9
+FROM generate_series(1, 12000, 2) AS u;
+
+-- 작성자는 같은 조직 구성원(전화번호 있는 59명 중 하나)
+INSERT INTO erp_cases (id, title, status, case_number, jurisdiction, author_id, firm_id)
+SELECT
+    i
+    , '사건' || i
+    , CASE WHEN i % 20 < 3 THEN '종결' WHEN i % 20 = 3 THEN '보류' ELSE '진행중' END
+    , CASE WHEN i % 33 = 0 THEN NULL ELSE (2018 + i % 7) || '가단' || (100000 + i) END
+    , (ARRAY[
+        '서울중앙지방법원', '수원지방법원', '인천지방법원',
+        '서울동부지방법원', '대전지방법원', '부산지방법원'
+    ])[1 + i % 6]
+    , (1 + i % 200) + 200 * (i % 59)
+    , 1 + i % 200
+FROM generate_series(1, 20000) AS i;
+
+INSERT INTO erp_clients (id, name, client_type, contact_number_1, registering_firm_id)
+SELECT c.id, '의뢰인' || c.id, '개인', '010' || lpad((c.id + 50000000)::text, 8, '0'), c.firm_id
+FROM erp_cases c;
+
+-- 사건마다 의뢰인 1명, 5건 중 1건은 상대방 당사자도 등록
+INSERT INTO erp_case_clients (case_id, client_id, is_opponent, litigant_role)
+SELECT c.id, c.id, 0, CASE WHEN c.id % 2 = 0 THEN '원고' ELSE '피고' END
+FROM erp_cases c;
+
+INSERT INTO erp_case_clients (case_id, client_id, is_opponent, litigant_role)
+SELECT c.id, (c.id * 7) % 20000 + 1, 1, CASE WHEN c.id % 2 = 0 THEN '피고' ELSE '원고' END
+FROM erp_cases c
+WHERE c.id % 5 = 0;
+
+-- 법원 사건 이력(마지막 이력이 최신), 사건마다 ERP 에서 직접 입력한 이력 1건
+INSERT INTO erp_case_histories (case_id, event_type, event_type2, details, created_at, result)
+SELECT
+    c.id
+    , '법원사건정보'
+    , '기타'
+    , CASE
+        WHEN k = s.n AND c.id % 10 = 0 THEN '판결확정'
+        ELSE (ARRAY['변론기일 지정', '답변서 제출', '준비서면 제출', '변론기일 변경', '조정회부'])[1 + k % 5]
+    END
+    , now() - make_interval(days => (s.n - k) * 7 + CASE WHEN c.id % 10 = 0 THEN 90 ELSE 1 END)
+    , CASE WHEN k % 4 = 0 THEN '도달' END
+FROM erp_cases c
+CROSS JOIN LATERAL (
+    SELECT CASE WHEN c.id % 1000 = 0 THEN 300 ELSE 5 + (c.id % 21)::int END AS n
+) s
+CROSS JOIN LATERAL generate_series(1, s.n) AS k;
+
+INSERT INTO erp_case_histories (case_id, event_type, event_type2, details, created_at)
+SELECT c.id, '사건', '상담진행', '상담 내용 입력', now() - make_interval(days => 400)
+FROM erp_cases c;
+
+-- 기일(대부분 지난 기일). 10건 중 1건은 ERP 에서 직접 입력한 기일
+INSERT INTO erp_case_trial_info (
+    case_id, trial_date, trial_agency, trial_agency_address_detail, trial_result, trial_type, source
+)
+SELECT
+    c.id
+    , date_trunc('day', now())
+        + make_interval(
+            days => (k - s.m) * 35 + CASE WHEN c.id % 20 = 0 THEN 14 ELSE -10 END,
+            hours => 10 + k % 6
+        )
+    , c.jurisdiction
+    , '제' || (400 + k % 30) || '호 법정'
+    , CASE WHEN k < s.m THEN '속행' END
+    , (ARRAY['변론기일', '변론준비기일', '조정기일', '선고기일'])[1 + k % 4]
+    , CASE WHEN k % 10 = 0 THEN '사건' ELSE '법원사건정보' END
+FROM erp_cases c
+CROSS JOIN LATERAL (
+    SELECT CASE WHEN c.id % 1000 = 500 THEN 100 ELSE 1 + (c.id % 7)::int END AS m
+) s
+CROSS JOIN LATERAL generate_series(1, s.m) AS k;
+
+SELECT setval(pg_get_serial_sequence('users', 'id'), (SELECT MAX(id) FROM users));
+SELECT setval(pg_get_serial_sequence('erp_cases', 'id'), (SELECT MAX(id) FROM erp_cases));
+SELECT setval(pg_get_serial_sequence('erp_clients', 'id'), (SELECT MAX(id) FROM erp_clients));
+
+-- 스케줄러 테이블과 인덱스(008 은 CONCURRENTLY 라 트랜잭션 밖에서 실행됩니다)
+\ir ../migrations/001_create_erp_scheduler_runs.sql
+\ir ../migrations/002_add_erp_scheduler_runs_profile.sql
+\ir ../migrations/003_erp_cases_notify_trigger.sql
+\ir ../migrations/004_create_erp_supremecourt_parse_failures.sql
+\ir ../migrations/005_add_erp_scheduler_runs_firms.sql
+\ir ../migrations/006_add_erp_scheduler_runs_checkpoint.sql
+\ir ../migrations/007_create_erp_supremecourt_case_snapshots.sql
+\ir ../migrations/008_create_scheduler_covering_indexes.sql
+
+-- 한 번 이상 조회한 사건의 요약, 영구 실패 사건(재조회 시각이 남은 사건은 일부)
+INSERT INTO erp_supremecourt_case_snapshots (
+    case_id, history_count, history_digest, trial_count, trial_digest
+)
+SELECT c.id, 10, decode(md5('h' || c.id), 'hex'), 3, decode(md5('t' || c.id), 'hex')
+FROM erp_cases c;
+
+INSERT INTO erp_supremecourt_parse_failures (
+    case_id, fingerprint, failure_code, message, failure_count, next_attempt_at
+)
+SELECT
+    c.id
+    , md5(c.id::text)
+    , 'CASE_NOT_FOUND'
+    , '사건을 찾을 수 없습니다'
+    , 1 + c.id % 5
+    , now() + make_interval(days => CASE WHEN c.id % 100 = 7 THEN 3 ELSE -3 END)
+FROM erp_cases c
+WHERE c.id % 10 = 7;
+
+ANALYZE;
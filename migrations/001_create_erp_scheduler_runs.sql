@@ -0,0 +1,32 @@
+-- 스케줄러 실행(run) 단위 통계
+-- _runner 시작 시 status = 'running' 으로 생성하고, 종료 시 결과/통계를 갱신합니다.
+
+CREATE TABLE IF NOT EXISTS erp_scheduler_runs (
+    id BIGSERIAL PRIMARY KEY,
+    trigger VARCHAR(32) NOT NULL DEFAULT 'cron',
+    status VARCHAR(16) NOT NULL DEFAULT 'running',
+    started_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+    finished_at TIMESTAMPTZ,
+    duration_seconds DOUBLE PRECISION,
+
+    -- 사건 처리 결과별 건수
+    cases_total INTEGER NOT NULL DEFAULT 0,
+    cases_success INTEGER NOT NULL DEFAULT 0,
+    cases_failed INTEGER NOT NULL DEFAULT 0,
+    cases_skipped INTEGER NOT NULL DEFAULT 0,
+    cases_changed INTEGER NOT NULL DEFAULT 0,
+    new_history INTEGER NOT NULL DEFAULT 0,
+    new_trial INTEGER NOT NULL DEFAULT 0,
+
+    -- 분당 처리 사건 수(스킵 제외)
+    throughput_per_min DOUBLE PRECISION,
+
+    -- {"captcha_fetch": 1234.5, ...} 단계별 누적 소요 시간(초)
+    stage_seconds JSONB,
+    -- {"captcha_fetch": 3, ...} 실패 단계별 건수
+    failures JSONB,
+    error TEXT
+);
+
+CREATE INDEX IF NOT EXISTS ix_erp_scheduler_runs_started_at
+    ON erp_scheduler_runs (started_at DESC);
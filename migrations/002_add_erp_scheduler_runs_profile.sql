@@ -0,0 +1,2 @@
+-- 프로파일링 모드로 실행한 경우 상위 N개 함수와 이벤트 루프 지연 요약
+ALTER TABLE erp_scheduler_runs ADD COLUMN IF NOT EXISTS profile JSONB;
@@ -0,0 +1,30 @@
+-- 사건 생성/사건번호·관할법원 변경 시 스케줄러에 알림(LISTEN/NOTIFY)
+-- 스케줄러는 scourt_case_changed 채널을 구독하고 있다가 해당 사건을 바로 조회합니다.
+-- payload 는 사건 ID 입니다.
+
+CREATE OR REPLACE FUNCTION notify_scourt_case_changed() RETURNS trigger AS $$
+BEGIN
+    IF NEW.case_number IS NOT NULL
+        AND NEW.jurisdiction IS NOT NULL
+        AND NEW.status IS DISTINCT FROM '종결' THEN
+        PERFORM pg_notify('scourt_case_changed', NEW.id::text);
+    END IF;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_erp_cases_scourt_insert ON erp_cases;
+CREATE TRIGGER trg_erp_cases_scourt_insert
+    AFTER INSERT ON erp_cases
+    FOR EACH ROW
+    EXECUTE FUNCTION notify_scourt_case_changed();
+
+DROP TRIGGER IF EXISTS trg_erp_cases_scourt_update ON erp_cases;
+CREATE TRIGGER trg_erp_cases_scourt_update
+    AFTER UPDATE OF case_number, jurisdiction ON erp_cases
+    FOR EACH ROW
+    WHEN (
+        OLD.case_number IS DISTINCT FROM NEW.case_number
+        OR OLD.jurisdiction IS DISTINCT FROM NEW.jurisdiction
+    )
+    EXECUTE FUNCTION notify_scourt_case_changed();
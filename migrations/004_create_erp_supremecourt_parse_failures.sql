@@ -0,0 +1,17 @@
+-- 조회해도 계속 같은 이유로 실패하는 사건(사건 없음, 당사자명 불일치 등) 기록
+-- 스케줄러는 next_attempt_at 이 지나기 전까지 이 사건을 캡차 조회 없이 건너뜁니다.
+-- 사건번호/관할법원/의뢰인이 바뀌면(fingerprint 가 달라지면) 바로 다시 조회합니다.
+
+CREATE TABLE IF NOT EXISTS erp_supremecourt_parse_failures (
+    case_id INTEGER PRIMARY KEY,
+    fingerprint VARCHAR(64) NOT NULL,
+    failure_code VARCHAR(100) NOT NULL,
+    message TEXT,
+    failure_count INTEGER NOT NULL DEFAULT 1,
+    first_failed_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+    last_failed_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+    next_attempt_at TIMESTAMPTZ NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_erp_supremecourt_parse_failures_next_attempt_at
+    ON erp_supremecourt_parse_failures (next_attempt_at);
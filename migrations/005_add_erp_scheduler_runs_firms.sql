@@ -0,0 +1,2 @@
+-- 조직(firm_id)별 처리 건수와 최대 대기 시간
+ALTER TABLE erp_scheduler_runs ADD COLUMN IF NOT EXISTS firms JSONB;
@@ -0,0 +1,4 @@
+-- 종료(배포 재시작 등)로 중단된 실행에서 아직 조회하지 않은 사건
+-- {"remaining_case_ids": [1, 2, ...]}
+-- 다음 시작 시 이어서 조회하고 NULL 로 비웁니다.
+ALTER TABLE erp_scheduler_runs ADD COLUMN IF NOT EXISTS checkpoint JSONB;
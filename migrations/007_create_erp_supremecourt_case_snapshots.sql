@@ -0,0 +1,14 @@
+-- 사건별로 마지막으로 반영한 대법원 사건 정보(사건 이력/변론기일) 요약
+-- *_count: 마지막으로 반영한 파싱 결과 행 수, *_digest: 그 행들을 순서대로 이어 붙인 해시(blake2b 16바이트)
+-- 새로 받아온 결과의 앞부분이 요약과 같으면 뒤에 붙은 행만 새 행으로 보고
+-- erp_case_histories / erp_case_trial_info 를 다시 읽지 않습니다.
+-- 행을 지우면 다음 조회에서 전체 비교로 다시 만듭니다.
+
+CREATE TABLE IF NOT EXISTS erp_supremecourt_case_snapshots (
+    case_id INTEGER PRIMARY KEY,
+    history_count INTEGER,
+    history_digest BYTEA,
+    trial_count INTEGER,
+    trial_digest BYTEA,
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT now()
+);
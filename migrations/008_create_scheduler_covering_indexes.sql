@@ -0,0 +1,32 @@
+-- 스케줄러가 사건마다 실행하는 조회(MyCaseService)용 인덱스
+-- 운영 DB 에 잠금 없이 만들도록 CONCURRENTLY 로 만듭니다.(트랜잭션 밖에서 실행: psql -f 기본 동작)
+-- 적용 후 python -m benchmarks.explain_queries 로 실행 계획을 확인합니다.
+
+-- 사건별 법원 사건 이력(get_supremCourt_history_records_by_case_id, 휴면 사건 분류)
+-- WHERE case_id, event_type ORDER BY created_at, id 를 인덱스 순서로 읽고 details/result 는 인덱스에서 바로 읽습니다.
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_erp_case_histories_case_event_created
+    ON erp_case_histories (case_id, event_type, created_at, id)
+    INCLUDE (details, result);
+
+-- 사건별 법원 기일(get_trial_info_records_by_case_id)
+-- WHERE case_id, source ORDER BY trial_date, id
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_erp_case_trial_info_case_source_date
+    ON erp_case_trial_info (case_id, source, trial_date, id)
+    INCLUDE (trial_type, trial_agency_address_detail, trial_result);
+
+-- 다가오는 기일(get_next_trial_dates): WHERE source, trial_date >= now() GROUP BY case_id
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_erp_case_trial_info_source_date
+    ON erp_case_trial_info (source, trial_date)
+    INCLUDE (case_id);
+
+-- 사건 의뢰인(get_case_list_for_scheduler 의 client_name, get_clients_by_case_id)
+-- WHERE case_id 후 역할/등록 순 정렬은 사건당 몇 건이라 인덱스에서 읽은 뒤 정렬합니다.
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_erp_case_clients_case_id
+    ON erp_case_clients (case_id, id)
+    INCLUDE (client_id, litigant_role);
+
+-- 알림 대상 조직 구성원(get_related_users): WHERE phone IS NOT NULL AND (id = ? OR firm_id = ?)
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_users_firm_id_with_phone
+    ON users (firm_id)
+    INCLUDE (phone)
+    WHERE phone IS NOT NULL;
@@ -0,0 +1,10 @@
+import os
+
+# app.core.config 의 필수 설정(알림톡). 테스트에서는 알림톡을 보내지 않으므로 아무 값이나 넣습니다.
+for key in (
+    "KAKAO_NOTI_API_URL",
+    "KAKAO_NOTI_SECRET_KEY",
+    "KAKAO_NOTI_APP_KEY",
+    "KAKAO_NOTI_SENDER_KEY",
+):
+    os.environ.setdefault(key, "test")
@@ -0,0 +1,97 @@
+from app.backfill import BackfillLoader, BackfillStats, ParsedPage
+from app.service.parser import HistoryRow, RowUpdatePlan, TrialInfoRow
+from app.service.row_diff import DIFF_UPDATE, RowChange
+from app.service.snapshot import CaseSnapshot
+
+HISTORY = [
+    HistoryRow("2024.01.02", "소장접수"),
+    HistoryRow("2024.02.03", "변론기일", "속행"),
+]
+TRIAL_INFO = [TrialInfoRow("2024.02.03", "10:00", "변론기일", "제1호 법정", "속행")]
+
+
+class FakeRepo:
+    def __init__(self):
+        self.updates = []
+
+    async def update_case_history_result_from_supremCourt_history(self, **values):
+        self.updates.append(values)
+
+    async def update_trial_info_from_supremCourt_history(self, **values):
+        self.updates.append(values)
+
+
+class FakeSnapshots:
+    def __init__(self, snapshot: CaseSnapshot):
+        self.snapshot = snapshot
+        self.saved = []
+
+    async def get_snapshot(self, case_id):
+        return self.snapshot
+
+    async def save_history(self, case_id, rows):
+        self.saved.append(("history", len(rows)))
+
+    async def save_trial_info(self, case_id, rows):
+        self.saved.append(("trial", len(rows)))
+
+
+def make_loader(snapshot: CaseSnapshot, history_plan, trial_plan):
+    stats = BackfillStats()
+    loader = BackfillLoader(None, stats)
+    loader.repo = FakeRepo()
+    loader.snapshots = FakeSnapshots(snapshot)
+
+    async def plan_history_update(case_id, rows, snapshot):
+        return history_plan
+
+    async def plan_trial_info_update(case_id, rows, snapshot):
+        return trial_plan
+
+    loader.parser.plan_history_update = plan_history_update
+    loader.parser.plan_trial_info_update = plan_trial_info_update
+    return loader, stats
+
+
+def page() -> ParsedPage:
+    return ParsedPage("1.html", 1, HISTORY, TRIAL_INFO, "서울중앙지방법원")
+
+
+async def test_old_page_does_not_revert_results_or_snapshot():
+    # 스냅샷이 있는 사건에 앞부분이 다른(오래된) 페이지: 없는 행만 넣고 결과/스냅샷은 그대로
+    changed = RowChange(DIFF_UPDATE, HISTORY[1]._replace(result=None), 10, HISTORY[1])
+    history_plan = RowUpdatePlan([HISTORY[0]], [changed], snapshot_matched=False)
+    trial_plan = RowUpdatePlan([], [], snapshot_matched=False)
+    snapshot = CaseSnapshot(1, history_count=5, history_digest=b"h", trial_count=2, trial_digest=b"t")
+    loader, stats = make_loader(snapshot, history_plan, trial_plan)
+
+    await loader._plan_case(page(), "서울중앙지방법원")
+
+    assert loader.repo.updates == []
+    assert loader.snapshots.saved == []
+    assert len(loader._history) == 1
+    assert stats.stale == 1
+
+
+async def test_snapshot_saved_when_case_has_none():
+    history_plan = RowUpdatePlan(list(HISTORY), [], snapshot_matched=False)
+    trial_plan = RowUpdatePlan(list(TRIAL_INFO), [], snapshot_matched=False)
+    loader, _ = make_loader(CaseSnapshot(1), history_plan, trial_plan)
+
+    await loader._plan_case(page(), "서울중앙지방법원")
+
+    assert loader.snapshots.saved == [("history", 2), ("trial", 1)]
+    assert len(loader._history) == 2
+    assert len(loader._trial_info) == 1
+
+
+async def test_snapshot_saved_when_page_extends_it():
+    # 스냅샷 뒤로 이어지는 페이지는 스냅샷을 늘려야 다음 정기 조회가 같은 행을 다시 넣지 않습니다.
+    history_plan = RowUpdatePlan([HISTORY[1]], [], snapshot_matched=True)
+    trial_plan = RowUpdatePlan([], [], snapshot_matched=True)
+    snapshot = CaseSnapshot(1, history_count=1, history_digest=b"h", trial_count=1, trial_digest=b"t")
+    loader, _ = make_loader(snapshot, history_plan, trial_plan)
+
+    await loader._plan_case(page(), "서울중앙지방법원")
+
+    assert loader.snapshots.saved == [("history", 2)]
@@ -0,0 +1,71 @@
+import pytest
+
+from app.core.court import CourtIndex, court_key, parse_court_aliases
+
+
+@pytest.fixture
+def index() -> CourtIndex:
+    return CourtIndex()
+
+
+def test_spacing_and_punctuation(index):
+    assert index.lookup(" 서울중앙지방법원 ") == "서울중앙지방법원"
+    assert index.lookup("서울 중앙 지방법원") == "서울중앙지방법원"
+    assert index.lookup("수원지방법원(성남지원)") == "수원지방법원 성남지원"
+
+
+def test_short_forms(index):
+    assert index.lookup("서울중앙지법") == "서울중앙지방법원"
+    assert index.lookup("서울고법") == "서울고등법원"
+    assert index.lookup("서울가정법") == "서울가정법원"
+    assert index.lookup("서울행법") == "서울행정법원"
+    assert index.lookup("수원지법 성남지원") == "수원지방법원 성남지원"
+    assert index.lookup("대전지법 본원") == "대전지방법원"
+
+
+def test_short_form_is_not_expanded_twice():
+    assert court_key("서울중앙지방법원") == court_key("서울중앙지법")
+    assert court_key("서울중앙지방법원") == "서울중앙지방법원"
+
+
+def test_branch_only(index):
+    # 한 법원에만 있는 지원은 지원 이름만으로 찾습니다.
+    assert index.lookup("고양지원") == "의정부지방법원 고양지원"
+    # 지방법원/가정법원 등 두 법원 이상에 있는 지원은 찾지 않습니다.
+    assert index.lookup("성남지원") is None
+    assert index.lookup("서부지원") is None
+
+
+def test_unknown_and_empty(index):
+    assert index.lookup("없는법원") is None
+    assert index.lookup("") is None
+    assert index.lookup(None) is None
+
+
+def test_builtin_aliases(index):
+    assert index.lookup("서울지방법원") == "서울중앙지방법원"
+    assert index.lookup("중앙지법") == "서울중앙지방법원"
+
+
+def test_configured_aliases():
+    index = CourtIndex(
+        aliases=parse_court_aliases("중앙법원:서울중앙지법, 신설법원:신설지방법원")
+    )
+    # 목록에 있는 법원은 목록의 이름으로, 없는 법원은 새 법원으로 추가합니다.
+    assert index.lookup("중앙법원") == "서울중앙지방법원"
+    assert index.lookup("신설법원") == "신설지방법원"
+    assert index.lookup("신설지법") == "신설지방법원"
+    assert "신설지방법원" in index.courts
+    # 설정한 별칭이 기본 법원 목록을 바꾸지 않습니다.
+    assert "신설지방법원" not in CourtIndex().courts
+
+
+def test_parse_court_aliases():
+    assert parse_court_aliases("") == {}
+    assert parse_court_aliases(" a:b ,, c : d ") == {"a": "b", "c": "d"}
+    with pytest.raises(ValueError):
+        parse_court_aliases("a")
+    with pytest.raises(ValueError):
+        parse_court_aliases("a:")
+    with pytest.raises(ValueError):
+        parse_court_aliases("a:b:c")
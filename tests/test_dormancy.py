@@ -0,0 +1,24 @@
+from datetime import date, timedelta
+
+from app.service.dormancy import is_poll_day
+
+
+def test_every_day_when_poll_days_is_one():
+    assert all(is_poll_day(case_id, date(2024, 1, 1), 1) for case_id in range(10))
+    assert is_poll_day(3, date(2024, 1, 1), 0)
+
+
+def test_each_case_polled_once_per_period():
+    start = date(2024, 1, 1)
+    for case_id in range(20):
+        days = [
+            offset for offset in range(14) if is_poll_day(case_id, start + timedelta(days=offset), 7)
+        ]
+        assert len(days) == 2
+        assert days[1] - days[0] == 7
+
+
+def test_cases_spread_across_days():
+    today = date(2024, 1, 1)
+    due = [case_id for case_id in range(70) if is_poll_day(case_id, today, 7)]
+    assert len(due) == 10
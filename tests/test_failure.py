@@ -0,0 +1,77 @@
+import re
+
+import httpx
+from sqlalchemy import Integer
+from sqlalchemy.dialects import postgresql
+
+from app.schema.case_schema import CaseResponseForParser
+from app.service.failure import (
+    FAILURE_PERMANENT,
+    FAILURE_TRANSIENT,
+    _RECORD_FAILURE_SQL,
+    case_fingerprint,
+    classify_failure,
+)
+from app.service.parser import CaptchaServerError
+
+
+def make_case(**values) -> CaseResponseForParser:
+    fields = {
+        "case_id": 1,
+        "title": "사건",
+        "status": "진행중",
+        "case_number": "2024가단1234",
+        "jurisdiction": "서울중앙지방법원",
+        "author_id": 1,
+        "firm_id": 1,
+        "client_name": "홍길동",
+    }
+    fields.update(values)
+    return CaseResponseForParser(**fields)
+
+
+def test_permanent_code():
+    assert classify_failure(CaptchaServerError("없음", code="CASE_NOT_FOUND")) == (
+        FAILURE_PERMANENT,
+        "CASE_NOT_FOUND",
+    )
+
+
+def test_permanent_message_without_code():
+    error = CaptchaServerError("사건을 찾을 수 없습니다.")
+    assert classify_failure(error) == (FAILURE_PERMANENT, "UNKNOWN")
+
+
+def test_server_errors_are_transient():
+    assert classify_failure(CaptchaServerError("timeout", code="NETWORK")) == (
+        FAILURE_TRANSIENT,
+        "NETWORK",
+    )
+    assert classify_failure(CaptchaServerError("bad gateway", code="HTTP_502", status=502)) == (
+        FAILURE_TRANSIENT,
+        "HTTP_502",
+    )
+
+
+def test_other_exceptions_are_transient():
+    assert classify_failure(httpx.ReadTimeout("timeout")) == (FAILURE_TRANSIENT, "ReadTimeout")
+    assert classify_failure(ValueError("parse")) == (FAILURE_TRANSIENT, "ValueError")
+
+
+def test_fingerprint_uses_normalized_court():
+    assert case_fingerprint(make_case(jurisdiction="서울중앙지법")) == case_fingerprint(
+        make_case(jurisdiction="서울중앙지방법원 ")
+    )
+    assert case_fingerprint(make_case()) != case_fingerprint(make_case(client_name="김철수"))
+
+
+def test_record_failure_binds_backoff_as_integer():
+    compiled = _RECORD_FAILURE_SQL.compile(dialect=postgresql.asyncpg.dialect())
+    for name in ("backoff_days", "max_backoff_days"):
+        assert isinstance(compiled.binds[name].type, Integer)
+
+    # 모든 사용처에서 INTEGER 로 캐스팅해야 LEAST 가 text 로 추론되지 않습니다.
+    sql = str(_RECORD_FAILURE_SQL)
+    assert not re.search(r"(?<!CAST\():(max_)?backoff_days\b", sql)
+    assert sql.count("CAST(:backoff_days AS INTEGER)") == 3
+    assert sql.count("CAST(:max_backoff_days AS INTEGER)") == 3
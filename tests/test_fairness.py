@@ -0,0 +1,84 @@
+import pytest
+
+from app.schema.case_schema import CaseResponseForParser
+from app.service.fairness import FairScheduler, parse_firm_map
+
+
+def make_cases(firm_ids):
+    return [
+        CaseResponseForParser(
+            case_id=index,
+            title="사건",
+            status="진행중",
+            case_number=f"2024가단{index}",
+            jurisdiction="서울중앙지방법원",
+            author_id=1,
+            firm_id=firm_id,
+        )
+        for index, firm_id in enumerate(firm_ids, start=1)
+    ]
+
+
+def ids(cases):
+    return [case.case_id for case in cases]
+
+
+# 조직 1: 사건 1~3, 조직 2: 사건 4~5
+CASES = make_cases([1, 1, 1, 2, 2])
+
+
+def test_parse_firm_map():
+    assert parse_firm_map("1:3, 14:0.5,none:2,", float) == {1: 3.0, 14: 0.5, None: 2.0}
+    assert parse_firm_map("", int) == {}
+    with pytest.raises(ValueError):
+        parse_firm_map("1=3", int)
+    with pytest.raises(ValueError):
+        parse_firm_map("a:3", int)
+
+
+def test_equal_weights_interleave_firms():
+    ordered, deferred = FairScheduler({}, {}, {}).order(CASES)
+
+    assert ids(ordered) == [1, 4, 2, 5, 3]
+    assert deferred == []
+
+
+def test_weight_gives_firm_more_turns():
+    ordered, _ = FairScheduler({1: 2.0}, {}, {}).order(CASES)
+
+    assert ids(ordered) == [1, 2, 4, 3, 5]
+
+
+def test_non_positive_weight_falls_back_to_default():
+    ordered, _ = FairScheduler({1: 0}, {}, {}).order(CASES)
+
+    assert ids(ordered) == [1, 4, 2, 5, 3]
+
+
+def test_lower_tier_runs_first():
+    ordered, _ = FairScheduler({}, {2: 0}, {}).order(CASES)
+
+    assert ids(ordered) == [4, 5, 1, 2, 3]
+
+
+def test_quota_defers_rest_of_firm():
+    ordered, deferred = FairScheduler({}, {}, {1: 2}).order(CASES)
+
+    assert ids(ordered) == [1, 4, 2, 5]
+    assert ids(deferred) == [3]
+
+
+def test_rotation_moves_deferred_window():
+    ordered, deferred = FairScheduler({}, {}, {1: 2}).order(CASES, rotation=1)
+
+    assert ids(ordered) == [3, 4, 1, 5]
+    assert ids(deferred) == [2]
+
+
+def test_default_quota_and_unlimited_override():
+    scheduler = FairScheduler({}, {}, {2: 0}, default_quota=1)
+
+    ordered, deferred = scheduler.order(CASES)
+
+    assert ids(ordered) == [1, 4, 5]
+    assert ids(deferred) == [2, 3]
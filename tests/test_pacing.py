@@ -0,0 +1,69 @@
+import asyncio
+import time
+from datetime import datetime, timedelta
+from datetime import time as dtime
+
+import pytest
+
+from app.service.pacing import DispatchPacer, parse_run_windows, window_deadline
+
+
+def test_parse_run_windows():
+    assert parse_run_windows("07:00-09:30, 23:00-01:00,") == [
+        (dtime(7, 0), dtime(9, 30)),
+        (dtime(23, 0), dtime(1, 0)),
+    ]
+    assert parse_run_windows("") == []
+    with pytest.raises(ValueError):
+        parse_run_windows("07:00~09:30")
+
+
+def test_window_deadline_same_day_and_overnight():
+    started_at = datetime(2024, 1, 1, 7, 0, 30)
+
+    assert window_deadline(started_at, dtime(9, 30)) == datetime(2024, 1, 1, 9, 30)
+    # 종료가 시작보다 이르면 다음 날 종료입니다.
+    assert window_deadline(started_at, dtime(1, 0)) == datetime(2024, 1, 2, 1, 0)
+    assert window_deadline(started_at, dtime(7, 0)) == datetime(2024, 1, 2, 7, 0)
+
+
+def test_interval_spreads_remaining_time():
+    pacer = DispatchPacer(datetime.now() + timedelta(seconds=100))
+
+    pacer.dispatched(remaining=4)
+
+    assert pacer._next_at - time.monotonic() == pytest.approx(25, abs=1)
+
+
+async def test_wait_before_first_dispatch_returns_immediately():
+    pacer = DispatchPacer(datetime.now() + timedelta(seconds=100))
+
+    await asyncio.wait_for(pacer.wait(), timeout=0.1)
+
+
+async def test_past_deadline_does_not_wait():
+    pacer = DispatchPacer(datetime.now() - timedelta(seconds=10))
+
+    pacer.dispatched(remaining=3)
+
+    await asyncio.wait_for(pacer.wait(), timeout=0.1)
+
+
+async def test_wait_sleeps_until_next_turn():
+    pacer = DispatchPacer(datetime.now() + timedelta(seconds=0.4))
+
+    pacer.dispatched(remaining=2)
+    started = time.monotonic()
+    await pacer.wait()
+
+    assert time.monotonic() - started == pytest.approx(0.2, abs=0.1)
+
+
+async def test_stop_event_ends_wait():
+    pacer = DispatchPacer(datetime.now() + timedelta(seconds=100))
+    stop = asyncio.Event()
+
+    pacer.dispatched(remaining=1)
+    asyncio.get_running_loop().call_later(0.05, stop.set)
+
+    await asyncio.wait_for(pacer.wait(stop), timeout=1)
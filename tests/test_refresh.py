@@ -0,0 +1,109 @@
+import asyncio
+
+from app.schema.case_schema import CaseResponseForParser
+from app.service.refresh import (
+    SOURCE_CACHE,
+    SOURCE_FRESH,
+    SOURCE_JOINED,
+    CaseProcessResult,
+    CaseRefresher,
+    refresh_key,
+)
+
+
+def make_case(**values) -> CaseResponseForParser:
+    fields = {
+        "case_id": 1,
+        "title": "사건",
+        "status": "진행중",
+        "case_number": "2024가단1234",
+        "jurisdiction": "서울중앙지방법원",
+        "author_id": 1,
+        "firm_id": 1,
+        "client_name": "홍길동",
+    }
+    fields.update(values)
+    return CaseResponseForParser(**fields)
+
+
+def test_refresh_key_uses_normalized_court():
+    assert refresh_key(make_case(jurisdiction="서울중앙지법 ")) == refresh_key(make_case())
+    assert refresh_key(make_case(jurisdiction="수원지방법원")) != refresh_key(make_case())
+    assert refresh_key(make_case(case_number="2024가단9999")) != refresh_key(make_case())
+    assert refresh_key(make_case(title="제목만 수정")) == refresh_key(make_case())
+
+
+async def test_same_key_joins_running_job():
+    refresher = CaseRefresher(ttl_seconds=60)
+    started = asyncio.Event()
+    release = asyncio.Event()
+    calls = []
+
+    async def job():
+        calls.append(1)
+        started.set()
+        await release.wait()
+        return CaseProcessResult(1, "success")
+
+    key = refresh_key(make_case())
+    first = asyncio.create_task(refresher.run(key, job))
+    await started.wait()
+    second = asyncio.create_task(refresher.run(key, job))
+    await asyncio.sleep(0)
+    release.set()
+
+    assert (await first)[1] == SOURCE_FRESH
+    assert (await second)[1] == SOURCE_JOINED
+    assert len(calls) == 1
+    assert not refresher.is_running(key)
+
+
+async def test_changed_case_does_not_join_or_use_cache():
+    refresher = CaseRefresher(ttl_seconds=60)
+    before = refresh_key(make_case())
+    after = refresh_key(make_case(jurisdiction="수원지방법원"))
+    release = asyncio.Event()
+
+    async def slow_job():
+        await release.wait()
+        return CaseProcessResult(1, "success")
+
+    async def job():
+        return CaseProcessResult(1, "success", message="after")
+
+    running = asyncio.create_task(refresher.run(before, slow_job))
+    await asyncio.sleep(0)
+    assert refresher.is_running(before)
+
+    result, source = await refresher.run(after, job)
+    assert source == SOURCE_FRESH
+    assert result.message == "after"
+    release.set()
+    await running
+
+    refresher.cache(before, CaseProcessResult(1, "success", message="before"))
+    result, source = await refresher.run(after, job)
+    assert source == SOURCE_FRESH
+    assert result.message == "after"
+
+
+async def test_cache_only_after_cache_call():
+    refresher = CaseRefresher(ttl_seconds=60)
+    key = refresh_key(make_case())
+
+    async def job():
+        return CaseProcessResult(1, "success")
+
+    # 결과는 쓰기가 커밋된 뒤에 cache() 로만 캐시합니다.
+    assert (await refresher.run(key, job))[1] == SOURCE_FRESH
+    assert refresher.get_cached(key) is None
+
+    cached = CaseProcessResult(1, "success")
+    refresher.cache(key, cached)
+    assert await refresher.run(key, job) == (cached, SOURCE_CACHE)
+    assert (await refresher.run(key, job, use_cache=False))[1] == SOURCE_FRESH
+
+    expired = CaseRefresher(ttl_seconds=0)
+    expired.cache(key, cached)
+    await asyncio.sleep(0.01)
+    assert expired.get_cached(key) is None
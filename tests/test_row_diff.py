@@ -0,0 +1,99 @@
+from app.service.row_diff import (
+    DIFF_INSERT,
+    DIFF_UNCHANGED,
+    DIFF_UPDATE,
+    RowChange,
+    diff_rows,
+)
+
+
+def test_new_identity_is_insert():
+    changes = diff_rows(
+        [("2024.01.02", "변론기일", "")],
+        [(1, "2024.01.01", "소장접수", "")],
+        identity_size=2,
+    )
+
+    assert changes == [RowChange(DIFF_INSERT, ("2024.01.02", "변론기일", ""))]
+
+
+def test_duplicate_identities_pair_in_order():
+    existing = [
+        (1, "2024.01.01", "변론기일", "속행"),
+        (2, "2024.01.01", "변론기일", ""),
+    ]
+    parsed = [
+        ("2024.01.01", "변론기일", "속행"),
+        ("2024.01.01", "변론기일", "종결"),
+    ]
+
+    changes = diff_rows(parsed, existing, identity_size=2)
+
+    assert changes == [
+        RowChange(DIFF_UNCHANGED, parsed[0], 1),
+        RowChange(DIFF_UPDATE, parsed[1], 2, ("2024.01.01", "변론기일", "")),
+    ]
+
+
+def test_uneven_counts_update_then_insert():
+    existing = [(1, "2024.01.01", "변론기일", "")]
+    parsed = [
+        ("2024.01.01", "변론기일", "속행"),
+        ("2024.01.01", "변론기일", ""),
+    ]
+
+    changes = diff_rows(parsed, existing, identity_size=2)
+
+    # 값이 같은 행(두 번째)을 먼저 짝짓고 남은 행은 새 행입니다.
+    assert changes == [
+        RowChange(DIFF_INSERT, parsed[0]),
+        RowChange(DIFF_UNCHANGED, parsed[1], 1),
+    ]
+
+
+def test_uneven_counts_match_equal_values_first():
+    existing = [
+        (1, "2024.01.01", "변론기일", ""),
+        (2, "2024.01.01", "변론기일", "속행"),
+    ]
+    parsed = [
+        ("2024.01.01", "변론기일", "종결"),
+        ("2024.01.01", "변론기일", "속행"),
+        ("2024.01.01", "변론기일", "선고"),
+    ]
+
+    changes = diff_rows(parsed, existing, identity_size=2)
+
+    assert changes == [
+        RowChange(DIFF_UPDATE, parsed[0], 1, ("2024.01.01", "변론기일", "")),
+        RowChange(DIFF_UNCHANGED, parsed[1], 2),
+        RowChange(DIFF_INSERT, parsed[2]),
+    ]
+
+
+def test_equal_values_pair_oldest_first():
+    existing = [
+        (1, "2024.01.01", "송달", "도달"),
+        (2, "2024.01.01", "송달", "도달"),
+    ]
+    parsed = [("2024.01.01", "송달", "도달")] * 3
+
+    changes = diff_rows(parsed, existing, identity_size=2)
+
+    assert [(change.op, change.existing_id) for change in changes] == [
+        (DIFF_UNCHANGED, 1),
+        (DIFF_UNCHANGED, 2),
+        (DIFF_INSERT, None),
+    ]
+
+
+def test_fewer_parsed_rows_leave_existing_untouched():
+    existing = [
+        (1, "2024.01.01", "변론기일", "속행"),
+        (2, "2024.01.01", "변론기일", ""),
+    ]
+    parsed = [("2024.01.01", "변론기일", "")]
+
+    changes = diff_rows(parsed, existing, identity_size=2)
+
+    assert changes == [RowChange(DIFF_UNCHANGED, parsed[0], 2)]
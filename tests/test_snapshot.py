@@ -0,0 +1,42 @@
+from app.service.snapshot import SNAPSHOT_HISTORY, new_rows_since_snapshot, rows_digest
+
+ROWS = [
+    ("2024.01.01", "소장접수", ""),
+    ("2024.01.05", "답변서 제출", ""),
+]
+
+
+def test_rows_digest_depends_on_order_and_fields():
+    assert rows_digest(ROWS) == rows_digest(list(ROWS))
+    assert rows_digest(ROWS) != rows_digest(list(reversed(ROWS)))
+    # 필드 경계가 달라지면 해시도 달라집니다.
+    assert rows_digest([("ab", "c")]) != rows_digest([("a", "bc")])
+    assert rows_digest([("a", None)]) == rows_digest([("a", "")])
+
+
+def test_without_snapshot_needs_full_compare():
+    assert new_rows_since_snapshot(SNAPSHOT_HISTORY, ROWS, None, None) is None
+
+
+def test_returns_rows_appended_after_snapshot():
+    parsed = ROWS + [("2024.02.01", "변론기일", "")]
+
+    new_rows = new_rows_since_snapshot(
+        SNAPSHOT_HISTORY, parsed, len(ROWS), rows_digest(ROWS)
+    )
+
+    assert new_rows == [("2024.02.01", "변론기일", "")]
+
+
+def test_unchanged_rows_have_no_new_rows():
+    assert new_rows_since_snapshot(SNAPSHOT_HISTORY, ROWS, len(ROWS), rows_digest(ROWS)) == []
+
+
+def test_changed_prefix_needs_full_compare():
+    parsed = [("2024.01.01", "소장접수", "완료")] + ROWS[1:]
+
+    assert new_rows_since_snapshot(SNAPSHOT_HISTORY, parsed, len(ROWS), rows_digest(ROWS)) is None
+
+
+def test_shorter_result_needs_full_compare():
+    assert new_rows_since_snapshot(SNAPSHOT_HISTORY, ROWS[:1], len(ROWS), rows_digest(ROWS)) is None
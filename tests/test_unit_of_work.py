@@ -0,0 +1,55 @@
+from app.service.unit_of_work import CaseUnitOfWork
+
+
+class FakeSession:
+    def __init__(self, fail_commit: bool = False):
+        self.fail_commit = fail_commit
+        self.commits = 0
+        self.rollbacks = 0
+
+    async def commit(self):
+        if self.fail_commit:
+            raise Exception("commit failed")
+        self.commits += 1
+
+    async def rollback(self):
+        self.rollbacks += 1
+
+
+async def test_end_case_runs_after_commit_on_success():
+    session = FakeSession()
+    calls = []
+
+    async def after_commit():
+        calls.append("after_commit")
+
+    async def on_rollback(error):
+        calls.append("on_rollback")
+
+    await CaseUnitOfWork(session).end_case(after_commit=after_commit, on_rollback=on_rollback)
+
+    assert session.commits == 1
+    assert calls == ["after_commit"]
+
+
+async def test_end_case_rolls_back_and_skips_after_commit_on_failure():
+    session = FakeSession(fail_commit=True)
+    calls = []
+
+    async def after_commit():
+        calls.append("after_commit")
+
+    async def on_rollback(error):
+        calls.append(str(error))
+
+    await CaseUnitOfWork(session).end_case(after_commit=after_commit, on_rollback=on_rollback)
+
+    assert session.rollbacks == 1
+    assert calls == ["commit failed"]
+
+
+async def test_callback_error_does_not_propagate():
+    async def after_commit():
+        raise Exception("notify failed")
+
+    await CaseUnitOfWork(FakeSession()).end_case(after_commit=after_commit)